@@ -0,0 +1,3 @@
+"""
+Offline benchmark suite (python -m benchmarks), see __main__.py.
+"""
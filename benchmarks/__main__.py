@@ -0,0 +1,126 @@
+"""
+Benchmark Suite (offline)
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks                         # 전체 실행 + baseline 비교
+    python -m benchmarks --quick                 # 작은 입력으로 빠르게 실행
+    python -m benchmarks --only generator parser # 이름 접두어로 선택
+    python -m benchmarks --save-baseline         # 현재 결과를 baseline으로 저장
+
+Results are written as JSON (--output). When a baseline exists, medians are
+compared and the exit code is 1 if any benchmark is slower than the baseline
+by more than --threshold.
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_OUTPUT = os.path.join("benchmarks", "results.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+def load_suites():
+    # Imported for their @benchmark registrations
+    from benchmarks import bench_generator, bench_parser, bench_models, bench_planner  # noqa: F401
+
+
+def format_rate(result):
+    rate = result.get('ops_per_s')
+    return f"{rate:,.0f}/s" if rate else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite")
+    parser.add_argument("--only", nargs="+", metavar="PREFIX",
+                        help="Run benchmarks whose name starts with one of these prefixes")
+    parser.add_argument("--repeat", type=int, help="Override the timed repetitions per benchmark")
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs (smoke run)")
+    parser.add_argument("--output", type=str, default=DEFAULT_OUTPUT, help="Results JSON path")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed median slowdown vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the results to the baseline path as well")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    workdir = tempfile.mkdtemp(prefix="uvmgen_bench_")
+    # Keep caches and generated files out of the project tree
+    os.environ["UVMGEN_CACHE_DIR"] = os.path.join(workdir, "cache")
+
+    from benchmarks.harness import (BENCHMARKS, Context, run_benchmark, environment_info,
+                                    compare, load_json, save_json)
+    load_suites()
+
+    selected = [b for b in BENCHMARKS
+                if not args.only or any(b.name.startswith(p) for p in args.only)]
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return
+    if not selected:
+        print("[Error] No benchmarks selected.")
+        sys.exit(1)
+
+    ctx = Context(workdir, quick=args.quick)
+    results = {}
+    failed = []
+    try:
+        print(f"[Info] Running {len(selected)} benchmark(s)")
+        print(f"{'benchmark':<36} {'median':>10} {'min':>10} {'rate':>14}")
+        for bench in selected:
+            try:
+                res = run_benchmark(bench, ctx, repeat=args.repeat)
+            except Exception as e:
+                print(f"{bench.name:<36} [Error] {e}")
+                failed.append(bench.name)
+                continue
+            results[bench.name] = res
+            print(f"{bench.name:<36} {res['median_s'] * 1e3:>8.2f}ms {res['min_s'] * 1e3:>8.2f}ms "
+                  f"{format_rate(res):>14}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'meta': {**environment_info(), 'quick': args.quick},
+        'results': results,
+    }
+    save_json(args.output, report)
+    print(f"[Info] Results written to {args.output}")
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        baseline = load_json(args.baseline)
+        if baseline.get('meta', {}).get('quick', False) != args.quick:
+            print("[Info] Baseline was recorded with a different --quick setting; comparing anyway")
+        print(f"\n{'benchmark':<36} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+        for name, base_s, cur_s, ratio, status in compare(results, baseline, args.threshold):
+            base_txt = f"{base_s * 1e3:.2f}ms" if base_s is not None else "-"
+            ratio_txt = f"{ratio:.2f}x" if ratio is not None else "-"
+            print(f"{name:<36} {base_txt:>10} {cur_s * 1e3:>8.2f}ms {ratio_txt:>7}  {status}")
+            if status == "REGRESSION":
+                regressions.append(name)
+    else:
+        print(f"[Info] No baseline at {args.baseline} (create one with --save-baseline)")
+
+    if args.save_baseline:
+        save_json(args.baseline, report)
+        print(f"[Info] Baseline saved to {args.baseline}")
+
+    if failed:
+        print(f"[Error] {len(failed)} benchmark(s) failed: {', '.join(failed)}")
+    if regressions:
+        print(f"[Error] {len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Generator.generate() per protocol (configs planned locally from the bundled
+specs) and on a synthetic DUT with many APB interfaces.
+"""
+
+import copy
+
+from benchmarks.harness import benchmark
+from benchmarks.synth import multi_apb_dut
+from main.ai_planner import generate_local_plan
+from main.utils.generator import Generator
+
+SPECS = {'apb': "apb_spec.txt", 'ahb': "ahb_spec.txt", 'axi': "axi_spec.txt"}
+
+
+def spec_config(protocol, output_dir):
+    with open(SPECS[protocol], 'r', encoding='utf-8') as f:
+        config = generate_local_plan(f.read(), use_cache=False)
+    if config is None:
+        raise RuntimeError(f"local planner could not map {SPECS[protocol]}")
+    config = copy.deepcopy(config)
+    config['output_dir'] = output_dir
+    return config
+
+
+def many_interface_config(ctx, interfaces):
+    rtl, config_interfaces = multi_apb_dut("multi_apb", interfaces)
+    rtl_path = ctx.path("rtl", f"multi_apb_{interfaces}.v")
+    with open(rtl_path, 'w') as f:
+        f.write(rtl)
+    return {
+        'project_name': f"multi_apb_{interfaces}_tb",
+        'output_dir': ctx.path("gen", f"multi_apb_{interfaces}", ""),
+        'dut': {
+            'module_name': "multi_apb",
+            'source_files': [rtl_path],
+            'parameters': {'ADDR_WIDTH': 8, 'DATA_WIDTH': 32},
+            'dut_parameters': {},
+        },
+        'interfaces': config_interfaces,
+        'test_plan': {
+            'constraints': {
+                'addr': {'min': 0, 'max': 252, 'align': 4},
+                'data': {'type': "random"},
+                'iterations': 100,
+            },
+            'coverage': {'addr_ranges': [], 'corner_cases': []},
+        },
+    }
+
+
+def _run_generator(config, incremental=False):
+    def run():
+        if not Generator(config, incremental=incremental).generate():
+            raise RuntimeError("generation failed")
+    return run
+
+
+def _register(protocol):
+    @benchmark(f"generator.{protocol}.full")
+    def full(ctx):
+        return _run_generator(spec_config(protocol, ctx.path("gen", protocol, "")))
+
+    @benchmark(f"generator.{protocol}.incremental_noop", repeat=10)
+    def incremental(ctx):
+        # warm-up run writes everything; timed runs find every output up to date
+        return _run_generator(spec_config(protocol, ctx.path("gen_inc", protocol, "")),
+                              incremental=True)
+
+
+for _protocol in SPECS:
+    _register(_protocol)
+
+
+@benchmark("generator.apb_x16.full", ops=16)
+def many_interfaces(ctx):
+    return _run_generator(many_interface_config(ctx, 16))
@@ -0,0 +1,106 @@
+"""
+Golden model throughput: per-call DPI functions vs. the batch (*_many) path,
+strobed (partial) writes vs. full-word writes on the batch path, and AXI
+bursts (one call per burst) vs. single beats.
+"""
+
+import os
+import sys
+import random
+import importlib
+
+from benchmarks.harness import benchmark
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "model")
+MODELS = ("apb", "ahb", "axi")
+MASKED_MODELS = ("ahb", "axi")  # models with dpi_mem_write_masked_many (WSTRB / HSIZE lanes)
+BURST_MODELS = ("axi",)          # models with dpi_mem_write_burst / dpi_mem_read_burst
+BURST_BEATS = 16
+
+# Addresses stay inside the default AHB model range (4 KB)
+ADDR_SPACE = 4096
+
+
+def load_model(protocol):
+    """Import model/<protocol>_model.py the way the DPI wrapper does."""
+    if MODEL_DIR not in sys.path:
+        sys.path.insert(0, MODEL_DIR)
+    return importlib.import_module(f"{protocol}_model")
+
+
+def _traffic(ctx):
+    count = ctx.size(20000, 2000)
+    rng = random.Random(1)
+    addrs = [rng.randrange(0, ADDR_SPACE, 4) for _ in range(count)]
+    datas = [rng.getrandbits(32) for _ in range(count)]
+    return addrs, datas
+
+
+def _ops(ctx):
+    # one write + one read per address
+    return 2 * ctx.size(20000, 2000)
+
+
+def _register(protocol):
+    @benchmark(f"model.{protocol}.per_call", ops=_ops)
+    def per_call(ctx):
+        module = load_model(protocol)
+        addrs, datas = _traffic(ctx)
+        write, read = module.dpi_mem_write, module.dpi_mem_read
+
+        def run():
+            for addr, data in zip(addrs, datas):
+                write(addr, data)
+            for addr in addrs:
+                read(addr)
+        return run
+
+    @benchmark(f"model.{protocol}.batch", ops=_ops)
+    def batch(ctx):
+        module = load_model(protocol)
+        addrs, datas = _traffic(ctx)
+
+        def run():
+            module.dpi_mem_write_many(addrs, datas)
+            module.dpi_mem_read_many(addrs)
+        return run
+
+
+def _register_masked(protocol):
+    @benchmark(f"model.{protocol}.masked_batch", ops=_ops)
+    def masked_batch(ctx):
+        module = load_model(protocol)
+        addrs, datas = _traffic(ctx)
+        rng = random.Random(2)
+        strbs = [rng.randrange(16) for _ in addrs]
+
+        def run():
+            module.dpi_mem_write_masked_many(addrs, datas, strbs)
+            module.dpi_mem_read_many(addrs)
+        return run
+
+
+def _register_burst(protocol):
+    @benchmark(f"model.{protocol}.burst", ops=_ops)
+    def burst(ctx):
+        module = load_model(protocol)
+        addrs, datas = _traffic(ctx)
+        # 16-beat INCR bursts of 4-byte beats, each inside one 64-byte block
+        starts = [addr & ~(BURST_BEATS * 4 - 1) for addr in addrs[::BURST_BEATS]]
+        chunks = [datas[i:i + BURST_BEATS] for i in range(0, len(datas), BURST_BEATS)]
+        strbs = [0xF] * BURST_BEATS
+
+        def run():
+            for start, chunk in zip(starts, chunks):
+                module.dpi_mem_write_burst(start, len(chunk) - 1, 2, module.BURST_INCR, chunk, strbs)
+            for start, chunk in zip(starts, chunks):
+                module.dpi_mem_read_burst(start, len(chunk) - 1, 2, module.BURST_INCR)
+        return run
+
+
+for _protocol in MODELS:
+    _register(_protocol)
+for _protocol in MASKED_MODELS:
+    _register_masked(_protocol)
+for _protocol in BURST_MODELS:
+    _register_burst(_protocol)
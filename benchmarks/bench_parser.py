@@ -0,0 +1,59 @@
+"""
+Verilog header parser and RTL index on synthetic large sources.
+"""
+
+import os
+import itertools
+
+from benchmarks.harness import benchmark
+from benchmarks.synth import synthetic_source
+from main.utils.verilog_parser import parse_verilog_source, parse_verilog_file
+from main.utils.rtl_index import RtlIndex
+
+
+def _modules(ctx):
+    return ctx.size(200, 20)
+
+
+def _write_source(ctx, name):
+    path = ctx.path("rtl", name)
+    if not os.path.exists(path):
+        with open(path, 'w') as f:
+            f.write(synthetic_source(_modules(ctx)))
+    return path
+
+
+@benchmark("parser.source_cold", ops=_modules)
+def parse_source(ctx):
+    text = synthetic_source(_modules(ctx))
+    return lambda: parse_verilog_source(text)
+
+
+@benchmark("parser.file_cached", repeat=20, ops=_modules)
+def parse_file_cached(ctx):
+    path = _write_source(ctx, "synth_parser.v")
+    return lambda: parse_verilog_file(path)
+
+
+@benchmark("rtl_index.scan_cold", ops=_modules)
+def index_cold(ctx):
+    path = _write_source(ctx, "synth_index.v")
+    counter = itertools.count()
+
+    def run():
+        # fresh database each run: every file is scanned
+        with RtlIndex(ctx.path("rtl_index", f"cold_{next(counter)}.sqlite")) as index:
+            index.update([path])
+    return run
+
+
+@benchmark("rtl_index.update_warm", repeat=20, ops=_modules)
+def index_warm(ctx):
+    path = _write_source(ctx, "synth_index.v")
+    index = RtlIndex(ctx.path("rtl_index", "warm.sqlite"))
+    index.update([path])
+
+    def run():
+        index.update([path])
+        index.find_module("synth_0", files=[path])
+    return run
@@ -0,0 +1,54 @@
+"""
+ai_planner end to end: the local (rule-based) path and the LLM path against
+the stub Ollama server, with the plan cache disabled.
+"""
+
+import os
+
+from benchmarks.harness import benchmark
+from benchmarks.stub_llm import StubOllamaServer
+from main import ai_planner
+from main.utils import ollama_client
+
+SPECS = {'apb': "apb_spec.txt", 'ahb': "ahb_spec.txt", 'axi': "axi_spec.txt"}
+
+_stub = None
+
+
+def stub_host():
+    """Start the stub once per process and point the planner's HTTP client at it."""
+    global _stub
+    if _stub is None:
+        with open("config.yaml", 'r', encoding='utf-8') as f:
+            _stub = StubOllamaServer(f"Here is the configuration:\n```yaml\n{f.read()}```\n").start()
+        os.environ["OLLAMA_HOST"] = _stub.host
+        ollama_client._client = None  # re-create the client with the new host
+        ai_planner.OLLAMA_BACKEND = "http"
+    return _stub.host
+
+
+def _read_spec(protocol):
+    with open(SPECS[protocol], 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _plan(spec, local):
+    def run():
+        if ai_planner.generate_test_plan(spec, use_cache=False, local=local) is None:
+            raise RuntimeError("planning failed")
+    return run
+
+
+def _register(protocol):
+    @benchmark(f"planner.{protocol}.local", repeat=10)
+    def local(ctx):
+        return _plan(_read_spec(protocol), local=True)
+
+    @benchmark(f"planner.{protocol}.llm_stub", repeat=10)
+    def llm(ctx):
+        stub_host()
+        return _plan(_read_spec(protocol), local=False)
+
+
+for _protocol in SPECS:
+    _register(_protocol)
@@ -0,0 +1,131 @@
+"""
+Benchmark Harness
+
+A benchmark is a setup function registered with @benchmark. Setup runs once
+(untimed) and returns the callable to time; the callable is run `repeat`
+times after one warm-up call. stdout is silenced during setup and runs so
+the generator/planner progress prints don't skew timings.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+from contextlib import redirect_stdout
+
+BENCHMARKS = []
+
+# Medians below this (seconds) differ by noise only; never flagged as regressions
+NOISE_FLOOR_S = 0.0005
+
+
+class Context:
+    """Per-run settings handed to every setup function."""
+
+    def __init__(self, workdir, quick=False):
+        self.workdir = workdir
+        self.quick = quick
+
+    def path(self, *parts):
+        path = os.path.join(self.workdir, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def size(self, full, quick):
+        return quick if self.quick else full
+
+
+class Benchmark:
+    def __init__(self, name, setup, repeat, ops):
+        self.name = name
+        self.setup = setup
+        self.repeat = repeat
+        self.ops = ops
+
+
+def benchmark(name, repeat=5, ops=None):
+    """
+    Register a setup function. `ops` (int or callable(ctx) -> int) is the
+    number of operations per call, used to report a rate.
+    """
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, setup, repeat, ops))
+        return setup
+    return register
+
+
+def run_benchmark(bench, ctx, repeat=None):
+    with redirect_stdout(io.StringIO()):
+        func = bench.setup(ctx)
+        func()  # warm-up (imports, template compilation, caches)
+        times = []
+        for _ in range(repeat or bench.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+    result = {
+        'median_s': statistics.median(times),
+        'min_s': min(times),
+        'mean_s': statistics.fmean(times),
+        'repeat': len(times),
+    }
+    ops = bench.ops(ctx) if callable(bench.ops) else bench.ops
+    if ops:
+        result['ops'] = ops
+        result['ops_per_s'] = ops / result['median_s'] if result['median_s'] > 0 else None
+    return result
+
+
+def environment_info():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'commit': commit,
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare medians with a baseline. Returns rows of
+    (name, baseline_s, current_s, ratio, status).
+    """
+    rows = []
+    base_results = baseline.get('results', {})
+    for name, res in results.items():
+        base = base_results.get(name)
+        if base is None:
+            rows.append((name, None, res['median_s'], None, "new"))
+            continue
+        ratio = res['median_s'] / base['median_s'] if base['median_s'] > 0 else float('inf')
+        slower = res['median_s'] - base['median_s']
+        if ratio > 1 + threshold and slower > NOISE_FLOOR_S:
+            status = "REGRESSION"
+        elif ratio < 1 - threshold and -slower > NOISE_FLOOR_S:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, base['median_s'], res['median_s'], ratio, status))
+    return rows
+
+
+def load_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
@@ -0,0 +1,111 @@
+"""
+Stub Ollama Server
+
+Serves POST /api/generate with a canned response streamed as NDJSON over a
+chunked keep-alive connection, like `ollama serve`. Used by the planner
+benchmarks so they run offline and deterministically; can also be started
+by hand to exercise the planner without a model:
+
+    python -m benchmarks.stub_llm --port 11434 --response config.yaml
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+        server.requests += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        text = server.response_text
+        try:
+            for i in range(0, len(text), server.chunk_size):
+                if server.token_delay:
+                    time.sleep(server.token_delay)
+                event = {"response": text[i:i + server.chunk_size], "done": False}
+                self._chunk(json.dumps(event).encode() + b"\n")
+            self._chunk(json.dumps({"response": "", "done": True}).encode() + b"\n")
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client stopped reading after the YAML block closed
+
+
+class StubOllamaServer:
+    """
+    with StubOllamaServer(text) as stub:
+        os.environ["OLLAMA_HOST"] = stub.host
+    """
+
+    def __init__(self, response_text, port=0, chunk_size=16, token_delay=0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.response_text = response_text
+        self.httpd.chunk_size = chunk_size
+        self.httpd.token_delay = token_delay
+        self.httpd.requests = 0
+        self._thread = None
+
+    @property
+    def host(self):
+        return f"127.0.0.1:{self.httpd.server_address[1]}"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Ollama server")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--response", type=str, default="config.yaml",
+                        help="YAML file returned (wrapped in a ```yaml block)")
+    parser.add_argument("--token-delay", type=float, default=0.0,
+                        help="Seconds between streamed chunks")
+    args = parser.parse_args()
+
+    with open(args.response, 'r', encoding='utf-8') as f:
+        text = f"```yaml\n{f.read()}```\n"
+    stub = StubOllamaServer(text, port=args.port, token_delay=args.token_delay)
+    print(f"[Stub] Serving on {stub.host} (Ctrl+C to stop)")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Synthetic RTL for the benchmarks: large parameterized modules (parser/index)
+and a DUT exposing many APB slave ports (generator).
+"""
+
+APB_PORTS = (
+    # (suffix, direction, width expression, vip signal)
+    ("psel", "input", None, "psel"),
+    ("penable", "input", None, "penable"),
+    ("pwrite", "input", None, "pwrite"),
+    ("paddr", "input", "ADDR_WIDTH-1:0", "paddr"),
+    ("pwdata", "input", "DATA_WIDTH-1:0", "pwdata"),
+    ("prdata", "output", "DATA_WIDTH-1:0", "prdata"),
+    ("pready", "output", None, "pready"),
+    ("pslverr", "output", None, "pslverr"),
+)
+
+
+def synthetic_module(name, ports=64, body_lines=400, ansi=True):
+    """One module with parameters, expression ranges and a long body."""
+    lines = [f"// synthetic module {name}"]
+    if ansi:
+        lines.append(f"module {name} #(")
+        lines.append("    parameter ADDR_WIDTH = 16,")
+        lines.append("    parameter DATA_WIDTH = 32,")
+        lines.append("    parameter DEPTH = 1 << (ADDR_WIDTH - 6)")
+        lines.append(") (")
+        decls = []
+        for i in range(ports):
+            direction = "input " if i % 3 else "output"
+            rng = "" if i % 4 == 0 else f"[$clog2(DEPTH)+DATA_WIDTH/{1 + i % 4}-1:0] "
+            decls.append(f"    {direction} wire {rng}p{i}")
+        lines.append(",\n".join(decls))
+        lines.append(");")
+    else:
+        lines.append(f"module {name} (" + ", ".join(f"p{i}" for i in range(ports)) + ");")
+        lines.append("    parameter ADDR_WIDTH = 16;")
+        lines.append("    parameter DATA_WIDTH = 32;")
+        for i in range(ports):
+            direction = "input" if i % 3 else "output"
+            rng = "" if i % 4 == 0 else f"[DATA_WIDTH/{1 + i % 4}-1:0] "
+            lines.append(f"    {direction} {rng}p{i};")
+
+    lines.append("    reg [DATA_WIDTH-1:0] mem [0:255];")
+    for i in range(body_lines):
+        lines.append(f"    wire [7:0] n{i} = p{i % ports} ^ (8'h{i % 256:02x} + {i}); // net {i}")
+    lines.append("    always @(posedge p1) begin")
+    lines.append("        mem[p2[7:0]] <= p3;")
+    lines.append("    end")
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_source(modules, ports=64, body_lines=400):
+    return "".join(synthetic_module(f"synth_{i}", ports, body_lines, ansi=i % 2 == 0)
+                   for i in range(modules))
+
+
+def multi_apb_dut(name, interfaces):
+    """
+    RTL of a DUT with `interfaces` independent APB slave ports u<i>_*,
+    plus the matching config interfaces list.
+    """
+    lines = [f"module {name} #(", "    parameter ADDR_WIDTH = 8,", "    parameter DATA_WIDTH = 32", ") ("]
+    decls = ["    input  wire PCLK", "    input  wire PRESETn"]
+    config_interfaces = []
+    for i in range(interfaces):
+        port_map = {"PCLK": "pclk", "PRESETn": "presetn"}
+        for suffix, direction, rng, signal in APB_PORTS:
+            width = f"[{rng}] " if rng else ""
+            decls.append(f"    {direction:<6} wire {width}u{i}_{suffix}")
+            port_map[f"u{i}_{suffix}"] = signal
+        config_interfaces.append({
+            'name': f"vif_{i}",
+            'protocol': "apb",
+            'type': "master",
+            'port_map': port_map,
+        })
+    lines.append(",\n".join(decls))
+    lines.append(");")
+    for i in range(interfaces):
+        lines.append(f"    assign u{i}_prdata = u{i}_pwdata;")
+        lines.append(f"    assign u{i}_pready = 1'b1;")
+        lines.append(f"    assign u{i}_pslverr = 1'b0;")
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n", config_interfaces
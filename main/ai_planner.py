@@ -4,17 +4,55 @@ AI Test Plan Generator
 
 사용법 (파일 입력 전용):
     python -m main.ai_planner --input spec.txt --output config.yaml
+    python -m main.ai_planner --input spec.txt --no-cache   # 캐시 무시하고 LLM 재호출
+    python -m main.ai_planner --input spec.txt --no-local   # 규칙 기반 매핑 없이 전체를 LLM으로 생성
+    python -m main.ai_planner --spec-dir specs/ --output-dir configs/ --jobs 4   # 디렉터리 일괄 처리
 """
 
 
+import os
+import re
+import json
+import time
 import yaml
+import hashlib
 import argparse
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+from main.utils.cache import get_cache_dir
+from main.utils.ollama_client import get_client, OllamaError
+from main.utils.port_mapper import map_ports
+from main.utils.profiler import span, instant, run_instrumented
+from main.utils.prompt_compactor import compact_spec, estimate_tokens
+from main.utils.rtl_index import RtlIndex, expand_sources
+from main.utils.verilog_parser import parse_verilog_source, resolve_module, infer_widths
 
 OLLAMA_MODEL = "qwen2.5-coder:7b"
+# "http": streaming HTTP API with pooled keep-alive connections (falls back to "cli")
+# "cli":  spawn `ollama run` per prompt
+OLLAMA_BACKEND = os.environ.get("OLLAMA_BACKEND", "http")
 VIP_SIGNALS_PATH = Path(__file__).parent.parent / "templates" / "vip" / "vip_signals.yaml"
 
+# Validated-config cache (.uvmgen_cache/planner), evicted least-recently-used first
+PLAN_CACHE_MAX_ENTRIES = 256
+PLAN_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Local (LLM-free) planning: RTL referenced or pasted in the spec
+SPEC_RTL_FILE_RE = re.compile(r'[\w./\\-]+\.s?v\b')
+SPEC_ITERATIONS_RE = re.compile(r'(\d+)\s*(?:번|회|times\b|iterations\b)', re.IGNORECASE)
+MEMORY_ARRAY_RE = re.compile(r'\breg\s*\[[^\]]*\]\s*\w+\s*\[\s*(\d+)\s*:\s*(\d+)\s*\]')
+DEFAULT_ITERATIONS = 100
+DEFAULT_MEMORY_BYTES = 1024
+
+# Multi-spec planning (--spec-dir)
+SPEC_PATTERNS = ("*.txt", "*.md")
+DEFAULT_PLAN_JOBS = 4
+DEFAULT_PLAN_RETRIES = 2
+
 
 def load_vip_signals() -> dict:
     """Load VIP signal definitions from vip_signals.yaml"""
@@ -231,8 +269,28 @@ test_plan:
 """
 
 
-def call_ollama(prompt: str) -> str:
-    """로컬 Ollama API 호출"""
+def call_ollama(prompt: str, echo: bool = False) -> str:
+    """로컬 Ollama 호출 (HTTP 스트리밍, 실패 시 `ollama run` CLI로 대체)"""
+    with span("llm_call", cat="llm", model=OLLAMA_MODEL, prompt_chars=len(prompt)) as args:
+        response = None
+        if OLLAMA_BACKEND == "http":
+            args['backend'] = "http"
+            on_token = (lambda token: print(token, end="", flush=True)) if echo else None
+            try:
+                response = get_client().generate(OLLAMA_MODEL, prompt, on_token=on_token).strip()
+                if echo:
+                    print()
+            except (OllamaError, OSError) as e:
+                print(f"[AI] HTTP backend unavailable ({e}), falling back to 'ollama run'")
+        if response is None:
+            args['backend'] = "cli"
+            response = call_ollama_cli(prompt)
+        args['response_chars'] = len(response or "")
+        return response
+
+
+def call_ollama_cli(prompt: str) -> str:
+    """`ollama run` 서브프로세스 호출"""
     try:
         # ollama run 명령 사용 (더 간단)
         result = subprocess.run(
@@ -251,18 +309,32 @@ def call_ollama(prompt: str) -> str:
         return None
 
 
-def build_prompt(user_input: str) -> str:
+def build_prompt(user_input: str, compact: bool = True) -> str:
     vip_signals_section = get_vip_signals_prompt_section()
     system_prompt = SYSTEM_PROMPT_TEMPLATE.format(vip_signals_section=vip_signals_section)
-    
-    return f"""{system_prompt}
+
+    def render(spec: str) -> str:
+        return f"""{system_prompt}
 
 ### User Input:
-{user_input}
+{spec}
 
 ### Output (YAML only):
 """
 
+    if not compact:
+        prompt = render(user_input)
+        print(f"[AI] Prompt: ~{estimate_tokens(prompt)} tokens")
+        return prompt
+
+    # Verilog bodies -> port/parameter summaries (prompt size independent of RTL size)
+    spec, stats = compact_spec(user_input)
+    prompt = render(spec)
+    overhead = estimate_tokens(render(""))
+    print(f"[AI] Prompt: ~{overhead + stats['tokens_before']} -> ~{estimate_tokens(prompt)} tokens "
+          f"({stats['modules']} module(s) summarized)")
+    return prompt
+
 
 def parse_yaml_response(response: str) -> dict:
     """LLM 응답에서 YAML 추출 및 파싱"""
@@ -366,11 +438,218 @@ def validate_address_constraints(config: dict) -> dict:
     return config
 
 
-def generate_test_plan(user_input: str) -> dict:
+def extract_dut(user_input: str) -> Optional[dict]:
+    """
+    Find the DUT module in the RTL files named in the spec (resolved through
+    the RTL index) or in Verilog pasted into the spec itself.
+    """
+    source_files = [f for f in dict.fromkeys(SPEC_RTL_FILE_RE.findall(user_input)) if Path(f).is_file()]
+    spec_modules = {name: m for name, m in parse_verilog_source(user_input).items() if m['ports']}
+
+    candidates = []
+    if source_files:
+        files, _ = expand_sources(source_files)
+        with RtlIndex() as index:
+            index.update(files)
+            for path in files:
+                candidates.extend(m for m in index.modules_in(path) if m['ports'])
+    # File definitions come first: pasted code may be abridged
+    candidates.extend(spec_modules.values())
+    if not candidates:
+        return None
+
+    mentioned = [m for m in candidates
+                 if re.search(rf"\b{re.escape(m['name'])}\b", user_input)]
+    preferred = [m for m in candidates if m['name'] in spec_modules] or mentioned or candidates
+    module = preferred[0]
+
+    params, ports = resolve_module(module)
+    public = {p['name'] for p in module['params'] if not p['local']}
+    return {
+        'module_name': module['name'],
+        'source_files': source_files,
+        'parameters': {k: v for k, v in params.items() if k in public},
+        'ports': ports,
+    }
+
+
+def build_local_test_plan(user_input: str, parameters: dict, protocol: str) -> dict:
+    """Address constraints and coverage bins from the DUT size; iterations from the spec"""
+    data_bytes = max(parameters.get('DATA_WIDTH', 32) // 8, 1)
+    if 'RAM_DEPTH' in parameters:
+        mem_bytes = parameters['RAM_DEPTH'] * data_bytes
+    elif 'REG_NUM_BITS' in parameters:
+        mem_bytes = (2 ** parameters['REG_NUM_BITS']) * data_bytes
+    else:
+        match = MEMORY_ARRAY_RE.search(user_input)
+        if match:
+            mem_bytes = (abs(int(match.group(1)) - int(match.group(2))) + 1) * data_bytes
+        else:
+            mem_bytes = DEFAULT_MEMORY_BYTES
+
+    match = SPEC_ITERATIONS_RE.search(user_input)
+    iterations = int(match.group(1)) if match else DEFAULT_ITERATIONS
+    max_addr = mem_bytes - data_bytes
+    quarter = mem_bytes // 4
+
+    corner_cases = [f"boundary_addr: 0x0, 0x{max_addr:X}"]
+    if protocol == 'ahb':
+        corner_cases.append("size_variation: BYTE, HALFWORD, WORD")
+
+    return {
+        'constraints': {
+            'addr': {'min': 0, 'max': max_addr, 'align': data_bytes},
+            'data': {'type': 'random'},
+            'iterations': iterations,
+        },
+        'coverage': {
+            'addr_ranges': [
+                {'name': 'low', 'range': [0, quarter - 1]},
+                {'name': 'mid', 'range': [quarter, 3 * quarter - 1]},
+                {'name': 'high', 'range': [3 * quarter, mem_bytes - 1]},
+            ],
+            'corner_cases': corner_cases,
+        },
+    }
+
+
+def build_leftover_prompt(dut: dict, mapping: dict, vip_signals: dict) -> str:
+    """Small prompt asking only for the ports the rule-based mapper could not place"""
+    protocol = mapping['protocol']
+    ports_by_name = {p['name']: p for p in dut['ports']}
+    unresolved = "\n".join(
+        f"  - {name} ({ports_by_name[name]['direction']}, {ports_by_name[name]['width'] or '?'} bit)"
+        for name in mapping['unresolved']
+    )
+    mapped = "\n".join(f"  {k}: {v}" for k, v in mapping['port_map'].items())
+    signals = ", ".join(vip_signals.get(protocol, {}).get('signals', []))
+    return f"""You are a UVM verification expert.
+DUT module `{dut['module_name']}` is an {protocol.upper()} {mapping['type']}.
+Standard {protocol.upper()} interface signals: {signals}
+
+Already mapped (DUT port: signal):
+{mapped}
+
+Map the remaining DUT ports by SEMANTIC MEANING. Only map if 80%+ confident;
+use null for ports without a counterpart. Never reuse an already mapped signal.
+{unresolved}
+
+### Output (YAML mapping `<dut_port>: <signal>` only):
+"""
+
+
+def resolve_leftover_ports(dut: dict, mapping: dict, vip_signals: dict, echo: bool = False) -> dict:
+    """Ask the LLM for the unresolved ports; returns only valid, unused signals"""
+    response = call_ollama(build_leftover_prompt(dut, mapping, vip_signals), echo=echo)
+    if not response:
+        return {}
+    answer = parse_yaml_response(response)
+    if not isinstance(answer, dict):
+        return {}
+
+    allowed = set(vip_signals.get(mapping['protocol'], {}).get('signals', []))
+    used = set(mapping['port_map'].values())
+    resolved = {}
+    for port, signal in answer.items():
+        if port in mapping['unresolved'] and signal in allowed and signal not in used:
+            resolved[port] = signal
+            used.add(signal)
+    return resolved
+
+
+def generate_local_plan(user_input: str, use_cache: bool = True, echo: bool = False) -> Optional[dict]:
+    """
+    Build the config from the parsed RTL with the rule-based port mapper.
+    The LLM is only consulted for ports the mapper leaves unresolved.
+    Returns None when no DUT or protocol can be identified locally.
+    """
+    start = time.perf_counter()
+    dut = extract_dut(user_input)
+    if dut is None:
+        return None
+    vip_signals = load_vip_signals()
+    mapping = map_ports(dut['ports'], vip_signals)
+    if mapping is None:
+        print(f"[Local] Could not identify the protocol of '{dut['module_name']}'")
+        return None
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"[Local] {dut['module_name']}: {mapping['protocol'].upper()} {mapping['type']}, "
+          f"mapped {len(mapping['port_map'])}/{len(dut['ports'])} ports in {elapsed_ms:.1f} ms")
+
+    port_map = dict(mapping['port_map'])
+    if mapping['unresolved']:
+        print(f"[Local] Unresolved ports: {', '.join(mapping['unresolved'])} -> asking {OLLAMA_MODEL}")
+        prompt = build_leftover_prompt(dut, mapping, vip_signals)
+        cache_key = plan_cache_key(prompt)
+        cached = load_cached_plan(cache_key) if use_cache else None
+        if cached is not None:
+            print(f"[AI] Cache hit ({cache_key[:12]}), skipping LLM call")
+            instant("plan_cache_hit", cat="plan")
+            resolved = cached
+        else:
+            resolved = resolve_leftover_ports(dut, mapping, vip_signals, echo=echo)
+            if use_cache and resolved:  # don't pin an empty/failed answer
+                store_cached_plan(cache_key, resolved)
+        port_map.update(resolved)
+        still_open = [p for p in mapping['unresolved'] if p not in resolved]
+        if still_open:
+            print(f"[WARNING] Left unconnected: {', '.join(still_open)} (edit port_map if needed)")
+        # Keep DUT port order
+        port_map = {p['name']: port_map[p['name']] for p in dut['ports'] if p['name'] in port_map}
+
+    parameters = dict(dut['parameters'])
+    widths = infer_widths(dut['ports'])
+    ordered = {
+        'ADDR_WIDTH': parameters.pop('ADDR_WIDTH', widths.get('ADDR_WIDTH', 32)),
+        'DATA_WIDTH': parameters.pop('DATA_WIDTH', widths.get('DATA_WIDTH', 32)),
+    }
+    ordered.update(parameters)
+
+    config = {
+        'project_name': f"{dut['module_name']}_project",
+        'output_dir': "./output",
+        'dut': {
+            'module_name': dut['module_name'],
+            'source_files': dut['source_files'],
+            'parameters': ordered,
+        },
+        'interfaces': [{
+            'name': "vif_0",
+            'protocol': mapping['protocol'],
+            'type': mapping['type'],
+            'port_map': port_map,
+        }],
+        'test_plan': build_local_test_plan(user_input, ordered, mapping['protocol']),
+    }
+    config = post_process_config(config)
+    config = validate_address_constraints(config)
+    print("[Local] Valid configuration generated!")
+    return config
+
+
+def generate_test_plan(user_input: str, use_cache: bool = True, echo: bool = False,
+                       local: bool = True, compact: bool = True) -> dict:
+    if local:
+        with span("local_plan", cat="plan") as args:
+            config = generate_local_plan(user_input, use_cache=use_cache, echo=echo)
+            args['mapped'] = config is not None
+        if config is not None:
+            return config
+
     print(f"\n[AI] Generating full configuration using {OLLAMA_MODEL}...")
     
-    prompt = build_prompt(user_input)
-    response = call_ollama(prompt)
+    prompt = build_prompt(user_input, compact=compact)
+
+    cache_key = plan_cache_key(prompt)
+    if use_cache:
+        cached = load_cached_plan(cache_key)
+        if cached is not None:
+            print(f"[AI] Cache hit ({cache_key[:12]}), skipping LLM call")
+            instant("plan_cache_hit", cat="plan")
+            return cached
+
+    response = call_ollama(prompt, echo=echo)
     
     if not response:
         return None
@@ -383,12 +662,70 @@ def generate_test_plan(user_input: str) -> dict:
         config = post_process_config(config)
         config = validate_address_constraints(config)
         print("[AI] Valid configuration generated!")
+        if use_cache:
+            store_cached_plan(cache_key, config)
         return config
     else:
         print("[AI] Invalid configuration structure")
         return None
 
 
+def plan_cache_key(prompt: str) -> str:
+    """Cache key: model name + vip_signals.yaml content + full prompt (spec included)"""
+    vip_signals = VIP_SIGNALS_PATH.read_bytes() if VIP_SIGNALS_PATH.exists() else b""
+    h = hashlib.sha256()
+    for part in (OLLAMA_MODEL.encode('utf-8'), vip_signals, prompt.encode('utf-8')):
+        h.update(part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load_cached_plan(key: str) -> Optional[dict]:
+    """Return a cached validated config, refreshing its LRU timestamp on hit"""
+    path = Path(get_cache_dir("planner")) / f"{key}.yaml"
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return None
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass  # evicted by a concurrent planner after the read: the config is still valid
+    return config
+
+
+def store_cached_plan(key: str, config: dict):
+    cache_dir = Path(get_cache_dir("planner"))
+    # Unique temp name: concurrent planners may store the same key at once
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    os.replace(tmp_path, cache_dir / f"{key}.yaml")
+    evict_plan_cache()
+
+
+def evict_plan_cache():
+    """Drop least-recently-used entries beyond PLAN_CACHE_MAX_ENTRIES / PLAN_CACHE_MAX_BYTES"""
+    # Planner threads evict concurrently: entries may vanish between glob, stat and unlink
+    entries = []
+    for path in Path(get_cache_dir("planner")).glob("*.yaml"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    entries.sort(reverse=True)  # most recently used first
+
+    total = 0
+    for index, (_, size, path) in enumerate(entries):
+        total += size
+        if index >= PLAN_CACHE_MAX_ENTRIES or total > PLAN_CACHE_MAX_BYTES:
+            path.unlink(missing_ok=True)
+
+
 def save_config(config: dict, config_path: str = "config.yaml"):
     """전체 config 저장"""
     config_file = Path(config_path)
@@ -399,19 +736,159 @@ def save_config(config: dict, config_path: str = "config.yaml"):
     print(f"[AI] Saved to: {config_path}")
 
 
+def collect_spec_files(spec_dir: str) -> list:
+    """Spec files (*.txt, *.md) directly under spec_dir, sorted"""
+    files = set()
+    for pattern in SPEC_PATTERNS:
+        files.update(Path(spec_dir).glob(pattern))
+    return sorted(files)
+
+
+def plan_one_spec(spec_path: Path, output_dir: Path, retries: int, use_cache: bool,
+                  local: bool = True, compact: bool = True) -> dict:
+    """
+    Plan a single spec, retrying when the response is not a valid YAML config
+    or the attempt raised (e.g. a dropped LLM connection).
+    Cache entries are only written for valid configs, so a retry always re-queries the LLM.
+    """
+    start = time.perf_counter()
+    result = {'spec': spec_path.name, 'ok': False, 'attempts': 0, 'output': None, 'error': None}
+    try:
+        user_input = spec_path.read_text(encoding='utf-8')
+    except OSError as e:
+        result['error'] = str(e)
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        return result
+
+    config = None
+    while result['attempts'] <= retries and config is None:
+        result['attempts'] += 1
+        if result['attempts'] > 1:
+            print(f"[AI] {spec_path.name}: retry {result['attempts'] - 1}/{retries}")
+        with span("attempt", cat="plan", spec=spec_path.name, attempt=result['attempts']) as args:
+            try:
+                config = generate_test_plan(user_input, use_cache=use_cache, local=local, compact=compact)
+            except Exception as e:
+                print(f"[AI] {spec_path.name}: attempt {result['attempts']} failed ({e})")
+                result['error'] = str(e)
+                config = None
+            args['ok'] = config is not None
+
+    if config:
+        out_path = output_dir / f"{spec_path.stem}.yaml"
+        try:
+            save_config(config, str(out_path))
+            result['ok'] = True
+            result['output'] = str(out_path)
+            result['error'] = None
+        except OSError as e:
+            result['error'] = str(e)
+    elif result['error'] is None:
+        result['error'] = "no valid config"
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def plan_spec_dir(spec_dir: str, output_dir: str, jobs: int = DEFAULT_PLAN_JOBS,
+                  retries: int = DEFAULT_PLAN_RETRIES, use_cache: bool = True,
+                  local: bool = True, compact: bool = True) -> bool:
+    """
+    Plan every spec in spec_dir with at most `jobs` concurrent LLM requests,
+    write one config per spec and a plan_summary.json. Returns True if all succeeded.
+    """
+    specs = collect_spec_files(spec_dir)
+    if not specs:
+        print(f"[AI] No spec files found in {spec_dir}")
+        return False
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(plan_one_spec, spec, out_dir, retries, use_cache, local, compact) for spec in specs]
+        results = [f.result() for f in futures]
+    total = time.perf_counter() - start
+
+    width = max([len(r['spec']) for r in results] + [4])
+    print("\n" + "=" * (width + 32))
+    print(f"{'Spec':<{width}}  {'Status':<6}  {'Tries':>5}  {'Time(s)':>8}")
+    print("-" * (width + 32))
+    for r in results:
+        status = "OK" if r['ok'] else "FAIL"
+        print(f"{r['spec']:<{width}}  {status:<6}  {r['attempts']:>5}  {r['seconds']:>8.2f}"
+              + (f"  ({r['error']})" if r['error'] else ""))
+    print("-" * (width + 32))
+    failed = sum(1 for r in results if not r['ok'])
+    print(f"{len(results)} spec(s), {failed} failed, total {total:.2f}s")
+    print("=" * (width + 32))
+
+    summary = {
+        'model': OLLAMA_MODEL,
+        'jobs': jobs,
+        'retries': retries,
+        'total_seconds': round(total, 3),
+        'failed': failed,
+        'specs': results,
+    }
+    with open(out_dir / "plan_summary.json", 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    print(f"[AI] Summary: {out_dir / 'plan_summary.json'}")
+    return failed == 0
+
+
 def main():
+    global OLLAMA_BACKEND
     parser = argparse.ArgumentParser(description="AI Config Generator (파일 입력 전용)")
-    parser.add_argument("--input", "-f", type=str, required=True,
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", "-f", type=str,
                         help="입력 파일 경로 (spec.txt)")
+    source.add_argument("--spec-dir", type=str,
+                        help="spec 파일(*.txt, *.md) 디렉터리: 모든 spec을 동시에 처리")
     parser.add_argument("--output", "-o", type=str, default="config.yaml",
                         help="출력 파일 경로")
+    parser.add_argument("--output-dir", type=str, default="configs",
+                        help="--spec-dir 사용 시 출력 디렉터리 (spec마다 <이름>.yaml)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_PLAN_JOBS,
+                        help="--spec-dir 사용 시 동시 LLM 요청 수")
+    parser.add_argument("--retries", type=int, default=DEFAULT_PLAN_RETRIES,
+                        help="유효한 YAML이 나오지 않을 때 spec당 재시도 횟수")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="캐시된 결과를 무시하고 LLM을 다시 호출")
+    parser.add_argument("--backend", choices=["http", "cli"], default=OLLAMA_BACKEND,
+                        help="Ollama 호출 방식 (http: 스트리밍 API, cli: ollama run)")
+    parser.add_argument("--stream", action="store_true",
+                        help="LLM 토큰을 생성되는 대로 출력")
+    parser.add_argument("--no-local", action="store_true",
+                        help="규칙 기반 포트 매핑을 건너뛰고 전체 config를 LLM으로 생성")
+    parser.add_argument("--no-compact", action="store_true",
+                        help="spec의 Verilog 본문을 요약하지 않고 그대로 프롬프트에 포함")
+    parser.add_argument("--trace-json", type=str, metavar="PATH",
+                        help="LLM 호출/재시도 타이밍을 Chrome trace JSON으로 저장 (chrome://tracing)")
+    parser.add_argument("--profile", type=str, nargs="?", const="", metavar="PATH",
+                        help="cProfile로 실행하고 상위 함수 출력 (PATH 지정 시 stats 저장)")
     
     args = parser.parse_args()
+    OLLAMA_BACKEND = args.backend
+
+    if args.trace_json or args.profile is not None:
+        run_instrumented(lambda: run(args), "ai_planner", trace_json=args.trace_json, profile=args.profile)
+    else:
+        run(args)
+
+
+def run(args):
+    if args.spec_dir:
+        ok = plan_spec_dir(args.spec_dir, args.output_dir, jobs=args.jobs,
+                           retries=args.retries, use_cache=not args.no_cache,
+                           local=not args.no_local, compact=not args.no_compact)
+        exit(0 if ok else 1)
 
     with open(args.input, 'r', encoding='utf-8') as f:
         user_input = f.read()
     
-    config = generate_test_plan(user_input)
+    config = generate_test_plan(user_input, use_cache=not args.no_cache, echo=args.stream,
+                                local=not args.no_local, compact=not args.no_compact)
     if config:
         save_config(config, args.output)
     else:
@@ -0,0 +1,261 @@
+"""
+Multi-seed Regression Runner
+
+Builds the simulation snapshot once (run.tcl in build-only mode), then runs
+N seeds in parallel, each in its own work directory, and collects per-seed
+logs and results into one report:
+
+    python -m main.regress --config config.yaml --seeds 32 --jobs 8
+    python -m main.regress --seed-list 7,19 --no-build        # rerun failing seeds
+    python -m main.regress --simulator fake --seeds 16         # no Vivado: stand-in xsim
+
+Work directories (<sim_dir>/regress/<timestamp>/seed_<n>) link the build
+products of the sim directory (xsim.dir, libdpi, Python model, DLLs), so
+per-seed logs, traces and model files never collide.
+
+The simulator and build commands are templates; placeholders are replaced
+per seed: {seed}, {log}, {workdir}, {snapshot}, {python}.
+"""
+
+import os
+import sys
+import json
+import time
+import shlex
+import shutil
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from main.utils.sim_monitor import LogMonitor, write_summary
+from main.utils.txn_check import TXN_LOG_FILE, TxnLogError, check_log
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SIMULATOR_PRESETS = {
+    'xsim': "xsim {snapshot} -runall -sv_seed {seed} -log {log}",
+    'fake': "{python} -m main.utils.fake_xsim --seed {seed} --log {log}",
+}
+BUILD_PRESETS = {
+    'xsim': "vivado -mode batch -nojournal -nolog -source run.tcl -tclargs build",
+    'fake': "",
+}
+SNAPSHOT = "top_snapshot"
+SIM_LOG = "xsim.log"
+STDOUT_LOG = "stdout.log"
+
+# Sim-dir entries never linked into seed work directories
+STAGE_EXCLUDE = {'regress', '.Xil', 'webtalk', TXN_LOG_FILE}
+STAGE_EXCLUDE_SUFFIXES = ('.log', '.jou', '.pb', '.wdb', '.str')
+
+
+def format_command(template, **values):
+    """Split a command template and fill placeholders token by token (paths may contain spaces)."""
+    return [token.format(**values) for token in shlex.split(template, posix=(os.name != 'nt'))]
+
+
+def stage_workdir(sim_dir, workdir):
+    """Link (or copy, where links are not allowed) the sim dir's build products into workdir."""
+    os.makedirs(workdir, exist_ok=True)
+    for entry in os.scandir(sim_dir):
+        if entry.name in STAGE_EXCLUDE or entry.name.endswith(STAGE_EXCLUDE_SUFFIXES):
+            continue
+        dst = os.path.join(workdir, entry.name)
+        if os.path.lexists(dst):
+            continue
+        try:
+            os.symlink(os.path.abspath(entry.path), dst, target_is_directory=entry.is_dir())
+        except OSError:
+            # Windows without symlink privilege
+            if entry.is_dir():
+                shutil.copytree(entry.path, dst)
+            else:
+                shutil.copy2(entry.path, dst)
+
+
+def run_build(sim_dir, build_cmd, out_dir):
+    """Compile + elaborate once. Returns True on success."""
+    log_path = os.path.join(out_dir, "build.log")
+    cmd = format_command(build_cmd, python=sys.executable, snapshot=SNAPSHOT,
+                         workdir=os.path.abspath(sim_dir), seed="", log=log_path)
+    print(f"[Regress] Build: {' '.join(cmd)}")
+    start = time.perf_counter()
+    try:
+        with open(log_path, 'w') as log:
+            code = subprocess.call(cmd, cwd=sim_dir, stdout=log, stderr=subprocess.STDOUT,
+                                   env=_sim_env())
+    except OSError as e:
+        print(f"[Error] Build command failed to start: {e}")
+        return False
+    print(f"[Regress] Build finished in {time.perf_counter() - start:.1f}s (exit {code}), log: {log_path}")
+    return code == 0
+
+
+def _sim_env():
+    # Lets `{python} -m main....` commands run from a seed work directory
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (PROJECT_ROOT, env.get('PYTHONPATH')) if p)
+    return env
+
+
+def run_seed(seed, sim_dir, sim_cmd, run_dir, timeout=None, max_mismatches=None, max_errors=None):
+    """
+    Run one seed in its own work directory. The simulator output is monitored
+    while it runs (see sim_monitor.py) and the seed is stopped early once the
+    mismatch / error budget is exceeded.
+    """
+    workdir = os.path.join(run_dir, f"seed_{seed}")
+    result = {'seed': seed, 'status': "ERROR", 'exit_code': None, 'seconds': 0.0,
+              'workdir': workdir, 'log': None, 'error': None}
+    start = time.perf_counter()
+    try:
+        stage_workdir(sim_dir, workdir)
+        log_path = os.path.join(workdir, SIM_LOG)
+        stdout_path = os.path.join(workdir, STDOUT_LOG)
+        cmd = format_command(sim_cmd, seed=seed, log=log_path, workdir=workdir,
+                             snapshot=SNAPSHOT, python=sys.executable)
+        # The simulator echoes its log to stdout, which is captured and tailed
+        monitor = LogMonitor(stdout_path, max_mismatches=max_mismatches, max_errors=max_errors)
+        with open(stdout_path, 'w') as out:
+            proc = subprocess.Popen(cmd, cwd=workdir, stdout=out, stderr=subprocess.STDOUT, env=_sim_env())
+            summary = monitor.follow(proc, timeout=timeout)
+
+        # Point at the simulator's own log when it wrote one (-log)
+        summary['log'] = log_path if os.path.exists(log_path) else stdout_path
+        txn_log = os.path.join(workdir, TXN_LOG_FILE)
+        if os.path.exists(txn_log):
+            merge_txn_check(summary, txn_log)
+        write_summary(os.path.join(workdir, "summary.json"), summary)
+        result.update(summary)
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def merge_txn_check(summary, txn_log):
+    """Record mode (model.check_mode: record): reads are compared after the run."""
+    try:
+        check = check_log(txn_log)
+    except (OSError, TxnLogError) as e:
+        summary['status'] = "FAIL" if summary['status'] == "PASS" else summary['status']
+        summary['error'] = f"txn_check: {e}"
+        return
+    summary['txn_check'] = {k: v for k, v in check.items() if k != 'mismatch_details'}
+    summary['iterations'] = check['iterations']
+    summary['matches'] = check['matches']
+    summary['mismatches'] = check['mismatches']
+    summary['first_mismatch_addr'] = summary.get('first_mismatch_addr') or check['first_mismatch_addr']
+    if check['status'] != "PASS" and summary['status'] == "PASS":
+        summary['status'] = "FAIL"
+
+
+def run_regression(sim_dir, seeds, sim_cmd, jobs, run_dir, timeout=None, max_mismatches=None,
+                   max_errors=None):
+    print(f"[Regress] {len(seeds)} seed(s) on {jobs} worker(s) -> {run_dir}")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(run_seed, seed, sim_dir, sim_cmd, run_dir, timeout, max_mismatches, max_errors)
+                   for seed in seeds]
+        return [f.result() for f in futures]
+
+
+def print_report(results, total):
+    print("\n" + "=" * 78)
+    print(f"{'Seed':>10}  {'Status':<7}  {'Errors':>6}  {'Fatals':>6}  {'Mismatch':>8}  {'Time(s)':>8}  First failure")
+    print("-" * 78)
+    for r in results:
+        first = r.get('first_mismatch_addr') or r.get('error') or ""
+        if not first and r['status'] != "PASS" and r.get('first_error'):
+            message = r['first_error']
+            first = message[message.find('['):][:40]  # "[ID] text" part of the UVM message
+        print(f"{r['seed']:>10}  {r['status']:<7}  {r.get('uvm_errors', '-'):>6}  {r.get('uvm_fatals', '-'):>6}  "
+              f"{r.get('mismatches', '-'):>8}  {r['seconds']:>8.2f}  {first}")
+    print("-" * 78)
+    failed = [r['seed'] for r in results if r['status'] != "PASS"]
+    print(f"{len(results)} seed(s), {len(results) - len(failed)} passed, {len(failed)} failed, total {total:.2f}s")
+    if failed:
+        print(f"Rerun failing seeds: python -m main.regress --no-build --seed-list {','.join(map(str, failed))}")
+    print("=" * 78)
+
+
+def resolve_sim_dir(args):
+    if args.sim_dir:
+        return args.sim_dir
+    from main.utils.config_loader import load_config
+    config = load_config(args.config)
+    return os.path.join(config['output_dir'], "sim")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel multi-seed regression runner")
+    parser.add_argument("--config", type=str, default="config.yaml",
+                        help="Config whose output_dir/sim is used (default: config.yaml)")
+    parser.add_argument("--sim-dir", type=str, help="Simulation directory (overrides --config)")
+    parser.add_argument("--seeds", type=int, default=8, help="Number of seeds (default: 8)")
+    parser.add_argument("--seed-base", type=int, default=1, help="First seed (default: 1)")
+    parser.add_argument("--seed-list", type=str, help="Comma separated seeds (overrides --seeds)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel simulations (default: all cores)")
+    parser.add_argument("--simulator", choices=sorted(SIMULATOR_PRESETS), default="xsim",
+                        help="Command preset: xsim (Vivado) or fake (stand-in log emulator)")
+    parser.add_argument("--sim-cmd", type=str,
+                        help="Simulator command template, e.g. \"xsim {snapshot} -runall -sv_seed {seed} -log {log}\"")
+    parser.add_argument("--build-cmd", type=str, help="Build (compile + elaborate) command run once in the sim dir")
+    parser.add_argument("--no-build", action="store_true", help="Reuse the existing snapshot")
+    parser.add_argument("--timeout", type=float, help="Per-seed timeout in seconds")
+    parser.add_argument("--max-mismatches", type=int,
+                        help="Stop a seed once it has more than N scoreboard mismatches (fail-fast)")
+    parser.add_argument("--max-errors", type=int,
+                        help="Stop a seed once it has more than N UVM_ERROR/UVM_FATAL messages")
+    parser.add_argument("--out", type=str, help="Run directory (default: <sim_dir>/regress/<timestamp>)")
+    args = parser.parse_args()
+
+    sim_dir = resolve_sim_dir(args)
+    if not os.path.isdir(sim_dir):
+        if args.simulator != 'fake':
+            print(f"[Error] Simulation directory not found: {sim_dir} (run main.run first)")
+            sys.exit(1)
+        os.makedirs(sim_dir, exist_ok=True)
+
+    if args.seed_list:
+        seeds = [int(s) for s in args.seed_list.split(",") if s.strip()]
+    else:
+        seeds = list(range(args.seed_base, args.seed_base + args.seeds))
+
+    timestamp = time.strftime("%Y-%m-%d_%H%M%S")
+    run_dir = os.path.abspath(args.out or os.path.join(sim_dir, "regress", timestamp))
+    os.makedirs(run_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    build_cmd = args.build_cmd if args.build_cmd is not None else BUILD_PRESETS[args.simulator]
+    if not args.no_build and build_cmd:
+        if not run_build(sim_dir, build_cmd, run_dir):
+            print("[Error] Build failed, no seeds were run.")
+            sys.exit(1)
+
+    sim_cmd = args.sim_cmd or SIMULATOR_PRESETS[args.simulator]
+    results = run_regression(sim_dir, seeds, sim_cmd, args.jobs, run_dir, timeout=args.timeout,
+                             max_mismatches=args.max_mismatches, max_errors=args.max_errors)
+    total = time.perf_counter() - start
+    print_report(results, total)
+
+    failed = [r['seed'] for r in results if r['status'] != "PASS"]
+    report = {
+        'timestamp': timestamp,
+        'sim_dir': os.path.abspath(sim_dir),
+        'sim_cmd': sim_cmd,
+        'jobs': args.jobs,
+        'total_seconds': round(total, 3),
+        'passed': len(results) - len(failed),
+        'failed_seeds': failed,
+        'seeds': results,
+    }
+    report_path = os.path.join(run_dir, "report.json")
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"[Regress] Report: {report_path}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -42,17 +42,64 @@ interfaces:
         f.write(content)
     print(f"[Success] Generated 'config.yaml' for protocol '{protocol}'")
 
+def run_batch_mode(args):
+    """Generate many configs in one process (see main/utils/batch.py)."""
+    from main.utils.batch import collect_config_files, expand_matrix, run_batch
+
+    if args.matrix:
+        if not os.path.exists(args.matrix):
+            print(f"[Error] Matrix file '{args.matrix}' not found.")
+            sys.exit(1)
+        entries = expand_matrix(args.matrix)
+    else:
+        entries = [(path, path) for path in collect_config_files(args.batch)]
+
+    if not entries:
+        print("[Error] No configs found for batch generation.")
+        sys.exit(1)
+
+    print(f"[Info] Batch generation: {len(entries)} config(s), {args.jobs} worker(s)")
+    if not run_batch(entries, jobs=args.jobs, incremental=args.incremental):
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(description="UVM Testbench Generator")
     parser.add_argument("--init", type=str, help="Generate a starter config.yaml for the given protocol (e.g., apb)")
     parser.add_argument("--config", type=str, help="Path to config.yaml to run generation", default="config.yaml")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rewrite outputs whose template, context or generator version changed")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of parallel workers: template renders, or configs in batch/matrix mode (default: 1)")
+    parser.add_argument("--batch", type=str,
+                        help="Generate every config in a directory or glob (e.g. 'configs/*.yaml')")
+    parser.add_argument("--matrix", type=str,
+                        help="Generate all variants of a matrix YAML (base config + parameter sweeps)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and regenerate only outputs affected by edits to the config, templates or DUT sources")
+    parser.add_argument("--interval", type=float, default=0.2,
+                        help="Polling interval in seconds for --watch (default: 0.2)")
+    parser.add_argument("--trace-json", type=str, metavar="PATH",
+                        help="Write per-phase / per-template timings as Chrome trace JSON (chrome://tracing)")
+    parser.add_argument("--profile", type=str, nargs="?", const="", metavar="PATH",
+                        help="Run under cProfile and print the top functions (optionally save stats to PATH)")
     
     args = parser.parse_args()
 
+    if args.trace_json or args.profile is not None:
+        from main.utils.profiler import run_instrumented
+        run_instrumented(lambda: run(args), "uvmgen", trace_json=args.trace_json, profile=args.profile)
+    else:
+        run(args)
+
+def run(args):
     if args.init:
         init_config(args.init)
         return
 
+    if args.batch or args.matrix:
+        run_batch_mode(args)
+        return
+
     if not os.path.exists(args.config):
         print(f"[Error] Config file '{args.config}' not found.")
         print("Run 'python main/run.py --init apb' to generate one.")
@@ -64,10 +111,17 @@ def main():
     from main.utils.config_loader import load_config
     from main.utils.generator import Generator
 
+    if args.watch:
+        from main.utils.watcher import WatchSession
+        WatchSession(args.config, jobs=args.jobs, interval=args.interval).run()
+        return
+
     config = load_config(args.config)
     
-    gen = Generator(config)
-    gen.generate()
+    gen = Generator(config, incremental=args.incremental, jobs=args.jobs)
+    if not gen.generate():
+        print("[Error] Generation finished with errors.")
+        sys.exit(1)
     print("[Success] Generation completed.")
 
 if __name__ == "__main__":
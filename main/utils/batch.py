@@ -0,0 +1,155 @@
+"""
+Batch / Matrix Generation
+
+Generates testbenches for many configs in one process, so interpreter start,
+Jinja2 setup and template compilation are paid once. All generators share the
+process-wide template Environment (see generator.get_template_env).
+
+Inputs:
+    --batch  <dir | glob>   every *.yaml / *.yml config found
+    --matrix <matrix.yaml>  one base config expanded over parameter sweeps
+
+Matrix file format:
+    base: config.yaml              # path to a config, or an inline config mapping
+    sweep:                         # dotted config keys -> list of values
+      dut.parameters.DATA_WIDTH: [32, 64]
+      dut.parameters.REG_NUM_BITS: [4, 5]
+    name: "{project_name}_dw{DATA_WIDTH}_r{REG_NUM_BITS}"   # optional variant name
+
+Each variant is written to <base output_dir>/<variant name>.
+"""
+
+import copy
+import glob
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from .config_loader import load_config, validate_config
+from .generator import Generator
+from .profiler import span
+
+
+def collect_config_files(pattern):
+    """Return the config files of a directory or glob pattern, sorted."""
+    if os.path.isdir(pattern):
+        files = glob.glob(os.path.join(pattern, "*.yaml")) + glob.glob(os.path.join(pattern, "*.yml"))
+    else:
+        files = glob.glob(pattern)
+    return sorted(files)
+
+
+def _set_dotted(config, dotted_key, value):
+    node = config
+    keys = dotted_key.split(".")
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+
+def expand_matrix(matrix_path):
+    """
+    Expand a matrix YAML into a list of (name, config) variants.
+    """
+    with open(matrix_path, 'r') as f:
+        matrix = yaml.safe_load(f) or {}
+
+    base = matrix.get('base', {})
+    if isinstance(base, str):
+        with open(base, 'r') as f:
+            base = yaml.safe_load(f)
+
+    sweep = matrix.get('sweep', {}) or {}
+    keys = list(sweep.keys())
+    name_format = matrix.get('name')
+
+    # Variant names refer to sweep keys by their last segment, so those must be unique
+    short_keys = {}
+    for key in keys:
+        short = key.split(".")[-1]
+        if short in short_keys:
+            print(f"[Error] Sweep keys '{short_keys[short]}' and '{key}' both map to the name "
+                  f"field '{short}' in {matrix_path}")
+            sys.exit(1)
+        short_keys[short] = key
+
+    variants = []
+    for values in itertools.product(*(sweep[k] for k in keys)):
+        config = copy.deepcopy(base)
+        # Short names for the variant label: "dut.parameters.DATA_WIDTH" -> DATA_WIDTH
+        fields = {'project_name': config.get('project_name', 'variant')}
+        for key, value in zip(keys, values):
+            _set_dotted(config, key, value)
+            fields[key.split(".")[-1]] = value
+
+        if name_format:
+            try:
+                name = name_format.format(**fields)
+            except (KeyError, IndexError, ValueError) as e:
+                print(f"[Error] Invalid matrix name '{name_format}' in {matrix_path}: {e!r}. "
+                      f"Allowed fields: {', '.join('{' + f + '}' for f in fields)}")
+                sys.exit(1)
+        else:
+            name = "_".join([str(fields['project_name'])] +
+                            [f"{k.split('.')[-1]}{v}" for k, v in zip(keys, values)])
+
+        config['project_name'] = name
+        config['output_dir'] = os.path.join(base.get('output_dir', './output'), name)
+        variants.append((name, config))
+    return variants
+
+
+def _generate_one(name, config_or_path, incremental):
+    start = time.perf_counter()
+    result = {'name': name, 'ok': False, 'written': 0, 'skipped': 0, 'error': None}
+    try:
+        if isinstance(config_or_path, str):
+            config = load_config(config_or_path)
+        else:
+            config = config_or_path
+            validate_config(config)
+
+        gen = Generator(config, incremental=incremental)
+        with span(name, cat="config"):
+            result['ok'] = gen.generate()
+        result['written'] = gen.written
+        result['skipped'] = gen.skipped
+        if gen.errors:
+            result['error'] = f"{len(gen.errors)} render error(s)"
+    except SystemExit:
+        # config_loader reports problems and exits; keep the rest of the batch going
+        result['error'] = "invalid config"
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def run_batch(entries, jobs=1, incremental=False):
+    """
+    Generate every (name, config-or-path) entry on a thread pool and print a
+    per-config timing summary. Returns True if all configs succeeded.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(_generate_one, name, cfg, incremental) for name, cfg in entries]
+        results = [f.result() for f in futures]
+    total = time.perf_counter() - start
+
+    width = max([len(r['name']) for r in results] + [6])
+    print("\n" + "=" * (width + 40))
+    print(f"{'Config':<{width}}  {'Status':<6}  {'Written':>7}  {'Unchanged':>9}  {'Time(ms)':>9}")
+    print("-" * (width + 40))
+    for r in results:
+        status = "OK" if r['ok'] else "FAIL"
+        print(f"{r['name']:<{width}}  {status:<6}  {r['written']:>7}  {r['skipped']:>9}  {r['seconds'] * 1000:>9.1f}"
+              + (f"  ({r['error']})" if r['error'] else ""))
+    print("-" * (width + 40))
+    failed = sum(1 for r in results if not r['ok'])
+    print(f"{len(results)} config(s), {failed} failed, total {total:.2f}s")
+    print("=" * (width + 40))
+    return failed == 0
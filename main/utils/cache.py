@@ -0,0 +1,21 @@
+"""
+Local Cache Directory
+
+All persistent caches (compiled templates, ...) live under one directory so
+CI can keep or wipe them as a unit. Defaults to ./.uvmgen_cache (project root),
+overridable with the UVMGEN_CACHE_DIR environment variable.
+"""
+
+import os
+
+DEFAULT_CACHE_DIR = ".uvmgen_cache"
+
+
+def get_cache_dir(*parts):
+    """
+    Return (and create) a cache subdirectory, e.g. get_cache_dir("jinja").
+    """
+    root = os.environ.get("UVMGEN_CACHE_DIR", DEFAULT_CACHE_DIR)
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
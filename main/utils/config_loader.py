@@ -54,4 +54,40 @@ def validate_config(config):
             print(f"[Error] Unsupported protocol '{intf['protocol']}'. Template directory not found: {template_dir}")
             sys.exit(1)
 
+    # Validate golden model options
+    check_mode = (config.get('model', {}) or {}).get('check_mode', 'online')
+    if check_mode not in ('online', 'record'):
+        print(f"[Error] Unsupported model.check_mode '{check_mode}' (expected 'online' or 'record').")
+        sys.exit(1)
+
+    # Validate AXI burst options (test_plan.constraints.burst)
+    constraints = (config.get('test_plan', {}) or {}).get('constraints', {}) or {}
+    burst = constraints.get('burst', {}) or {}
+    burst_types = burst.get('types', ['INCR'])
+    for burst_type in burst_types:
+        if burst_type not in ('FIXED', 'INCR', 'WRAP'):
+            print(f"[Error] Unsupported burst type '{burst_type}' (expected FIXED, INCR or WRAP).")
+            sys.exit(1)
+    max_beats = burst.get('max_beats', 1)
+    if not isinstance(max_beats, int) or not 1 <= max_beats <= 256:
+        print(f"[Error] test_plan.constraints.burst.max_beats must be 1..256, got {max_beats!r}.")
+        sys.exit(1)
+    # AXI4 burst lengths: WRAP is 2, 4, 8 or 16 beats, FIXED at most 16 beats
+    # (longer max_beats only applies to INCR)
+    if set(burst_types) == {'WRAP'} and max_beats < 2:
+        print(f"[Error] WRAP bursts need at least 2 beats, but test_plan.constraints.burst.max_beats is {max_beats}.")
+        sys.exit(1)
+
+    # Validate AXI driver options (vip.axi)
+    axi_opts = (config.get('vip', {}) or {}).get('axi', {}) or {}
+    outstanding = axi_opts.get('outstanding', 1)
+    if not isinstance(outstanding, int) or outstanding < 1:
+        print(f"[Error] vip.axi.outstanding must be a positive integer, got {outstanding!r}.")
+        sys.exit(1)
+    # The record-mode log (txn.bin) stores the ID in one byte
+    id_width = axi_opts.get('id_width', 4)
+    if not isinstance(id_width, int) or not 1 <= id_width <= 8:
+        print(f"[Error] vip.axi.id_width must be 1..8, got {id_width!r}.")
+        sys.exit(1)
+
     print("[Info] Configuration validated successfully.")
@@ -0,0 +1,108 @@
+"""
+Stand-in for `xsim top_snapshot -runall -sv_seed N -log LOG`
+
+Prints a UVM write/read test log in the format of the generated testbench
+(scoreboard [SCB] / [SCB_MISMATCH] messages and the UVM Report Summary) to
+stdout and the log file, line by line and flushed, so the regression runner
+and log monitor can be exercised without Vivado:
+
+    python -m main.regress --simulator fake --seeds 8
+    python -m main.utils.fake_xsim --seed 3 --log sim.log --fail-seeds 3
+
+The run is deterministic per seed. Seeds listed in --fail-seeds report data
+mismatches from a seed-dependent iteration on; --fatal-seeds end with a
+UVM_FATAL before the report summary is printed.
+"""
+
+import sys
+import time
+import random
+import argparse
+
+CLOCK_PERIOD_NS = 10
+
+
+def _seed_list(text):
+    return {int(s) for s in text.split(",") if s.strip()} if text else set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="xsim stand-in (emulated UVM log)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--log", type=str, default="xsim.log")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Seconds per transaction (emulates simulation speed)")
+    parser.add_argument("--fail-seeds", type=str, default="",
+                        help="Comma separated seeds that produce scoreboard mismatches")
+    parser.add_argument("--fatal-seeds", type=str, default="",
+                        help="Comma separated seeds that end in UVM_FATAL")
+    parser.add_argument("--protocol", type=str, default="apb")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failing = args.seed in _seed_list(args.fail_seeds)
+    fatal = args.seed in _seed_list(args.fatal_seeds)
+    first_bad = rng.randrange(args.iterations) if failing or fatal else None
+    test = f"{args.protocol}_test"
+    counts = {'UVM_INFO': 0, 'UVM_WARNING': 0, 'UVM_ERROR': 0, 'UVM_FATAL': 0}
+    ids = {}
+
+    with open(args.log, 'w') as log:
+        def out(line):
+            sys.stdout.write(line + "\n")
+            log.write(line + "\n")
+            log.flush()
+
+        def uvm(severity, time_ns, src, msg_id, msg):
+            counts[severity] += 1
+            ids[msg_id] = ids.get(msg_id, 0) + 1
+            location = f"{src} " if src else ""
+            out(f"{severity} {location}@ {time_ns}: {msg_id_scope(msg_id)} [{msg_id}] {msg}")
+
+        def msg_id_scope(msg_id):
+            return "uvm_test_top.env.scb" if msg_id.startswith("SCB") else "reporter"
+
+        out("****** xsim v2024.1 (64-bit)  [stand-in]")
+        out(f"source xsim.dir/top_snapshot/xsim_script.tcl  (sv_seed {args.seed})")
+        uvm("UVM_INFO", 0, "", "RNTST", f"Running test {test}...")
+        uvm("UVM_INFO", 0, f"{args.protocol}_base_seq.sv(29)", "SEQ",
+            f"Starting {args.iterations} iterations of Write-Read Test...")
+
+        now = 0
+        for i in range(args.iterations):
+            addr = rng.randrange(0, 4096, 4)
+            data = rng.getrandbits(32)
+            now += 4 * CLOCK_PERIOD_NS
+            uvm("UVM_INFO", now, f"{args.protocol}_scoreboard.sv(34)", "SCB",
+                f"WRITE: Addr=0x{addr:x} Data=0x{data:x}")
+            now += 4 * CLOCK_PERIOD_NS
+            dut = data ^ (1 << rng.randrange(32)) if failing and i >= first_bad else data
+            uvm("UVM_INFO", now, f"{args.protocol}_scoreboard.sv(56)", "SCB",
+                f"READ: Addr=0x{addr:x} | DUT=0x{dut:x} vs Model=0x{data:x}")
+            if dut != data:
+                uvm("UVM_ERROR", now, f"{args.protocol}_scoreboard.sv(60)", "SCB_MISMATCH",
+                    f"Data Mismatch! Addr=0x{addr:x} DUT=0x{dut:x} Exp=0x{data:x}")
+            if fatal and i == first_bad:
+                uvm("UVM_FATAL", now, f"{args.protocol}_driver.sv(40)", "DRVTIMEOUT",
+                    "Timed out waiting for ready")
+                out(f"$finish called at time : {now} ns")
+                return
+            if args.delay:
+                time.sleep(args.delay)
+
+        uvm("UVM_INFO", now, f"{args.protocol}_base_seq.sv(44)", "SEQ", "Sequence complete")
+        out("")
+        out("--- UVM Report Summary ---")
+        out("")
+        out("** Report counts by severity")
+        for severity, n in counts.items():
+            out(f"{severity} : {n:4d}")
+        out("** Report counts by id")
+        for msg_id in sorted(ids):
+            out(f"[{msg_id}] {ids[msg_id]:5d}")
+        out(f"$finish called at time : {now} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,164 @@
 import os
 import sys
-from .verilog_parser import parse_all_dut_sources
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from .rtl_index import expand_sources, infer_dut_widths, source_dependencies
+from .cache import get_cache_dir
+from .profiler import span, record_span
+from .txn_check import TXN_LOG_FILE
 
 try:
-    from jinja2 import Environment, FileSystemLoader
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 except ImportError:
     print("[Error] Jinja2 is not installed. Please install it using 'pip install jinja2'")
     sys.exit(1)
 
+# Bump when generator logic changes in a way that alters outputs for the same
+# templates and config (invalidates incremental-mode manifests)
+GENERATOR_VERSION = "1.1"
+MANIFEST_FILE = ".gen_manifest.json"
+# Compilation units for run.tcl's incremental build (see generate_build_manifest)
+BUILD_MANIFEST_FILE = "build_manifest.tcl"
+
+# Shared modules imported by every golden model (copied next to the model by run.tcl)
+MODEL_SUPPORT_FILES = ["mem_backend.py", "model_trace.py"]
+
+# Template loader root; template paths in this module are project-relative
+# ("templates/tb/top.sv") and are mapped to loader names ("tb/top.sv")
+TEMPLATE_DIR = "templates"
+
+_template_envs = {}
+
+
+def get_template_env(template_dir=TEMPLATE_DIR):
+    """
+    Return the process-wide Environment for template_dir.
+
+    Compiled templates are kept in memory for the life of the process and as
+    bytecode on disk (.uvmgen_cache/jinja), so later runs skip compilation.
+    Jinja2 checks each cached entry against the template source checksum, so
+    edited templates are recompiled automatically.
+    """
+    key = os.path.abspath(template_dir)
+    env = _template_envs.get(key)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=FileSystemBytecodeCache(get_cache_dir("jinja")),
+            cache_size=-1,
+        )
+        _template_envs[key] = env
+    return env
+
+
+def template_name(template_path):
+    """Map a project-relative template path to its loader name."""
+    return os.path.relpath(template_path, TEMPLATE_DIR).replace("\\", "/")
+
+
+# Per-process Environment for parallel rendering (see Generator._run_render_jobs)
+_worker_env = None
+
+
+def _init_render_worker(template_dir):
+    global _worker_env
+    _worker_env = get_template_env(template_dir)
+
+
+def _render_in_worker(name, context):
+    """Render one template; returns (text, seconds spent rendering)."""
+    start = time.perf_counter()
+    rendered = _worker_env.get_template(name).render(context)
+    return rendered, time.perf_counter() - start
+
+
+def _tcl_word(text):
+    """Quote one Tcl list element (paths may contain spaces)."""
+    text = str(text)
+    if text and not any(c in text for c in '{}\\'):
+        return "{" + text + "}"
+    return "".join("\\" + c if c in '{}[]$"\\; ' else c for c in text) or "{}"
+
+
+def _tcl_list(items):
+    return "{" + " ".join(_tcl_word(item) for item in items) + "}"
+
+
+def _tcl_dict(entry, keys):
+    """One Tcl dict literal; list-valued fields become nested lists."""
+    fields = " ".join(f"{key} {_tcl_list(entry[key]) if isinstance(entry[key], list) else _tcl_word(entry[key])}"
+                      for key in keys)
+    return "{" + fields + "}"
+
+
 class Generator:
-    def __init__(self, config):
+    def __init__(self, config, incremental=False, jobs=1):
         self.config = config
         self.output_dir = config['output_dir']
-        self.template_env = Environment(loader=FileSystemLoader('.'))
+        self.template_env = get_template_env()
+
+        # Incremental mode: skip outputs whose inputs are unchanged (see _render_template)
+        self.incremental = incremental
+        self.manifest = self._load_manifest() if incremental else {}
+        self.written = 0
+        self.skipped = 0
 
-    def generate(self):
+        # Render jobs queued by the generate_* steps, executed by _run_render_jobs
+        self.jobs = max(1, int(jobs))
+        self.render_jobs = []
+        self.errors = []
+        # Step that is queueing jobs (attributes written files to phases in traces)
+        self.phase = None
+        self._vip_base_context = None
+
+    # Generation steps in output order
+    STEPS = (
+        'prepare_output_dir',
+        'copy_vip_files',
+        'generate_tb_top',
+        'generate_tb_env',
+        'generate_test',
+        'generate_tb_pkg',
+        'generate_tcl_script',
+        'generate_build_manifest',
+        'generate_dpi_wrapper',
+        'generate_model_config',
+        # Add more generation steps here (Wrappers, Tests, etc.)
+    )
+
+    def generate(self, steps=None):
         """
         Main generation flow.
+        The generate_* steps only build render jobs; the jobs are then
+        rendered (in parallel when jobs > 1) and written in a fixed order.
+        `steps` limits the run to a subset of STEPS (watch mode); outputs of
+        the other steps are left as they are.
+        Returns True when every output was generated without errors.
         """
-        self.prepare_output_dir()
-        self.copy_vip_files()
-        self.generate_tb_top()
-        self.generate_tb_env()
-        self.generate_test()
-        self.generate_tb_pkg()
-        self.generate_tcl_script()
-        self.generate_dpi_wrapper()
-        # Add more generation steps here (Wrappers, Tests, etc.)
+        for name in self.STEPS:
+            if steps is not None and name not in steps and name != 'prepare_output_dir':
+                continue
+            self.phase = name
+            queued = len(self.render_jobs)
+            with span(self.phase, cat="phase") as args:
+                getattr(self, name)()
+                args['jobs'] = len(self.render_jobs) - queued
+        self.phase = None
+
+        with span("render_and_write", cat="phase") as args:
+            self._run_render_jobs()
+            args['written'] = self.written
+            args['unchanged'] = self.skipped
+
+        if self.incremental:
+            self._save_manifest()
+            print(f"[Info] Incremental: {self.written} written, {self.skipped} unchanged")
+
+        if self.errors:
+            print(f"[Error] {len(self.errors)} file(s) failed to render")
+        return not self.errors
 
     def prepare_output_dir(self):
         if not os.path.exists(self.output_dir):
@@ -45,8 +177,6 @@ class Generator:
              print(f"[Warning] Template not found: {template_path}. Skipping Top generation.")
              return
 
-        template = self.template_env.get_template(template_path)
-        
         PROTOCOL_CLOCKS = {'apb': 'pclk', 'axi': 'aclk', 'ahb': 'hclk'}
         PROTOCOL_RESETS = {'apb': 'presetn', 'axi': 'aresetn', 'ahb': 'hresetn'}
         
@@ -72,12 +202,8 @@ class Generator:
             'port_maps': self._build_port_maps(self.config['interfaces'])
         }
 
-        rendered = template.render(context)
-        
         out_path = os.path.join(self.output_dir, "tb", "top.sv")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
 
     def generate_tcl_script(self):
         """
@@ -88,19 +214,6 @@ class Generator:
              print(f"[Warning] Template not found: {template_path}. Skipping Tcl generation.")
              return
 
-        template = self.template_env.get_template(template_path)
-        
-        vip_files = []
-        for intf in self.config['interfaces']:
-            proto = intf['protocol']
-            vip_files.append(f"../vip/{proto}/{proto}_pkg.sv")
-            vip_files.append(f"../vip/{proto}/{proto}_if.sv")
-
-        dut_files_rel = []
-        for f in self.config['dut']['source_files']:
-            rel = os.path.join("..", "..", f).replace("\\", "/")
-            dut_files_rel.append(rel)
-
         # Get Python Paths
         import sysconfig
         import sys
@@ -125,37 +238,121 @@ class Generator:
             model_module_name = "apb_model"
             model_file_name = "apb_model.py"
 
-        # Build VIP Include Flags
-        # Get unique protocols
-        protocols = set(intf['protocol'] for intf in self.config['interfaces'])
-        vip_include_flags = []
-        for p in protocols:
-            vip_include_flags.append(f"-i ../vip/{p}")
-        vip_includes_str = " ".join(vip_include_flags)
-
+        # Compile units and their include flags are listed in build_manifest.tcl
         context = {
-            'dut_files': " ".join(dut_files_rel),
-            'vip_files': " ".join(vip_files),
-            'tb_files': "../tb/tb_pkg.sv ../tb/top.sv", # Compile pkg then top
             'python_include': py_include,
             'python_lib_dir': py_lib_dir,
             'python_lib_name': py_lib_name,
             'protocol': primary_proto,
             'model_file': model_file_name,
-            'vip_includes': vip_include_flags, # Passing list creates issues if not joined or handled in template. Let's pass string or handle list.
-            # Actually run.tcl template expects string substitution currently if we use {{ vip_includes }}
-            # Let's check template. Template uses: -i ../vip/apb. 
-            # We will replace that line in template.
-            'vip_include_flags': vip_includes_str,
-            'model_module_name': model_module_name
+            'model_module_name': model_module_name,
+            'model_support_files': MODEL_SUPPORT_FILES,
+            # Fail-fast: stop xsim after this many UVM_ERRORs (0 = run to the end)
+            'max_quit_count': int((self.config.get('simulation', {}) or {}).get('max_errors', 0)),
+            'build_manifest': BUILD_MANIFEST_FILE,
+            # Record mode: the scoreboards log transactions, checked after xsim
+            'check_mode': (self.config.get('model', {}) or {}).get('check_mode', 'online'),
+            'txn_log': TXN_LOG_FILE,
+            'python_exe': sys.executable.replace("\\", "/"),
+            # txn_check runs as python -m main.utils.txn_check from the sim dir
+            'project_root': os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).replace("\\", "/"),
         }
 
-        rendered = template.render(context)
-        
         out_path = os.path.join(self.output_dir, "sim", "run.tcl")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
+
+    def generate_build_manifest(self):
+        """
+        Write {output_dir}/sim/build_manifest.tcl: the xvlog compilation units
+        in compile order. run.tcl checksums each unit's deps and recompiles
+        only the units whose inputs changed, plus the units using their
+        packages (a recompiled package invalidates its importers), and the
+        shared VIP libraries it links with -L.
+        """
+        units = []
+
+        # DUT: one unit per source file, `include files and packages scanned
+        dut_files, dut_incdirs = expand_sources(self.config['dut']['source_files'])
+        incdirs = [self._sim_relpath(d) for d in dut_incdirs]
+        package_units = {}
+        for f in dut_files:
+            deps = source_dependencies(f, dut_incdirs)
+            name = self._sim_relpath(f)
+            units.append({
+                'name': name,
+                'sources': [name],
+                'incdirs': incdirs,
+                'deps': [name] + [self._sim_relpath(i) for i in deps['includes']],
+                'uses': [package_units[p] for p in deps['imports'] if p in package_units],
+            })
+            for p in deps['packages']:
+                package_units.setdefault(p, name)
+
+        # VIP: the interface, then the package `including every class file.
+        # Compiled once into the shared library store when enabled (see vip_library)
+        protocols = list(dict.fromkeys(intf['protocol'] for intf in self.config['interfaces']))
+        vip_pkgs = []
+        libraries = []
+        for proto in protocols:
+            vip_dir = f"../vip/{proto}"
+            if_file, pkg_file = f"{vip_dir}/{proto}_if.sv", f"{vip_dir}/{proto}_pkg.sv"
+            library = self.vip_library(proto)
+            if library is not None:
+                libraries.append({'name': library['name'], 'dir': library['dir'],
+                                  'sources': [if_file, pkg_file], 'incdirs': [vip_dir]})
+                self._register_vip_library(library)
+                continue
+            class_files = [f"{vip_dir}/{rel}" for _, rel in self._vip_templates(proto)
+                           if rel not in (f"{proto}_if.sv", f"{proto}_pkg.sv")]
+            units.append({'name': if_file, 'sources': [if_file], 'incdirs': [vip_dir],
+                          'deps': [if_file], 'uses': []})
+            units.append({'name': pkg_file, 'sources': [pkg_file], 'incdirs': [vip_dir],
+                          'deps': [pkg_file] + class_files, 'uses': [if_file]})
+            vip_pkgs.append(pkg_file)
+
+        # TB: tb_pkg includes the environment and the test; top imports everything
+        test_file = f"../tb/{protocols[0] if protocols else 'apb'}_test.sv"
+        units.append({'name': "../tb/tb_pkg.sv", 'sources': ["../tb/tb_pkg.sv"], 'incdirs': [],
+                      'deps': ["../tb/tb_pkg.sv", "../tb/tb_env.sv", test_file], 'uses': vip_pkgs})
+        units.append({'name': "../tb/top.sv", 'sources': ["../tb/top.sv"], 'incdirs': [],
+                      'deps': ["../tb/top.sv"], 'uses': vip_pkgs + ["../tb/tb_pkg.sv"]})
+
+        lines = [
+            "# Compilation units for the incremental build in run.tcl (generated, do not edit)",
+            "#   name     unit id (its source file)",
+            "#   sources  files passed to xvlog, incdirs their -i directories",
+            "#   deps     files whose content checksums decide whether the unit is recompiled",
+            "#   uses     units whose packages it imports (recompiled whenever they are)",
+            "# vip_libraries: shared precompiled VIP libraries (-L name=dir/xsim_<vivado version>/name)",
+            "set build_units {",
+        ]
+        for unit in units:
+            lines.append(f"    {_tcl_dict(unit, ('name', 'sources', 'incdirs', 'deps', 'uses'))}")
+        lines.append("}")
+        lines.append("set vip_libraries {")
+        for library in libraries:
+            lines.append(f"    {_tcl_dict(library, ('name', 'dir', 'sources', 'incdirs'))}")
+        lines.append("}")
+        rendered = "\n".join(lines) + "\n"
+
+        out_path = os.path.join(self.output_dir, "sim", BUILD_MANIFEST_FILE)
+        self._queue_output(out_path, rendered, self._hash_inputs(rendered))
+
+    @staticmethod
+    def _register_vip_library(library):
+        """Describe a library in its store directory (for listing and pruning the store)."""
+        os.makedirs(library['dir'], exist_ok=True)
+        info_path = os.path.join(library['dir'], "library.json")
+        if not os.path.exists(info_path):
+            with open(info_path, "w") as f:
+                json.dump({k: v for k, v in library.items() if k != 'dir'}, f, indent=2)
+
+    @staticmethod
+    def _sim_relpath(path):
+        """Project-relative source path as seen from {output_dir}/sim (absolute paths kept)"""
+        if os.path.isabs(path):
+            return path.replace("\\", "/")
+        return os.path.join("..", "..", os.path.normpath(path)).replace("\\", "/")
 
     def generate_tb_env(self):
         """
@@ -164,8 +361,6 @@ class Generator:
         template_path = "templates/tb/tb_env.sv"
         if not os.path.exists(template_path): return
 
-        template = self.template_env.get_template(template_path)
-        
         # Build context for agents
         interfaces_ctx = []
         for intf in self.config['interfaces']:
@@ -176,12 +371,9 @@ class Generator:
             })
 
         context = { 'interfaces': interfaces_ctx }
-        rendered = template.render(context)
-        
+
         out_path = os.path.join(self.output_dir, "tb", "tb_env.sv")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
 
     def generate_tb_pkg(self):
         """
@@ -190,8 +382,6 @@ class Generator:
         template_path = "templates/tb/tb_pkg.sv"
         if not os.path.exists(template_path): return
 
-        template = self.template_env.get_template(template_path)
-        
         vip_pkgs = [f"{intf['protocol']}_pkg" for intf in self.config['interfaces']]
         test_name = f"{self.config['interfaces'][0]['protocol']}_test"
         context = { 
@@ -199,12 +389,8 @@ class Generator:
             'test_name': test_name
         }
         
-        rendered = template.render(context)
-        
         out_path = os.path.join(self.output_dir, "tb", "tb_pkg.sv")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
 
     def generate_test(self):
         """
@@ -223,8 +409,6 @@ class Generator:
             print(f"[WARNING] Test template not found: {template_path}")
             return
         
-        template = self.template_env.get_template(template_path)
-        
         # Determine bit widths from Config
         # Assuming single interface for now or uniform width
         addr_width = self.config['dut']['parameters'].get('ADDR_WIDTH', 32)
@@ -240,12 +424,8 @@ class Generator:
             'interfaces': interfaces_ctx
         }
         
-        rendered = template.render(context)
-        
         out_path = os.path.join(self.output_dir, "tb", f"{primary_proto}_test.sv")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
 
     def generate_dpi_wrapper(self):
         """
@@ -269,42 +449,95 @@ class Generator:
             'model_module_name': model_name
         }
         
-        template = self.template_env.get_template(template_path)
-        rendered = template.render(context)
-        
         out_path = os.path.join(self.output_dir, "sim", "wrapper.c")
-        with open(out_path, "w") as f:
-            f.write(rendered)
-        print(f"[Generated] {out_path}")
+        self._render_template(template_path, out_path, context)
+
+    def generate_model_config(self):
+        """
+        Write {output_dir}/sim/model_config.json for the Python golden model.
+        Sizes the model's memory backend (see model/mem_backend.py) and
+        configures its transaction trace (see model/model_trace.py).
+        """
+        params = self.config['dut'].get('parameters', {}) or {}
+        model_cfg = self.config.get('model', {}) or {}
+
+        # Memory depth in words: explicit override, RAM_DEPTH, or register file size
+        ram_depth = model_cfg.get('ram_depth', params.get('RAM_DEPTH'))
+        if ram_depth is None and 'REG_NUM_BITS' in params:
+            ram_depth = 2 ** params['REG_NUM_BITS']
+
+        content = {
+            'addr_width': params.get('ADDR_WIDTH', 32),
+            'data_width': params.get('DATA_WIDTH', 32),
+            'ram_depth': ram_depth,
+            'memory': model_cfg.get('memory', 'auto'),
+            'trace': model_cfg.get('trace', {}) or {},
+        }
+
+        out_path = os.path.join(self.output_dir, "sim", "model_config.json")
+        rendered = json.dumps(content, indent=2)
+        self._queue_output(out_path, rendered, self._hash_inputs(rendered))
+
+    def _vip_context(self, proto):
+        """Render context of a protocol's VIP files (cached: width inference reads the DUT)."""
+        if self._vip_base_context is None:
+            # Auto-infer bit widths from DUT source files, evaluating ranges with the
+            # configured parameters (instance overrides win over dut.parameters)
+            dut_cfg = self.config['dut']
+            param_overrides = {**(dut_cfg.get('parameters', {}) or {}),
+                               **(dut_cfg.get('dut_parameters', {}) or {})}
+            inferred_widths = infer_dut_widths(
+                dut_cfg.get('source_files', []),
+                overrides=param_overrides,
+                module_name=dut_cfg.get('module_name'),
+            )
+
+            # Build context: config.yaml parameters override inferred values
+            config_params = self.config['dut'].get('parameters', {}) or {}
+            context = {
+                'ADDR_WIDTH': config_params.get('ADDR_WIDTH', inferred_widths.get('ADDR_WIDTH', 32)),
+                'DATA_WIDTH': config_params.get('DATA_WIDTH', inferred_widths.get('DATA_WIDTH', 32)),
+                **config_params,
+            }
+
+            if 'test_plan' in self.config:
+                context['test_plan'] = self.config['test_plan']
+
+            # Golden model bridge options (scoreboard DPI batching, record mode)
+            model_cfg = self.config.get('model', {}) or {}
+            context['dpi_batch_size'] = int(model_cfg.get('dpi_batch_size', 0))
+            context['check_mode'] = model_cfg.get('check_mode', 'online')
+            context['txn_log'] = TXN_LOG_FILE
+            self._vip_base_context = context
 
-    def copy_vip_files(self):
-        protocols = set(intf['protocol'] for intf in self.config['interfaces'])
-        
-        # Auto-infer bit widths from DUT source files
-        inferred_widths = parse_all_dut_sources(
-            self.config['dut'].get('source_files', [])
-        )
-        
         # Protocol-specific clock/reset names
         PROTOCOL_CLOCKS = {'apb': 'pclk', 'axi': 'aclk', 'ahb': 'hclk'}
         PROTOCOL_RESETS = {'apb': 'presetn', 'axi': 'aresetn', 'ahb': 'hresetn'}
-        
-        # Build context: config.yaml parameters override inferred values
-        config_params = self.config['dut'].get('parameters', {}) or {}
-        context = {
-            'ADDR_WIDTH': config_params.get('ADDR_WIDTH', inferred_widths.get('ADDR_WIDTH', 32)),
-            'DATA_WIDTH': config_params.get('DATA_WIDTH', inferred_widths.get('DATA_WIDTH', 32)),
-            **config_params,
+        return {
+            **self._vip_base_context,
+            # Per-protocol VIP options (vip.<protocol> in config.yaml, e.g. AXI outstanding depth)
+            'vip_options': (self.config.get('vip', {}) or {}).get(proto, {}) or {},
+            'clock_name': PROTOCOL_CLOCKS.get(proto, 'clk'),
+            'reset_name': PROTOCOL_RESETS.get(proto, 'resetn'),
         }
-        
-        if 'test_plan' in self.config:
-            context['test_plan'] = self.config['test_plan']
+
+    @staticmethod
+    def _vip_templates(proto):
+        """(template path, path inside vip/<proto>) of every VIP file of a protocol."""
+        src_dir = os.path.join("templates", "vip", proto)
+        templates = []
+        for root, dirs, files in os.walk(src_dir):
+            dirs.sort()
+            for file in sorted(files):
+                src_path = os.path.join(root, file)
+                templates.append((src_path, os.path.relpath(src_path, src_dir).replace("\\", "/")))
+        return templates
+
+    def copy_vip_files(self):
+        protocols = sorted(set(intf['protocol'] for intf in self.config['interfaces']))
 
         for proto in protocols:
-            # Add protocol-specific clock/reset to context
-            context['clock_name'] = PROTOCOL_CLOCKS.get(proto, 'clk')
-            context['reset_name'] = PROTOCOL_RESETS.get(proto, 'resetn')
-            
+            context = self._vip_context(proto)
             src_dir = os.path.join("templates", "vip", proto)
             dst_dir = os.path.join(self.output_dir, "vip", proto)
             
@@ -314,35 +547,184 @@ class Generator:
                 
             os.makedirs(dst_dir, exist_ok=True)
 
-            # Iterate over all files in the VIP template directory
-            for root, dirs, files in os.walk(src_dir):
-                 for file in files:
-                    src_path = os.path.join(root, file)
-                    # Compute relative path to maintain structure inside vip/{proto}
-                    rel_path = os.path.relpath(src_path, src_dir)
-                    dst_path = os.path.join(dst_dir, rel_path)
-                    
-                    # Ensure subdirectories exist
-                    os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                    
-                    # Render the file
-                    self._render_file(src_path, dst_path, context)
-    
-    def _render_file(self, src_path, dst_path, context):
+            # Render every file, keeping the structure inside vip/{proto}
+            for src_path, rel_path in self._vip_templates(proto):
+                dst_path = os.path.join(dst_dir, rel_path)
+                os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+                # Each job gets its own copy of the context
+                self._render_template(src_path, dst_path, dict(context))
+
+    def vip_library(self, proto):
+        """
+        Shared precompiled VIP library of a protocol, or None when disabled
+        (simulation.vip_library: false).
+
+        The rendered VIP files depend only on their templates and context
+        (widths, test plan, ...), so the library is keyed by a hash of those
+        inputs: every testbench with identical VIP sources uses the same
+        compiled library in the store (default .uvmgen_cache/vip, or the path
+        given by simulation.vip_library). run.tcl compiles it on first use.
+        """
+        store = (self.config.get('simulation', {}) or {}).get('vip_library', True)
+        if store is False:
+            return None
+        if store is True or store is None:
+            store = get_cache_dir("vip")
+        context = self._vip_context(proto)
+        h = hashlib.sha256(proto.encode('utf-8'))
+        for src_path, rel_path in self._vip_templates(proto):
+            source, _, _ = self.template_env.loader.get_source(self.template_env, template_name(src_path))
+            h.update(rel_path.encode('utf-8'))
+            h.update(self._hash_inputs(source, context).encode('utf-8'))
+        name = f"{proto}_a{context['ADDR_WIDTH']}_d{context['DATA_WIDTH']}_{h.hexdigest()[:12]}"
+        return {
+            'name': name,
+            'dir': os.path.abspath(os.path.join(store, name)).replace("\\", "/"),
+            'protocol': proto,
+            'ADDR_WIDTH': context['ADDR_WIDTH'],
+            'DATA_WIDTH': context['DATA_WIDTH'],
+            'key': h.hexdigest(),
+            'generator_version': GENERATOR_VERSION,
+        }
+
+    def _render_template(self, template_path, out_path, context):
+        """
+        Queue a render job for out_path.
+        In incremental mode, outputs whose inputs (template source, context,
+        generator version) match the manifest are not re-rendered at all.
+        """
+        job = {'template_path': template_path, 'out_path': out_path, 'context': context,
+               'name': template_name(template_path), 'phase': self.phase,
+               'input_hash': None, 'rendered': None, 'unchanged': False, 'error': None}
+        self.render_jobs.append(job)
         try:
-            # We need to load template relative to where Environment was initialized (Current Dir)
-            # src_path is like "templates/vip/apb/apb_driver.sv"
-            # Since FileSystemLoader is '.', we can just use src_path (forward slashes preferred)
-            src_path_normalized = src_path.replace("\\", "/") # Ensure jinja2 friendly path
-            
-            template = self.template_env.get_template(src_path_normalized)
-            rendered = template.render(context)
-            
-            with open(dst_path, "w") as f:
-                f.write(rendered)
-            print(f"[Generated] {dst_path}")
+            source, _, _ = self.template_env.loader.get_source(self.template_env, job['name'])
         except Exception as e:
-            print(f"[Error] Failed to render {src_path}: {e}")
+            job['error'] = e
+            return
+
+        job['input_hash'] = self._hash_inputs(source, context)
+        job['unchanged'] = self.incremental and self._is_up_to_date(out_path, job['input_hash'])
+
+    def _queue_output(self, out_path, rendered, input_hash):
+        """Queue an already rendered output (e.g. JSON) to be written in job order."""
+        self.render_jobs.append({'template_path': None, 'out_path': out_path, 'context': None,
+                                 'name': os.path.basename(out_path), 'phase': self.phase,
+                                 'input_hash': input_hash, 'rendered': rendered,
+                                 'unchanged': False, 'error': None})
+
+    def _run_render_jobs(self):
+        """
+        Render all queued jobs, then write them in queue order so logs and
+        the manifest are deterministic regardless of the worker count.
+        Rendering is CPU-bound, so jobs > 1 uses a process pool.
+        Errors are reported per file and do not stop the other outputs.
+        """
+        pending = [job for job in self.render_jobs
+                   if job['rendered'] is None and not job['unchanged'] and job['error'] is None]
+
+        if self.jobs > 1 and len(pending) > 1:
+            with span("render_pool", cat="pool", jobs=len(pending), workers=self.jobs), \
+                    ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_render_worker,
+                                        initargs=(TEMPLATE_DIR,)) as pool:
+                futures = [pool.submit(_render_in_worker, job['name'], job['context'])
+                           for job in pending]
+                for job, future in zip(pending, futures):
+                    try:
+                        job['rendered'], seconds = future.result()
+                        # Worker clocks differ from ours: log the duration ending now
+                        record_span(job['name'], seconds, cat="render", phase=job['phase'], worker=True)
+                    except Exception as e:
+                        job['error'] = e
+        else:
+            for job in pending:
+                try:
+                    with span(job['name'], cat="render", phase=job['phase']):
+                        template = self.template_env.get_template(job['name'])
+                        job['rendered'] = template.render(job['context'])
+                except Exception as e:
+                    job['error'] = e
+
+        for job in self.render_jobs:
+            if job['error'] is not None:
+                self.errors.append((job['out_path'], job['error']))
+                print(f"[Error] Failed to render {job['template_path']}: {job['error']}")
+            elif job['unchanged']:
+                self.skipped += 1
+                print(f"[Unchanged] {job['out_path']}")
+                with span(self._manifest_key(job['out_path']), cat="write", phase=job['phase'],
+                          status="unchanged"):
+                    pass
+            else:
+                with span(self._manifest_key(job['out_path']), cat="write", phase=job['phase']) as args:
+                    written = self._write_output(job['out_path'], job['rendered'], job['input_hash'])
+                    args['bytes'] = written
+                    args['status'] = "written" if written else "unchanged"
+        self.render_jobs = []
+
+    def _write_output(self, out_path, rendered, input_hash):
+        """
+        Write a generated file and record it in the manifest.
+        In incremental mode, byte-identical outputs are left untouched so
+        their mtimes keep downstream xvlog/xelab up-to-date checks valid.
+        Returns the number of bytes written (0 when left untouched).
+        """
+        data = rendered.encode('utf-8')
+        output_hash = hashlib.sha256(data).hexdigest()
+        written = 0
+        if self.incremental and self._file_hash(out_path) == output_hash:
+            self.skipped += 1
+            print(f"[Unchanged] {out_path}")
+        else:
+            with open(out_path, "w") as f:
+                f.write(rendered)
+            self.written += 1
+            written = len(data)
+            print(f"[Generated] {out_path}")
+
+        self.manifest[self._manifest_key(out_path)] = {'inputs': input_hash, 'output': output_hash}
+        return written
+
+    def _hash_inputs(self, source, context=None):
+        h = hashlib.sha256()
+        h.update(GENERATOR_VERSION.encode('utf-8'))
+        h.update(source.encode('utf-8'))
+        h.update(json.dumps(context, sort_keys=True, default=str).encode('utf-8'))
+        return h.hexdigest()
+
+    def _file_hash(self, path):
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return hashlib.sha256(f.read().encode('utf-8')).hexdigest()
+
+    def _manifest_key(self, out_path):
+        return os.path.relpath(out_path, self.output_dir).replace("\\", "/")
+
+    def _is_up_to_date(self, out_path, input_hash):
+        entry = self.manifest.get(self._manifest_key(out_path))
+        if not entry or entry.get('inputs') != input_hash:
+            return False
+        # Guard against outputs edited or deleted since the last run
+        return self._file_hash(out_path) == entry.get('output')
+
+    def _load_manifest(self):
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != GENERATOR_VERSION:
+            return {}
+        return manifest.get('files', {})
+
+    def _save_manifest(self):
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        with open(path, "w") as f:
+            json.dump({'version': GENERATOR_VERSION, 'files': self.manifest}, f, indent=2, sort_keys=True)
 
     def _build_port_maps(self, interfaces):
         """
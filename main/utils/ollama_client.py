@@ -0,0 +1,158 @@
+"""
+Ollama HTTP Client
+
+Talks to the local Ollama server (POST /api/generate) instead of spawning
+`ollama run` per prompt:
+
+- Keep-alive HTTP connections are pooled and reused between prompts
+- Tokens are streamed; generation stops as soon as the ```yaml block closes
+- `keep_alive` keeps the model loaded between calls
+
+Only the standard library is used (http.client, json).
+"""
+
+import json
+import os
+import queue
+import threading
+import http.client
+from urllib.parse import urlparse
+
+from .profiler import instant
+
+DEFAULT_HOST = "http://127.0.0.1:11434"
+DEFAULT_KEEP_ALIVE = "30m"
+
+
+class OllamaError(Exception):
+    pass
+
+
+class YamlFenceScanner:
+    """
+    Incrementally detects a complete fenced YAML block in streamed text.
+    Fences may be split across chunks, so scanning works on the accumulated text.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._body_start = None
+        self._scan_from = 0
+
+    def feed(self, chunk):
+        """Append a chunk; returns True once the closing fence has arrived."""
+        self.text += chunk
+        if self._body_start is None:
+            start = self.text.find("```")
+            if start == -1:
+                return False
+            line_end = self.text.find("\n", start)
+            if line_end == -1:
+                return False  # still receiving the fence's info string (e.g. "yaml")
+            self._body_start = self._scan_from = line_end + 1
+        end = self.text.find("```", self._scan_from)
+        if end == -1:
+            # A fence can straddle chunks: rescan the last two characters next time
+            self._scan_from = max(self._body_start, len(self.text) - 2)
+            return False
+        return True
+
+
+class OllamaClient:
+    def __init__(self, host=None, keep_alive=DEFAULT_KEEP_ALIVE, timeout=120, pool_size=4):
+        url = urlparse(host or os.environ.get("OLLAMA_HOST", DEFAULT_HOST))
+        if not url.scheme:
+            url = urlparse(f"http://{host or os.environ.get('OLLAMA_HOST')}")
+        self.host = url.hostname or "127.0.0.1"
+        self.port = url.port or 11434
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _release(self, conn):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def generate(self, model, prompt, stop_at_fence=True, on_token=None):
+        """
+        Stream a completion and return the generated text.
+
+        With stop_at_fence, reading stops once a fenced block has closed; the
+        connection is then dropped (which also aborts generation server-side)
+        instead of being returned to the pool.
+        """
+        body = json.dumps({
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+        })
+        scanner = YamlFenceScanner()
+
+        for attempt in range(2):
+            conn = self._acquire()
+            try:
+                conn.request("POST", "/api/generate", body=body,
+                             headers={"Content-Type": "application/json"})
+                resp = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                # Pooled connection closed by the server: retry once on a fresh one
+                conn.close()
+                if attempt == 1:
+                    raise OllamaError(f"Ollama request failed: {e}") from e
+                instant("reconnect", cat="llm", error=str(e))
+
+        if resp.status != 200:
+            detail = resp.read().decode("utf-8", errors="replace")
+            conn.close()
+            raise OllamaError(f"Ollama returned HTTP {resp.status}: {detail}")
+
+        finished = False
+        try:
+            for line in iter(resp.readline, b""):
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if "error" in event:
+                    raise OllamaError(event["error"])
+                token = event.get("response", "")
+                if on_token and token:
+                    on_token(token)
+                if scanner.feed(token) and stop_at_fence:
+                    break
+                if event.get("done"):
+                    finished = True
+                    break
+        except (ValueError, http.client.HTTPException) as e:
+            # Malformed NDJSON line or a stream cut off mid-chunk
+            raise OllamaError(f"Ollama stream broken: {e}") from e
+        finally:
+            if finished:
+                resp.read()  # drain so the connection can be reused
+                self._release(conn)
+            else:
+                conn.close()
+
+        return scanner.text
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client (shares the connection pool across prompts and threads)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+    return _client
@@ -0,0 +1,200 @@
+"""
+Rule-based DUT Port Mapper
+
+Maps DUT ports onto the standard VIP signal names of vip_signals.yaml without
+an LLM. Each DUT port name is normalized (lower case, common prefixes such as
+i_ / o_ / s_axi_ and suffixes such as _i / x stripped) and looked up in a
+per-protocol alias index built from the standard names:
+
+    HCLK         -> hclk     (exact)
+    i_paddr      -> paddr    (prefix stripped)
+    s_axi_awaddr -> awaddr   (prefix stripped)
+    HSELx        -> hsel     (suffix stripped)
+    rst_n        -> presetn  (synonym)
+    rdata        -> prdata   (protocol letter added)
+
+Candidates are checked against the port direction (slave or master view) and
+the width of 1-bit control signals. Ports that cannot be resolved are
+returned separately so only those need to be asked of the LLM.
+"""
+
+# Common DUT port-name decorations, longest first
+PORT_PREFIXES = ('s00_axi_', 's_axil_', 's_axi_', 'm_axi_', 's_ahb_', 's_apb_',
+                 'axi_', 'ahb_', 'apb_', 'io_', 'i_', 'o_', 's_', 'm_')
+PORT_SUFFIXES = ('_in', '_out', '_i', '_o')
+
+# Letter that prefixes the standard names (paddr, haddr); AXI only uses it on aclk/aresetn
+PROTOCOL_LETTER = {'apb': 'p', 'ahb': 'h', 'axi': 'a'}
+
+# Synonyms of the letter-less base names (clock/reset apply to every protocol)
+BASE_SYNONYMS = {
+    'clk':    ('clk', 'clock'),
+    'resetn': ('resetn', 'reset_n', 'rstn', 'rst_n', 'nreset', 'nrst', 'rst_b', 'reset_b'),
+    'sel':    ('sel', 'cs'),
+    'write':  ('write', 'wr', 'we'),
+    'wdata':  ('wdata', 'din', 'data_in'),
+    'rdata':  ('rdata', 'dout', 'data_out'),
+    'slverr': ('slverr', 'err', 'error'),
+}
+
+# Signals driven by the DUT when it is the slave (everything else is an input)
+SLAVE_OUTPUTS = {
+    'apb': {'pready', 'prdata', 'pslverr'},
+    'ahb': {'hrdata', 'hready', 'hresp'},
+    'axi': {'awready', 'wready', 'bresp', 'bvalid', 'arready',
+            'rdata', 'rresp', 'rlast', 'rvalid'},
+}
+
+# Base names of 1-bit control signals
+ONE_BIT_BASES = ('clk', 'resetn', 'sel', 'enable', 'write', 'ready', 'valid', 'last', 'slverr')
+
+MATCH_EXACT = 3
+MATCH_STRIPPED = 2
+MATCH_SYNONYM = 1
+
+# A protocol is only accepted with at least this many mapped ports
+MIN_MAPPED_PORTS = 3
+
+
+def base_name(protocol, signal):
+    """paddr -> addr, hsel -> sel, aclk -> clk; other AXI names are already bases."""
+    letter = PROTOCOL_LETTER.get(protocol, '')
+    if protocol == 'axi':
+        return signal[1:] if signal in ('aclk', 'aresetn') else signal
+    return signal[len(letter):] if letter and signal.startswith(letter) else signal
+
+
+def build_signal_index(vip_signals):
+    """
+    {protocol: {alias: (signal, quality)}} from the vip_signals.yaml contents.
+    """
+    index = {}
+    for protocol, info in vip_signals.items():
+        aliases = {}
+        for signal in info.get('signals', []):
+            base = base_name(protocol, signal)
+            aliases.setdefault(signal, (signal, MATCH_EXACT))
+            aliases.setdefault(base, (signal, MATCH_STRIPPED))
+            for synonym in BASE_SYNONYMS.get(base, ()):
+                aliases.setdefault(synonym, (signal, MATCH_SYNONYM))
+        index[protocol] = aliases
+    return index
+
+
+def name_candidates(port_name):
+    """Normalized spellings of a DUT port name, most literal first."""
+    name = port_name.lower()
+    candidates = [name]
+
+    stripped = name
+    for prefix in PORT_PREFIXES:
+        if stripped.startswith(prefix) and len(stripped) > len(prefix):
+            stripped = stripped[len(prefix):]
+            break
+    for suffix in PORT_SUFFIXES:
+        if stripped.endswith(suffix) and len(stripped) > len(suffix):
+            stripped = stripped[:-len(suffix)]
+            break
+    candidates.append(stripped)
+
+    # HSELx / PSELx style slave-select suffix
+    for cand in list(candidates):
+        if cand.endswith('x') and len(cand) > 1:
+            candidates.append(cand[:-1])
+    return list(dict.fromkeys(candidates))
+
+
+def _lookup(protocol, aliases, port_name):
+    """Best (signal, quality) for a port name, or None."""
+    letter = PROTOCOL_LETTER.get(protocol, '')
+    best = None
+    for cand in name_candidates(port_name):
+        hits = [aliases.get(cand)]
+        # 'haddr' on an AHB DUT: also try without the protocol letter
+        if protocol != 'axi' and letter and cand.startswith(letter):
+            hits.append(aliases.get(cand[len(letter):]))
+        for hit in hits:
+            if hit and (best is None or hit[1] > best[1]):
+                best = hit
+    return best
+
+
+def _direction_ok(protocol, signal, direction, dut_is_slave):
+    if direction not in ('input', 'output'):
+        return True  # inout / unknown: don't reject
+    if base_name(protocol, signal) in ('clk', 'resetn'):
+        return direction == 'input'  # driven by the testbench in either role
+    slave_output = signal in SLAVE_OUTPUTS.get(protocol, ())
+    dut_drives = slave_output if dut_is_slave else not slave_output
+    return (direction == 'output') == dut_drives
+
+
+def _width_ok(protocol, signal, width):
+    if width is None:
+        return True
+    if base_name(protocol, signal).endswith(ONE_BIT_BASES):
+        return width == 1
+    return True
+
+
+def map_protocol(protocol, aliases, ports):
+    """
+    Map ports onto one protocol.
+
+    Returns:
+        dict with 'protocol', 'type' (DUT role), 'port_map' {dut_port: signal},
+        'unresolved' [dut_port] and 'missing' [signal]
+    """
+    # Name matches first, then decide whether the DUT acts as slave or master
+    named = []
+    for port in ports:
+        hit = _lookup(protocol, aliases, port['name'])
+        if hit:
+            named.append((port, hit[0], hit[1]))
+
+    slave_votes = sum(1 for port, signal, _ in named
+                      if _direction_ok(protocol, signal, port.get('direction'), True))
+    master_votes = sum(1 for port, signal, _ in named
+                       if _direction_ok(protocol, signal, port.get('direction'), False))
+    dut_is_slave = slave_votes >= master_votes
+
+    # Keep the best-quality port per signal (first port wins ties)
+    chosen = {}
+    for port, signal, quality in named:
+        if not _direction_ok(protocol, signal, port.get('direction'), dut_is_slave):
+            continue
+        if not _width_ok(protocol, signal, port.get('width')):
+            continue
+        if signal not in chosen or quality > chosen[signal][1]:
+            chosen[signal] = (port['name'], quality)
+
+    mapped_ports = {name: signal for signal, (name, _) in chosen.items()}
+    port_map = {p['name']: mapped_ports[p['name']] for p in ports if p['name'] in mapped_ports}
+    all_signals = list(dict.fromkeys(signal for signal, _ in aliases.values()))
+    return {
+        'protocol': protocol,
+        'type': 'slave' if dut_is_slave else 'master',
+        'port_map': port_map,
+        'unresolved': [p['name'] for p in ports if p['name'] not in port_map],
+        'missing': [s for s in all_signals if s not in chosen],
+    }
+
+
+def map_ports(ports, vip_signals, protocol=None):
+    """
+    Map resolved DUT ports ([{'name', 'direction', 'width'}]) to a VIP protocol.
+    The protocol with the most mapped ports wins unless one is given.
+    Returns the map_protocol() result, or None if no protocol fits or the
+    best two protocols map equally many ports (e.g. plain addr/wdata/rdata).
+    """
+    index = build_signal_index(vip_signals)
+    protocols = [protocol] if protocol else sorted(index)
+
+    results = [map_protocol(proto, index[proto], ports) for proto in protocols if proto in index]
+    results.sort(key=lambda r: len(r['port_map']), reverse=True)
+
+    if not results or len(results[0]['port_map']) < MIN_MAPPED_PORTS:
+        return None
+    if len(results) > 1 and len(results[1]['port_map']) == len(results[0]['port_map']):
+        return None
+    return results[0]
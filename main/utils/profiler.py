@@ -0,0 +1,262 @@
+"""
+Run Instrumentation (--trace-json / --profile)
+
+Code marks work with span(name, cat, **args); the span yields its args dict
+so results (bytes written, response size, ...) can be attached before it
+closes. Spans are only recorded once tracing is enabled, otherwise span()
+returns a shared no-op, so the instrumentation costs nothing in normal runs.
+
+Categories used in this project:
+    config  one config of a --batch / --matrix run
+    phase   Generator steps (prepare_output_dir, copy_vip_files, ...)
+    render  one template render (args: phase; worker when rendered in the pool)
+    pool    a parallel render batch
+    write   one output file (args: phase, bytes, status)
+    plan    planner entry points / retry attempts
+    llm     one LLM request (args: backend, prompt_chars, response_chars)
+
+Recorded spans are written as Chrome trace JSON ("X" complete events, one
+lane per thread), viewable in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import os
+import json
+import time
+import pstats
+import cProfile
+import threading
+
+# Functions listed by --profile
+PROFILE_TOP = 25
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, recorder, name, cat, args):
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.args
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.recorder.complete(self.name, self.cat, self.start, end, self.args)
+        return False
+
+
+class _NullSpan:
+    """Returned by span() while tracing is off."""
+
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceRecorder:
+    def __init__(self, name="run"):
+        self.name = name
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.events = []
+        self._lock = threading.Lock()
+
+    def span(self, name, cat="phase", **args):
+        return _Span(self, name, cat, args)
+
+    def complete(self, name, cat, start, end, args=None):
+        """Record a finished span (perf_counter start/end in seconds)."""
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': "X",
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': args or {},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def instant(self, name, cat="event", **args):
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': "i",
+            's': "t",
+            'ts': round((time.perf_counter() - self.origin) * 1e6, 1),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def totals(self, cat):
+        """{name: {'count', 'ms'}} of the spans of one category, in first-seen order."""
+        totals = {}
+        for event in self.events:
+            if event['cat'] != cat or event['ph'] != "X":
+                continue
+            entry = totals.setdefault(event['name'], {'count': 0, 'ms': 0.0})
+            entry['count'] += 1
+            entry['ms'] += event['dur'] / 1000
+        return totals
+
+    def write_totals(self):
+        """{phase: {'files', 'bytes', 'unchanged'}} from the write spans."""
+        totals = {}
+        for event in self.events:
+            if event['cat'] != "write":
+                continue
+            args = event['args']
+            entry = totals.setdefault(args.get('phase', "?"), {'files': 0, 'bytes': 0, 'unchanged': 0})
+            if args.get('status') == "unchanged":
+                entry['unchanged'] += 1
+            else:
+                entry['files'] += 1
+                entry['bytes'] += args.get('bytes', 0)
+        return totals
+
+    def render_totals(self):
+        """{phase: ms} of the template renders, and the wall time they took."""
+        totals = {}
+        wall = 0.0
+        for event in self.events:
+            if event['cat'] == "pool" and event['ph'] == "X":
+                wall += event['dur'] / 1000
+            if event['cat'] != "render" or event['ph'] != "X":
+                continue
+            phase = event['args'].get('phase', "?")
+            totals[phase] = totals.get(phase, 0.0) + event['dur'] / 1000
+            if not event['args'].get('worker'):
+                wall += event['dur'] / 1000
+        return totals, wall
+
+    def print_summary(self):
+        phases = self.totals("phase")
+        if phases:
+            writes = self.write_totals()
+            # Steps only queue render jobs; their renders run inside
+            # render_and_write, so move that time to the step's own row
+            # (summed worker time with -j > 1)
+            renders, render_wall = self.render_totals()
+            print(f"\n[Profile] {'Phase':<24} {'Time(ms)':>9} {'Render(ms)':>10} {'Files':>6} "
+                  f"{'Bytes':>9} {'Unchanged':>9}")
+            for name, entry in phases.items():
+                w = writes.get(name, {'files': 0, 'bytes': 0, 'unchanged': 0})
+                render_ms = renders.get(name, 0.0)
+                ms = entry['ms'] + render_ms
+                if name == "render_and_write":
+                    ms = max(entry['ms'] - render_wall, 0.0)
+                print(f"[Profile] {name:<24} {ms:>9.2f} {render_ms:>10.2f} {w['files']:>6} "
+                      f"{w['bytes']:>9} {w['unchanged']:>9}")
+
+        renders = self.totals("render")
+        if renders:
+            slowest = sorted(renders.items(), key=lambda kv: kv[1]['ms'], reverse=True)[:5]
+            total = sum(entry['ms'] for entry in renders.values())
+            count = sum(entry['count'] for entry in renders.values())
+            print(f"[Profile] {count} template render(s), {total:.2f} ms; slowest: "
+                  + ", ".join(f"{name} {entry['ms']:.2f}ms" for name, entry in slowest))
+
+        llm = [e for e in self.events if e['cat'] == "llm" and e['ph'] == "X"]
+        if llm:
+            total = sum(e['dur'] for e in llm) / 1000
+            chars = sum(e['args'].get('response_chars', 0) for e in llm)
+            reconnects = sum(1 for e in self.events if e['cat'] == "llm" and e['name'] == "reconnect")
+            print(f"[Profile] {len(llm)} LLM call(s), {total:.1f} ms, {chars} response chars, "
+                  f"{reconnects} reconnect(s)")
+        attempts = [e for e in self.events if e['cat'] == "plan" and e['name'] == "attempt"]
+        if attempts:
+            retries = sum(1 for e in attempts if e['args'].get('attempt', 1) > 1)
+            print(f"[Profile] {len(attempts)} planning attempt(s), {retries} retry(ies)")
+
+    def write_chrome_trace(self, path):
+        with self._lock:
+            events = list(self.events)
+        thread_names = [{'name': "thread_name", 'ph': "M", 'pid': self.pid, 'tid': tid,
+                         'args': {'name': "main" if tid == threading.main_thread().ident else f"worker-{i}"}}
+                        for i, tid in enumerate(dict.fromkeys(e['tid'] for e in events))]
+        trace = {
+            'traceEvents': [{'name': "process_name", 'ph': "M", 'pid': self.pid, 'tid': 0,
+                             'args': {'name': self.name}}] + thread_names + events,
+            'displayTimeUnit': "ms",
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(trace, f)
+
+
+_recorder = None
+
+
+def enable_tracing(name="run"):
+    """Start recording spans in this process; returns the recorder."""
+    global _recorder
+    _recorder = TraceRecorder(name)
+    return _recorder
+
+
+def get_recorder():
+    return _recorder
+
+
+def span(name, cat="phase", **args):
+    """Context manager timing a block; yields a dict for result args."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _recorder.span(name, cat, **args)
+
+
+def record_span(name, seconds, cat="phase", **args):
+    """Record a span measured elsewhere (e.g. in a worker process) as ending now."""
+    if _recorder is not None:
+        end = time.perf_counter()
+        _recorder.complete(name, cat, end - seconds, end, args)
+
+
+def instant(name, cat="event", **args):
+    if _recorder is not None:
+        _recorder.instant(name, cat, **args)
+
+
+def run_instrumented(func, name, trace_json=None, profile=None):
+    """
+    Run func() with span recording and, when profile is not None, under
+    cProfile (profile == "": print the top functions only; otherwise also
+    save the stats to that path for snakeviz / pstats). The phase summary and
+    trace file are written even when func() exits via sys.exit().
+    """
+    recorder = enable_tracing(name)
+    profiler = cProfile.Profile() if profile is not None else None
+    try:
+        if profiler:
+            profiler.enable()
+        with recorder.span(name, cat="run"):
+            return func()
+    finally:
+        if profiler:
+            profiler.disable()
+            print(f"\n[Profile] Top {PROFILE_TOP} functions by cumulative time:")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_TOP)
+            if profile:
+                profiler.dump_stats(profile)
+                print(f"[Profile] cProfile stats saved to {profile}")
+        recorder.print_summary()
+        if trace_json:
+            recorder.write_chrome_trace(trace_json)
+            print(f"[Profile] Chrome trace saved to {trace_json} (open in chrome://tracing or ui.perfetto.dev)")
@@ -0,0 +1,144 @@
+"""
+Spec Prompt Compaction
+
+Verilog pasted into a planner spec is replaced by a compact interface summary
+before it goes into the LLM prompt: the module header is re-emitted from the
+parsed ports and parameters (with evaluated widths), module bodies are
+dropped except for memory array declarations such as
+`reg [31:0] memory [0:1023];`. The prompt size then depends on the number of
+ports, not on the RTL size.
+
+Pasted code is often not terminated by `endmodule`; in that case the body
+ends at the first line that does not look like Verilog.
+
+Token counts are estimates (no tokenizer is available offline): roughly one
+token per 4 characters of ASCII words and one per other symbol/character.
+"""
+
+import re
+
+from .verilog_parser import (parse_verilog_source, resolve_module, find_header_end,
+                             MODULE_START_RE, ENDMODULE_RE)
+
+_MEMORY_DECL_RE = re.compile(
+    r'^[ \t]*(?:reg|logic|bit)\b[^;\n]*?\w+\s*\[[^\]\n]*\]\s*;[^\n]*', re.MULTILINE)
+_CODE_LINE_RE = re.compile(
+    r'^\s*(?:$|//|/\*|\*|`'
+    r'|(?:reg|wire|logic|bit|integer|genvar|localparam|parameter|assign|always\w*|initial'
+    r'|if|else|case\w*|end\w*|begin|for|generate|input|output|inout|function|task|default)\b)'
+    r'|[;,()]\s*(?://.*)?$'
+    r'|\b(?:begin|end)\s*$'
+)
+_TOKEN_ESTIMATE_RE = re.compile(r'[A-Za-z0-9_]+|\S')
+
+# Memory declarations kept per module
+MAX_MEMORY_DECLS = 8
+
+
+def estimate_tokens(text):
+    """Approximate LLM token count of a text."""
+    count = 0
+    for piece in _TOKEN_ESTIMATE_RE.findall(text):
+        if piece[0].isascii() and (piece[0].isalnum() or piece[0] == '_'):
+            count += (len(piece) + 3) // 4
+        else:
+            count += 1
+    return count
+
+
+def _body_end(text, header_end):
+    """End of the module body: after endmodule, or before the first prose line."""
+    end_m = ENDMODULE_RE.search(text, header_end)
+    next_module = MODULE_START_RE.search(text, header_end)
+    if end_m and (next_module is None or end_m.start() < next_module.start()):
+        return end_m.end()
+
+    pos = header_end
+    limit = next_module.start() if next_module else len(text)
+    while pos < limit:
+        line_end = text.find('\n', pos)
+        line_end = limit if line_end == -1 or line_end > limit else line_end
+        if not _CODE_LINE_RE.search(text[pos:line_end]):
+            break
+        pos = line_end + 1
+    return min(pos, limit)
+
+
+def _expr(tokens):
+    return "".join(tok[1] for tok in tokens)
+
+
+def summarize_module(module, memory_decls):
+    """Verilog-like interface summary of a parsed module."""
+    params, ports = resolve_module(module)
+    widths = {p['name']: p['width'] for p in ports}
+
+    lines = [f"// module {module['name']}: interface summary (body omitted)"]
+    header_params = [p for p in module['params'] if not p['local']]
+    if header_params:
+        lines.append(f"module {module['name']} #(")
+        lines.append(",\n".join(f"    parameter {p['name']} = {_expr(p['expr'])}" for p in header_params))
+        lines.append(") (")
+    else:
+        lines.append(f"module {module['name']} (")
+
+    last = len(module['ports']) - 1
+    for i, port in enumerate(module['ports']):
+        rng = f"[{_expr(port['msb'])}:{_expr(port['lsb'])}] " if port['msb'] is not None else ""
+        sep = "," if i < last else ""
+        width = widths.get(port['name'])
+        # Evaluated width only where the range is an expression
+        literal = port['msb'] is None or all(tok[0] == 'number' for tok in port['msb'])
+        note = f"  // {width} bit" if not literal and width is not None else ""
+        lines.append(f"    {port['direction']:<6} {rng}{port['name']}{sep}{note}")
+    lines.append(");")
+
+    for decl in memory_decls[:MAX_MEMORY_DECLS]:
+        lines.append("    " + decl.strip())
+    lines.append("endmodule")
+    return "\n".join(lines)
+
+
+def compact_spec(text):
+    """
+    Replace pasted Verilog modules in a spec with interface summaries.
+
+    Returns:
+        (compacted_text, stats) where stats holds 'modules', 'tokens_before'
+        and 'tokens_after' (estimated).
+    """
+    pieces = []
+    pos = 0
+    modules = 0
+    for m in MODULE_START_RE.finditer(text):
+        if m.start() < pos:
+            continue  # inside a module already replaced
+        header_end = find_header_end(text, m.start())
+        if header_end < 0:
+            continue
+        body_end = _body_end(text, header_end)
+        span = text[m.start():body_end]
+
+        source = span if ENDMODULE_RE.search(span) else span + "\nendmodule\n"
+        parsed = parse_verilog_source(source)
+        if not parsed:
+            continue
+        module = next(iter(parsed.values()))
+        memory_decls = _MEMORY_DECL_RE.findall(text, header_end, body_end)
+        summary = summarize_module(module, memory_decls) + "\n"
+        if estimate_tokens(summary) >= estimate_tokens(span):
+            continue  # already compact (header only): keep the original text
+
+        pieces.append(text[pos:m.start()])
+        pieces.append(summary)
+        pos = body_end
+        modules += 1
+    pieces.append(text[pos:])
+
+    compacted = "".join(pieces)
+    stats = {
+        'modules': modules,
+        'tokens_before': estimate_tokens(text),
+        'tokens_after': estimate_tokens(compacted),
+    }
+    return compacted, stats
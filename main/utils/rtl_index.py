@@ -0,0 +1,411 @@
+"""
+RTL Module Index
+
+Persistent module -> file / parameters / ports index for large RTL trees, so
+the generator and planner can resolve the DUT top without re-reading sources.
+
+- Sources may be files, directories (*.v, *.sv searched recursively) or
+  `.f` filelists (+incdir+, -f/-F nesting, -v library files, $VAR expansion)
+- Files are scanned through mmap: the scanner jumps from `module` to the end
+  of its header and then to `endmodule`, so large bodies (gate-level netlists)
+  are never tokenized. For non-ANSI headers only the leading declarations are
+  read, stopping once every header port has a direction.
+- Results live in SQLite (.uvmgen_cache/rtl/index.sqlite) and are refreshed
+  per file when its mtime or size changes.
+
+Usage:
+    python -m main.utils.rtl_index scan rtl/ top.f
+    python -m main.utils.rtl_index lookup axi_slave_top [--param DATA_WIDTH=64]
+"""
+
+import re
+import os
+import json
+import mmap
+import sqlite3
+import argparse
+
+from .cache import get_cache_dir
+from .verilog_parser import (parse_verilog_source, resolve_module, infer_widths, find_header_end,
+                             MODULE_START_RE_BYTES, ENDMODULE_RE_BYTES, PARSER_VERSION)
+
+INDEX_VERSION = f"1.{PARSER_VERSION}"
+RTL_EXTENSIONS = ('.v', '.sv')
+# Bodies larger than this are not copied/cleaned before scanning declarations
+MAX_CLEANED_BODY = 1 << 20
+
+_BLOCK_RE = re.compile(rb'\b(function|task)\b.*?\bend\1\b', re.DOTALL)
+_DECL_RE = re.compile(rb'\b(input|output|inout|parameter|localparam)\b[^;]*;')
+_COMMENT_RE = re.compile(rb'//[^\n]*|/\*.*?\*/', re.DOTALL)
+_IDENT_RE = re.compile(rb'[A-Za-z_][\w$]*')
+# Compile-order dependencies (see source_dependencies)
+_INCLUDE_RE = re.compile(rb'^[ \t]*`include\s+"([^"]+)"', re.MULTILINE)
+_PACKAGE_RE = re.compile(rb'^[ \t]*package\s+(?:automatic\s+|static\s+)?([A-Za-z_]\w*)', re.MULTILINE)
+_SCOPE_RE = re.compile(rb'\b([A-Za-z_]\w*)::')
+
+
+# ---------------------------------------------------------------------------
+# Filelists
+# ---------------------------------------------------------------------------
+
+def _expand_vars(text):
+    return os.path.expandvars(text)
+
+
+def read_filelist(path, files=None, incdirs=None, _seen=None):
+    """
+    Expand a .f filelist into (files, incdirs).
+    Relative paths are resolved against the filelist's directory.
+    """
+    files = [] if files is None else files
+    incdirs = [] if incdirs is None else incdirs
+    _seen = set() if _seen is None else _seen
+
+    path = os.path.abspath(path)
+    if path in _seen:
+        return files, incdirs
+    _seen.add(path)
+    base = os.path.dirname(path)
+
+    def resolve(p):
+        p = _expand_vars(p)
+        return p if os.path.isabs(p) else os.path.normpath(os.path.join(base, p))
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for raw_line in f:
+            line = raw_line.split('//', 1)[0].split('#', 1)[0].strip()
+            if not line:
+                continue
+            tokens = line.split()
+            i = 0
+            while i < len(tokens):
+                tok = tokens[i]
+                if tok.startswith('+incdir+'):
+                    incdirs.extend(resolve(d) for d in tok[len('+incdir+'):].split('+') if d)
+                elif tok in ('-f', '-F') and i + 1 < len(tokens):
+                    i += 1
+                    read_filelist(resolve(tokens[i]), files, incdirs, _seen)
+                elif tok == '-v' and i + 1 < len(tokens):
+                    i += 1
+                    files.append(resolve(tokens[i]))
+                elif tok in ('-y', '-i') and i + 1 < len(tokens):
+                    i += 1
+                    if tok == '-i':
+                        incdirs.append(resolve(tokens[i]))
+                elif tok.startswith(('+', '-')):
+                    pass  # +define+, +libext+ and other tool options
+                else:
+                    files.append(resolve(tok))
+                i += 1
+    return files, incdirs
+
+
+def expand_sources(sources, base_dir='.'):
+    """
+    Expand source entries (files, directories, .f filelists) into
+    (files, incdirs), preserving order and dropping duplicates.
+    """
+    files, incdirs = [], []
+    for src in sources:
+        path = os.path.join(base_dir, _expand_vars(src))
+        if src.endswith('.f'):
+            read_filelist(path, files, incdirs)
+        elif os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(RTL_EXTENSIONS))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files)), list(dict.fromkeys(incdirs))
+
+
+def source_dependencies(path, incdirs=()):
+    """
+    Compile-order dependencies of one source file:
+    {'includes': [...], 'packages': [...], 'imports': [...]}.
+
+    `include files are followed recursively and resolved against the
+    including file's directory, then incdirs; unresolved ones (e.g.
+    uvm_macros.svh from the simulator) are left out. 'packages' are the
+    packages the file defines, 'imports' every `pkg::` scope it references.
+    """
+    includes, packages, imports = [], set(), set()
+    pending, seen = [path], {os.path.normpath(path)}
+    while pending:
+        current = pending.pop(0)
+        try:
+            with open(current, 'rb') as f:
+                text = _COMMENT_RE.sub(b' ', f.read())
+        except OSError:
+            continue
+        packages.update(m.decode() for m in _PACKAGE_RE.findall(text))
+        imports.update(m.decode() for m in _SCOPE_RE.findall(text))
+        for name in _INCLUDE_RE.findall(text):
+            name = name.decode()
+            for base in (os.path.dirname(current), *incdirs):
+                candidate = os.path.normpath(os.path.join(base, name))
+                if os.path.isfile(candidate):
+                    if candidate not in seen:
+                        seen.add(candidate)
+                        includes.append(candidate)
+                        pending.append(candidate)
+                    break
+    return {'includes': includes, 'packages': sorted(packages), 'imports': sorted(imports - packages)}
+
+
+# ---------------------------------------------------------------------------
+# Header scanning
+# ---------------------------------------------------------------------------
+
+def _header_port_names(header):
+    """Identifiers in a non-ANSI header port list: module m #(...) (a, b, c);"""
+    header = _COMMENT_RE.sub(b' ', header)
+    close = header.rfind(b')')
+    depth = 0
+    open_pos = -1
+    for i in range(close, -1, -1):
+        c = header[i:i + 1]
+        if c == b')':
+            depth += 1
+        elif c == b'(':
+            depth -= 1
+            if depth == 0:
+                open_pos = i
+                break
+    if open_pos < 0:
+        return set()
+    return set(_IDENT_RE.findall(header[open_pos + 1:close]))
+
+
+def scan_modules(path):
+    """
+    Scan one file for module interfaces without tokenizing module bodies.
+    Returns {module_name: interface} in the verilog_parser format.
+    """
+    modules = {}
+    if os.path.getsize(path) == 0:
+        return modules
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        size = len(buf)
+        pos = 0
+        while True:
+            m = MODULE_START_RE_BYTES.search(buf, pos)
+            if m is None:
+                break
+            end_m = ENDMODULE_RE_BYTES.search(buf, m.end())
+            body_limit = end_m.start() if end_m else size
+            header_end = find_header_end(buf, m.start(), body_limit)
+            if header_end < 0:
+                pos = m.end()
+                continue
+
+            header = buf[m.start():header_end]
+            parsed = parse_verilog_source((header + b'\nendmodule\n').decode('utf-8', errors='ignore'))
+            if parsed:
+                module = next(iter(parsed.values()))
+                # ANSI ports are sized by header parameters only; non-ANSI
+                # ports need their body declarations
+                if module['port_order'] and not module['ports']:
+                    _scan_non_ansi_decls(buf, header_end, body_limit, header, module)
+                modules[module['name']] = module
+            pos = end_m.end() if end_m else size
+    return modules
+
+
+def _decl_statements(buf, start, limit):
+    """Declaration statements in a module body, skipping function/task blocks."""
+    if limit - start > MAX_CLEANED_BODY:
+        # Very large body (netlist): stream declarations straight from the mmap
+        for m in _DECL_RE.finditer(buf, start, limit):
+            yield m.group()
+        return
+    body = _BLOCK_RE.sub(b' ', _COMMENT_RE.sub(b' ', buf[start:limit]))
+    for m in _DECL_RE.finditer(body):
+        yield m.group()
+
+
+def _scan_non_ansi_decls(buf, start, limit, header, module):
+    """Read body declarations until every header port has a direction."""
+    wanted = {name.decode() for name in _header_port_names(header)}
+    decls = []
+    declared = set()
+    for stmt in _decl_statements(buf, start, limit):
+        decls.append(stmt)
+        if not stmt.lstrip().startswith((b'parameter', b'localparam')):
+            names = {n.decode() for n in _IDENT_RE.findall(stmt.split(b']')[-1])}
+            declared |= names & wanted
+            if declared >= wanted:
+                break
+
+    source = (header + b'\n' + b'\n'.join(decls) + b'\nendmodule\n').decode('utf-8', errors='ignore')
+    parsed = parse_verilog_source(source).get(module['name'])
+    if parsed:
+        module['params'] = parsed['params']
+        module['ports'] = [p for p in parsed['ports'] if p['name'] in wanted]
+
+
+# ---------------------------------------------------------------------------
+# SQLite index
+# ---------------------------------------------------------------------------
+
+class RtlIndex:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_cache_dir("rtl"), "index.sqlite")
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta    (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS files   (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+            CREATE TABLE IF NOT EXISTS modules (name TEXT, path TEXT, interface TEXT,
+                                                PRIMARY KEY (name, path));
+            CREATE INDEX IF NOT EXISTS modules_by_path ON modules (path);
+        """)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != INDEX_VERSION:
+            with self.conn:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM modules")
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (INDEX_VERSION,))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def update(self, files):
+        """
+        (Re)scan files whose mtime/size changed since the last update.
+        Returns (scanned, unchanged) counts.
+        """
+        scanned = unchanged = 0
+        known = dict(((p, (m, s)) for p, m, s in self.conn.execute("SELECT path, mtime_ns, size FROM files")))
+        with self.conn:
+            for path in files:
+                path = os.path.abspath(path)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    print(f"[Warning] RTL file not found: {path}")
+                    self._forget(path)
+                    continue
+                if known.get(path) == (st.st_mtime_ns, st.st_size):
+                    unchanged += 1
+                    continue
+
+                modules = scan_modules(path)
+                self._forget(path)
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO modules VALUES (?, ?, ?)",
+                    [(name, path, json.dumps(iface)) for name, iface in modules.items()],
+                )
+                self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                                  (path, st.st_mtime_ns, st.st_size))
+                scanned += 1
+        return scanned, unchanged
+
+    def _forget(self, path):
+        self.conn.execute("DELETE FROM modules WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def find_module(self, name, files=None):
+        """
+        Look up a module, optionally restricted to the given files.
+        Returns {'name', 'path', 'interface'} or None.
+        """
+        rows = self.conn.execute("SELECT path, interface FROM modules WHERE name = ? ORDER BY path",
+                                 (name,)).fetchall()
+        if files is not None:
+            wanted = {os.path.abspath(f) for f in files}
+            rows = [r for r in rows if r[0] in wanted]
+        if not rows:
+            return None
+        if len(rows) > 1:
+            print(f"[Warning] Module '{name}' defined in {len(rows)} files, using {rows[0][0]}")
+        return {'name': name, 'path': rows[0][0], 'interface': json.loads(rows[0][1])}
+
+    def modules_in(self, path):
+        """Interfaces defined in one file, in file order."""
+        rows = self.conn.execute("SELECT interface FROM modules WHERE path = ? ORDER BY rowid",
+                                 (os.path.abspath(path),)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def module_names(self):
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT name FROM modules ORDER BY name")]
+
+
+def resolve_dut(source_files, module_name=None, overrides=None, base_dir='.'):
+    """
+    Index the DUT sources and return (files, incdirs, params, ports) for the
+    top module. params/ports are None when module_name is not found.
+    """
+    files, incdirs = expand_sources(source_files, base_dir)
+    with RtlIndex() as index:
+        index.update(files)
+        entry = index.find_module(module_name, files) if module_name else None
+        if entry is None:
+            return files, incdirs, None, None
+        params, ports = resolve_module(entry['interface'], overrides)
+    return files, incdirs, params, ports
+
+
+def infer_dut_widths(source_files, module_name=None, overrides=None, base_dir='.'):
+    """
+    Infer ADDR_WIDTH / DATA_WIDTH from the DUT top module's ports, falling back
+    to every module of every source file (first found wins) when the top
+    module is not found.
+    """
+    files, _, _, ports = resolve_dut(source_files, module_name, overrides, base_dir)
+    if ports is not None:
+        return infer_widths(ports)
+
+    all_ports = []
+    with RtlIndex() as index:
+        for path in files:
+            for iface in index.modules_in(path):
+                all_ports.extend(resolve_module(iface, overrides)[1])
+    return infer_widths(all_ports)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RTL module index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    scan = sub.add_parser("scan", help="Index files, directories or .f filelists")
+    scan.add_argument("sources", nargs="+")
+    lookup = sub.add_parser("lookup", help="Show a module's parameters and ports")
+    lookup.add_argument("module")
+    lookup.add_argument("--param", action="append", default=[], help="NAME=VALUE override")
+    sub.add_parser("list", help="List indexed modules")
+    args = parser.parse_args()
+
+    with RtlIndex() as index:
+        if args.command == "scan":
+            files, _ = expand_sources(args.sources)
+            scanned, unchanged = index.update(files)
+            print(f"[Index] {len(files)} file(s): {scanned} scanned, {unchanged} unchanged")
+        elif args.command == "list":
+            for name in index.module_names():
+                print(name)
+        else:
+            entry = index.find_module(args.module)
+            if entry is None:
+                print(f"[Error] Module '{args.module}' is not indexed")
+                raise SystemExit(1)
+            overrides = {}
+            for item in args.param:
+                key, _, value = item.partition("=")
+                overrides[key] = int(value, 0)
+            params, ports = resolve_module(entry['interface'], overrides)
+            print(f"{entry['name']}  ({entry['path']})")
+            for key, value in params.items():
+                print(f"  parameter {key} = {value}")
+            for port in ports:
+                width = "?" if port['width'] is None else port['width']
+                print(f"  {port['direction']:<6} [{width}] {port['name']}")
+
+
+if __name__ == "__main__":
+    main()
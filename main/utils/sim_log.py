@@ -0,0 +1,120 @@
+"""
+Simulation Log Analysis
+
+Classifies xsim / UVM log output line by line: UVM message counts (from the
+messages themselves and from the final "UVM Report Summary"), scoreboard
+reads, writes and mismatches, and the first failing address.
+
+    stats = LogStats()
+    for line in log:
+        stats.feed(line)
+    stats.passed(exit_code)
+"""
+
+import re
+
+# "UVM_ERROR /path/scoreboard.sv(60) @ 1234: uvm_test_top.env.scb [SCB_MISMATCH] ..."
+UVM_MESSAGE_RE = re.compile(r'^(UVM_INFO|UVM_WARNING|UVM_ERROR|UVM_FATAL)\b(?!\s*:)[^@\n]*@\s*(\d+)')
+# "UVM_ERROR :    3" in the report summary
+UVM_SUMMARY_COUNT_RE = re.compile(r'^(UVM_INFO|UVM_WARNING|UVM_ERROR|UVM_FATAL)\s*:\s*(\d+)')
+UVM_SUMMARY_START = "UVM Report Summary"
+SCB_MISMATCH_RE = re.compile(r'\[SCB_MISMATCH\].*?Addr=0x([0-9a-fA-F]+)')
+SCB_READ_RE = re.compile(r'\[SCB\]\s+READ:')
+SCB_WRITE_RE = re.compile(r'\[SCB\]\s+WRITE:')
+# "Starting 100 iterations of Write-Read Test..." from the base sequence
+ITERATIONS_RE = re.compile(r'Starting (\d+) iterations')
+
+SEVERITIES = ('UVM_INFO', 'UVM_WARNING', 'UVM_ERROR', 'UVM_FATAL')
+
+
+class LogStats:
+    def __init__(self):
+        self.counts = dict.fromkeys(SEVERITIES, 0)
+        self.summary_counts = None  # from the report summary, once seen
+        self.in_summary = False
+        self.planned_iterations = None
+        self.reads = 0
+        self.writes = 0
+        self.mismatches = 0
+        self.first_mismatch_addr = None
+        self.first_error = None
+        self.sim_time = 0
+        self.lines = 0
+
+    def feed(self, line):
+        """Account for one log line; returns the severity of a UVM message, else None."""
+        self.lines += 1
+        if self.in_summary:
+            m = UVM_SUMMARY_COUNT_RE.match(line)
+            if m:
+                self.summary_counts[m.group(1)] = int(m.group(2))
+            return None
+        if UVM_SUMMARY_START in line:
+            self.in_summary = True
+            self.summary_counts = dict.fromkeys(SEVERITIES, 0)
+            return None
+
+        m = UVM_MESSAGE_RE.match(line)
+        if not m:
+            return None
+        severity = m.group(1)
+        self.counts[severity] += 1
+        self.sim_time = int(m.group(2))
+
+        if severity == 'UVM_INFO':
+            if SCB_READ_RE.search(line):
+                self.reads += 1
+            elif SCB_WRITE_RE.search(line):
+                self.writes += 1
+            elif self.planned_iterations is None:
+                planned = ITERATIONS_RE.search(line)
+                if planned:
+                    self.planned_iterations = int(planned.group(1))
+        elif severity in ('UVM_ERROR', 'UVM_FATAL'):
+            if self.first_error is None:
+                self.first_error = line.strip()
+            mismatch = SCB_MISMATCH_RE.search(line)
+            if mismatch:
+                self.mismatches += 1
+                if self.first_mismatch_addr is None:
+                    self.first_mismatch_addr = f"0x{mismatch.group(1).lower()}"
+        return severity
+
+    @property
+    def completed(self):
+        """The UVM report summary was printed (the test ran to the end)."""
+        return self.summary_counts is not None
+
+    def count(self, severity):
+        if self.summary_counts is not None:
+            return self.summary_counts[severity]
+        return self.counts[severity]
+
+    def passed(self, exit_code=0):
+        return (exit_code == 0 and self.completed
+                and self.count('UVM_ERROR') == 0 and self.count('UVM_FATAL') == 0)
+
+    def as_dict(self):
+        return {
+            'completed': self.completed,
+            'planned_iterations': self.planned_iterations,
+            'uvm_errors': self.count('UVM_ERROR'),
+            'uvm_fatals': self.count('UVM_FATAL'),
+            'uvm_warnings': self.count('UVM_WARNING'),
+            'reads': self.reads,
+            'writes': self.writes,
+            'matches': max(0, self.reads - self.mismatches),
+            'mismatches': self.mismatches,
+            'first_mismatch_addr': self.first_mismatch_addr,
+            'first_error': self.first_error,
+            'sim_time': self.sim_time,
+        }
+
+
+def analyze_log(path):
+    """LogStats of a finished log file."""
+    stats = LogStats()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            stats.feed(line)
+    return stats
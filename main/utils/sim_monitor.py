@@ -0,0 +1,170 @@
+"""
+Streaming Simulation Monitor
+
+Tails a simulation log while the simulator is still writing it, counts
+scoreboard mismatches and UVM errors as they appear (see sim_log.LogStats)
+and kills the simulator as soon as a budget is exceeded, so a broken DUT
+fails in seconds instead of after every iteration. A JSON summary is
+written at the end:
+
+    python -m main.utils.sim_monitor --log sim.log --max-mismatches 10 \\
+        -- xsim top_snapshot -runall -log sim.log
+
+Summary fields: status (PASS / FAIL / ABORTED / TIMEOUT), iterations
+(completed write-read pairs), planned_iterations, matches, mismatches,
+first_mismatch_addr, uvm_errors, uvm_fatals, runtime_s, abort_reason.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from .sim_log import LogStats
+
+DEFAULT_POLL = 0.05
+# Seconds given to the simulator to exit after terminate() before kill()
+KILL_GRACE = 2.0
+
+
+class LogMonitor:
+    def __init__(self, log_path, max_mismatches=None, max_errors=None, poll=DEFAULT_POLL):
+        self.log_path = log_path
+        self.max_mismatches = max_mismatches
+        self.max_errors = max_errors
+        self.poll = poll
+        self.stats = LogStats()
+        self.abort_reason = None
+        self._file = None
+        self._partial = b""
+
+    def read_new_lines(self):
+        """Feed the lines appended since the last call; returns the number of lines."""
+        if self._file is None:
+            if not os.path.exists(self.log_path):
+                return 0
+            self._file = open(self.log_path, 'rb')
+        data = self._file.read()
+        if not data:
+            return 0
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()  # incomplete last line, completed by a later write
+        for line in lines:
+            self.stats.feed(line.decode('utf-8', errors='replace'))
+        return len(lines)
+
+    def budget_exceeded(self):
+        if self.max_mismatches is not None and self.stats.mismatches > self.max_mismatches:
+            return f"{self.stats.mismatches} mismatches > budget {self.max_mismatches}"
+        errors = self.stats.counts['UVM_ERROR'] + self.stats.counts['UVM_FATAL']
+        if self.max_errors is not None and errors > self.max_errors:
+            return f"{errors} UVM errors > budget {self.max_errors}"
+        return None
+
+    def follow(self, proc, timeout=None):
+        """
+        Tail the log until proc exits, stopping it early when a budget is
+        exceeded or the timeout expires. Returns the summary dict.
+        """
+        start = time.perf_counter()
+        status = None
+        try:
+            while True:
+                exited = proc.poll() is not None
+                self.read_new_lines()
+                reason = self.budget_exceeded()
+                if reason:
+                    self.abort_reason = reason
+                    status = "ABORTED"
+                    stop_process(proc)
+                    break
+                if exited:
+                    break
+                if timeout is not None and time.perf_counter() - start > timeout:
+                    self.abort_reason = f"timeout after {timeout:g}s"
+                    status = "TIMEOUT"
+                    stop_process(proc)
+                    break
+                time.sleep(self.poll)
+            self.read_new_lines()
+            if self._partial:
+                self.stats.feed(self._partial.decode('utf-8', errors='replace'))
+                self._partial = b""
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        exit_code = proc.returncode
+        if status is None:
+            status = "PASS" if self.stats.passed(exit_code) else "FAIL"
+        return self.summary(status, exit_code, time.perf_counter() - start)
+
+    def summary(self, status, exit_code, runtime):
+        stats = self.stats.as_dict()
+        return {
+            'status': status,
+            'exit_code': exit_code,
+            'iterations': stats['reads'],
+            **stats,
+            'runtime_s': round(runtime, 3),
+            'abort_reason': self.abort_reason,
+            'log': self.log_path,
+        }
+
+
+def stop_process(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def write_summary(path, summary):
+    with open(path, 'w') as f:
+        json.dump(summary, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a simulation and monitor its log (fail-fast)")
+    parser.add_argument("--log", type=str, required=True, help="Log file written by the simulator")
+    parser.add_argument("--max-mismatches", type=int, help="Abort after more than N scoreboard mismatches")
+    parser.add_argument("--max-errors", type=int, help="Abort after more than N UVM_ERROR/UVM_FATAL messages")
+    parser.add_argument("--timeout", type=float, help="Abort after this many seconds")
+    parser.add_argument("--summary", type=str, help="JSON summary path (default: <log>.summary.json)")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="-- simulator command")
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("missing simulator command after --")
+
+    # A log left over from an earlier run must not be read as this run's output
+    if os.path.exists(args.log):
+        os.remove(args.log)
+
+    monitor = LogMonitor(args.log, max_mismatches=args.max_mismatches, max_errors=args.max_errors)
+    try:
+        proc = subprocess.Popen(command)
+    except OSError as e:
+        print(f"[Error] Failed to start simulator: {e}")
+        sys.exit(2)
+    summary = monitor.follow(proc, timeout=args.timeout)
+
+    summary_path = args.summary or f"{os.path.splitext(args.log)[0]}.summary.json"
+    write_summary(summary_path, summary)
+    print(f"[Monitor] {summary['status']}: {summary['iterations']} iteration(s), "
+          f"{summary['matches']} match(es), {summary['mismatches']} mismatch(es), {summary['runtime_s']:.2f}s"
+          + (f" ({summary['abort_reason']})" if summary['abort_reason'] else ""))
+    if summary['first_mismatch_addr']:
+        print(f"[Monitor] First failing address: {summary['first_mismatch_addr']}")
+    print(f"[Monitor] Summary: {summary_path}")
+    sys.exit(0 if summary['status'] == "PASS" else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Offline Scoreboard Check (model.check_mode: record)
+
+In record mode the scoreboards do not call the Python golden model during
+the simulation; every monitored transaction is appended to a binary log
+(sim/txn.bin, written by dpi_txn_record in wrapper.c) and checked here
+after the run:
+
+    python -m main.utils.txn_check output/sim/txn.bin
+    python -m main.utils.txn_check output/sim/txn.bin --engine model --summary check.json
+
+Log format (little-endian, fixed width):
+    header  32 bytes: magic "UVMTXN01", record_size(u16), data_width(u16),
+                      addr_width(u16), pad(2), protocol(8s, NUL padded), pad(8)
+    record  32 bytes: time(u64) addr(u64) data(u64) strb(u32)
+                      kind(u8: 0=write, 1=read) size(u8) resp(u8) id(u8)
+Read records carry the data observed on the bus. Writes update only the byte
+lanes enabled by strb (AXI WSTRB) or by size and the low address bits (AHB
+HSIZE, sub-word data right-aligned), like the models.
+
+Engines:
+    numpy - expected read data for the whole log at once (last write wins
+            per byte lane, same addressing as the models)
+    model - replays the log through model/<protocol>_model.py
+    auto  - numpy when installed, otherwise model
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+import importlib
+
+MAGIC = b"UVMTXN01"
+HEADER = struct.Struct("<8sHHHxx8s8x")
+RECORD = struct.Struct("<QQQIBBBB")
+KIND_WRITE = 0
+KIND_READ = 1
+TXN_LOG_FILE = "txn.bin"
+
+RECORD_FIELDS = ('time', 'addr', 'data', 'strb', 'kind', 'size', 'resp', 'id')
+RECORD_DTYPE = [('time', '<u8'), ('addr', '<u8'), ('data', '<u8'), ('strb', '<u4'),
+                ('kind', 'u1'), ('size', 'u1'), ('resp', 'u1'), ('id', 'u1')]
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "model")
+MODEL_CLASSES = {'apb': "APB_Model", 'ahb': "AHB_Model", 'axi': "AXI_Model"}
+# Address bits each model clears before indexing its word memory
+MODEL_ADDR_ALIGN = {'apb': 0, 'ahb': 0, 'axi': 0x3}
+# AHB_Model ignores accesses beyond its memory size (default 4 KB)
+AHB_DEFAULT_MEM_SIZE = 4096
+
+
+class TxnLogError(Exception):
+    pass
+
+
+def _numpy():
+    """NumPy if installed (optional, imported on first use so the generator never pays for it)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def read_header(f):
+    raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise TxnLogError("file too short for a transaction log header")
+    magic, record_size, data_width, addr_width, protocol = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise TxnLogError(f"bad magic {magic!r} (expected {MAGIC!r})")
+    if record_size != RECORD.size:
+        raise TxnLogError(f"record size {record_size}, this checker reads {RECORD.size}-byte records")
+    return {
+        'data_width': data_width,
+        'addr_width': addr_width,
+        'protocol': protocol.rstrip(b"\0").decode('ascii', errors='replace'),
+    }
+
+
+def read_log(path, use_numpy=True):
+    """
+    Returns (header, records). records is a NumPy structured array, or a
+    list of RECORD tuples when use_numpy is False. A trailing partial record
+    (simulation killed mid-write) is dropped.
+    """
+    with open(path, 'rb') as f:
+        header = read_header(f)
+        data = f.read()
+        data = data[:len(data) - len(data) % RECORD.size]
+        if use_numpy:
+            np = _numpy()
+            records = np.frombuffer(data, dtype=np.dtype(RECORD_DTYPE))
+        else:
+            records = list(RECORD.iter_unpack(data))
+    return header, records
+
+
+def model_config_for(log_path, header, model_config=None):
+    """The model_config.json next to the log (as in the simulation), else widths from the header."""
+    path = model_config or os.path.join(os.path.dirname(os.path.abspath(log_path)), "model_config.json")
+    config = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            config = json.load(f) or {}
+    config.setdefault('data_width', header['data_width'])
+    config.setdefault('addr_width', header['addr_width'])
+    config['trace'] = {}  # replay must not write a model trace
+    return config
+
+
+def record_lanes_numpy(records, protocol, word_bytes):
+    """
+    Byte-lane view of every record, as the models apply it: (strb, data)
+    with data lane-positioned in its memory word, plus (offset, mask) giving
+    the read data as (word >> 8 * offset) & mask.
+    """
+    np = _numpy()
+    full = (1 << word_bytes) - 1
+    word_mask = np.uint64((1 << (8 * word_bytes)) - 1)
+    n = len(records)
+    if protocol == 'ahb':
+        # HSIZE lanes; sub-word data is right-aligned on the bus (ahb_model.py)
+        nbytes = np.minimum(np.left_shift(1, records['size'].astype(np.uint64)), np.uint64(word_bytes))
+        offset = records['addr'] & np.uint64(word_bytes - 1) & ~(nbytes - np.uint64(1))
+        mask = np.where(nbytes >= 8, np.uint64(0xFFFFFFFFFFFFFFFF),
+                        (np.uint64(1) << (np.uint64(8) * nbytes)) - np.uint64(1))
+        strb = ((np.uint64(1) << nbytes) - np.uint64(1)) << offset
+        data = (records['data'] & mask) << (np.uint64(8) * offset)
+        return strb, data & word_mask, offset, mask & word_mask
+    if protocol == 'axi':
+        strb = records['strb'].astype(np.uint64) & np.uint64(full)
+    else:
+        strb = np.full(n, full, dtype=np.uint64)
+    return strb, records['data'] & word_mask, np.zeros(n, dtype=np.uint64), np.full(n, word_mask)
+
+
+def expected_reads_numpy(records, protocol, config):
+    """
+    Expected data for every record (meaningful for reads): per byte lane,
+    the data of the last earlier write enabling that lane, else 0.
+    """
+    np = _numpy()
+    n = len(records)
+    data_width = int(config.get('data_width', 32))
+    word_bytes = max(data_width // 8, 1)
+    shift = word_bytes.bit_length() - 1
+
+    addrs = records['addr']
+    words = (addrs & ~np.uint64(MODEL_ADDR_ALIGN.get(protocol, 0))) >> np.uint64(shift)
+    valid = np.ones(n, dtype=bool)
+    if protocol == 'ahb':
+        mem_size = config['ram_depth'] * word_bytes if config.get('ram_depth') else AHB_DEFAULT_MEM_SIZE
+        valid = addrs < np.uint64(mem_size)
+    strb, data, offset, mask = record_lanes_numpy(records, protocol, word_bytes)
+    is_write = (records['kind'] == KIND_WRITE) & valid
+
+    # One entry per (record, lane), record-major so a stable sort by lane key
+    # keeps log order inside each lane; then carry the latest write forward
+    lane = np.tile(np.arange(word_bytes, dtype=np.uint64), n)
+    key = np.repeat(words, word_bytes) * np.uint64(word_bytes) + lane
+    written = np.repeat(is_write, word_bytes) & ((np.repeat(strb, word_bytes) >> lane) & np.uint64(1)).astype(bool)
+    lane_data = (np.repeat(data, word_bytes) >> (np.uint64(8) * lane)) & np.uint64(0xFF)
+
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+    pos = np.arange(len(key))
+    group_start = np.ones(len(key), dtype=bool)
+    group_start[1:] = sorted_key[1:] != sorted_key[:-1]
+    start_pos = np.maximum.accumulate(np.where(group_start, pos, 0))
+    last_write = np.maximum.accumulate(np.where(written[order], pos, -1))
+    sorted_bytes = lane_data[order]
+    expected_sorted = np.where(last_write >= start_pos, sorted_bytes[np.maximum(last_write, 0)], np.uint64(0))
+
+    expected_bytes = np.empty(len(key), dtype=np.uint64)
+    expected_bytes[order] = expected_sorted
+    word = (expected_bytes << (np.uint64(8) * lane)).reshape(n, word_bytes).sum(axis=1, dtype=np.uint64)
+    expected = (word >> (np.uint64(8) * offset)) & mask
+    expected[~valid] = 0
+    return expected
+
+
+def load_model_class(protocol):
+    """Import model/<protocol>_model.py the way the DPI wrapper does."""
+    if protocol not in MODEL_CLASSES:
+        raise TxnLogError(f"no golden model for protocol '{protocol}'")
+    if MODEL_DIR not in sys.path:
+        sys.path.insert(0, MODEL_DIR)
+    return getattr(importlib.import_module(f"{protocol}_model"), MODEL_CLASSES[protocol])
+
+
+def expected_reads_model(records, protocol, config):
+    """Replay the log through the golden model (per-record reference engine)."""
+    model = load_model_class(protocol)(config=config)
+    expected = []
+    for _, addr, data, strb, kind, size, _, _ in records:
+        if kind == KIND_WRITE:
+            if protocol == 'axi':
+                model.write(addr, data, strb)
+            elif protocol == 'ahb':
+                model.write(addr, data, size)
+            else:
+                model.write(addr, data)
+            expected.append(0)
+        elif protocol == 'ahb':
+            expected.append(model.read(addr, size))
+        else:
+            expected.append(model.read(addr))
+    return expected
+
+
+def check_log(path, engine="auto", model_config=None, max_report=20):
+    """Check a transaction log; returns the summary dict (see main())."""
+    start = time.perf_counter()
+    np = _numpy() if engine in ("auto", "numpy") else None
+    if engine == "auto":
+        engine = "numpy" if np is not None else "model"
+    if engine == "numpy" and np is None:
+        raise TxnLogError("NumPy is not installed (pip install numpy, or use --engine model)")
+
+    header, records = read_log(path, use_numpy=(engine == "numpy"))
+    protocol = header['protocol']
+    config = model_config_for(path, header, model_config)
+    data_mask = (1 << min(header['data_width'], 64)) - 1
+
+    if engine == "numpy":
+        expected = expected_reads_numpy(records, protocol, config)
+        reads = records['kind'] == KIND_READ
+        bad = np.flatnonzero(reads & ((records['data'] & np.uint64(data_mask)) != expected))
+        n_reads = int(np.count_nonzero(reads))
+        n_resp_errors = int(np.count_nonzero(records['resp']))
+        details = [
+            {'time': int(records['time'][i]), 'addr': f"0x{int(records['addr'][i]):x}",
+             'expected': f"0x{int(expected[i]):x}", 'actual': f"0x{int(records['data'][i]):x}"}
+            for i in bad[:max_report]
+        ]
+        n_bad = len(bad)
+    else:
+        expected = expected_reads_model(records, protocol, config)
+        n_reads = n_bad = n_resp_errors = 0
+        details = []
+        for rec, exp in zip(records, expected):
+            t, addr, data, _, kind, _, resp, _ = rec
+            n_resp_errors += resp != 0
+            if kind != KIND_READ:
+                continue
+            n_reads += 1
+            if (data & data_mask) != exp:
+                n_bad += 1
+                if len(details) < max_report:
+                    details.append({'time': t, 'addr': f"0x{addr:x}",
+                                    'expected': f"0x{exp:x}", 'actual': f"0x{data:x}"})
+
+    total = len(records)
+    return {
+        'status': "PASS" if total and not n_bad else "FAIL",
+        'protocol': protocol,
+        'engine': engine,
+        'transactions': total,
+        'writes': total - n_reads,
+        'iterations': n_reads,
+        'matches': n_reads - n_bad,
+        'mismatches': n_bad,
+        'first_mismatch_addr': details[0]['addr'] if details else None,
+        'first_mismatch_time': details[0]['time'] if details else None,
+        'error_responses': n_resp_errors,
+        'mismatch_details': details,
+        'runtime_s': round(time.perf_counter() - start, 3),
+        'log': path,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check a recorded transaction log against the golden model")
+    parser.add_argument("log", nargs="?", default=TXN_LOG_FILE, help=f"Transaction log (default: {TXN_LOG_FILE})")
+    parser.add_argument("--engine", choices=("auto", "numpy", "model"), default="auto",
+                        help="numpy (bulk), model (replay through model/<protocol>_model.py), auto")
+    parser.add_argument("--model-config", type=str, help="model_config.json (default: next to the log)")
+    parser.add_argument("--summary", type=str, help="JSON summary path (default: <log>.check.json)")
+    parser.add_argument("--max-report", type=int, default=20, help="Mismatches listed in detail (default: 20)")
+    args = parser.parse_args()
+
+    try:
+        summary = check_log(args.log, engine=args.engine, model_config=args.model_config,
+                            max_report=args.max_report)
+    except (OSError, TxnLogError) as e:
+        print(f"[Error] {args.log}: {e}")
+        sys.exit(2)
+
+    print(f"[Check] {args.log}: {summary['transactions']} transaction(s) "
+          f"({summary['writes']} writes, {summary['iterations']} reads), "
+          f"{summary['protocol']} model, {summary['engine']} engine, {summary['runtime_s']:.3f}s")
+    for d in summary['mismatch_details']:
+        print(f"[Check] MISMATCH @ {d['time']}: Addr={d['addr']} DUT={d['actual']} Exp={d['expected']}")
+    if summary['mismatches'] > len(summary['mismatch_details']):
+        print(f"[Check] ... {summary['mismatches'] - len(summary['mismatch_details'])} more")
+    if summary['error_responses']:
+        print(f"[Check] {summary['error_responses']} transaction(s) with an error response")
+    result = f"{summary['mismatches']} mismatch(es) in {summary['iterations']} read(s)"
+    if summary['first_mismatch_addr']:
+        result += f", first at {summary['first_mismatch_addr']} (t={summary['first_mismatch_time']})"
+    print(f"[Check] {summary['status']}: {result}")
+
+    summary_path = args.summary or f"{os.path.splitext(args.log)[0]}.check.json"
+    with open(summary_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    print(f"[Check] Summary: {summary_path}")
+    sys.exit(0 if summary['status'] == "PASS" else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,81 +3,585 @@ Verilog Port Width Parser
 
 Parses Verilog source files to extract port bit widths.
 Used to infer ADDR_WIDTH and DATA_WIDTH when not specified in config.yaml.
+
+Single pass over a token stream (comments, strings and compiler directives are
+dropped by the lexer). For every module the header parameters, body
+parameter/localparam declarations and ports (ANSI `module m(input [W-1:0] a)`
+and non-ANSI `module m(a); input [W-1:0] a;`) are collected. Ranges and
+parameter values are kept as token lists and evaluated on demand, so the same
+parsed interface serves any set of parameter overrides:
+
+    [ADDR_WIDTH-1:0]        -> 32
+    [DATA_WIDTH/8-1:0]      -> 4
+    [$clog2(RAM_DEPTH)-1:0] -> 8
+
+Parsed interfaces are cached on disk (.uvmgen_cache/verilog/<sha256>.json)
+keyed by the file content hash, so unchanged RTL is never re-tokenized.
 """
 
 import re
 import os
+import json
+import hashlib
+
+from .cache import get_cache_dir
+
+# Bump when the cached interface format or parsing rules change
+PARSER_VERSION = "2"
+
+ADDR_KEYWORDS = ['addr', 'paddr', 'haddr', 'awaddr', 'araddr']
+DATA_KEYWORDS = ['data', 'wdata', 'rdata', 'pwdata', 'prdata', 'hwdata', 'hrdata']
+
+DIRECTIONS = ('input', 'output', 'inout')
+NET_TYPES = ('wire', 'reg', 'logic', 'tri', 'wand', 'wor', 'var', 'bit')
+PARAM_TYPES = ('integer', 'int', 'real', 'signed', 'unsigned', 'bit', 'logic')
+BLOCK_KEYWORDS = ('function', 'task')
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<directive>`\w+[^\n]*)
+  | (?P<string>"(?:\\.|[^"\\])*")
+  | (?P<number>(?:\d[\d_]*)?\s*'[sS]?[bBoOdDhH]\s*[0-9a-fA-FxXzZ?_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<sysid>\$\w+)
+  | (?P<ident>[A-Za-z_][\w$]*|\\\S+)
+  | (?P<op>\*\*|<<<|>>>|<<|>>|<=|>=|==|!=|&&|\|\||[-+*/%<>!~&|^?:])
+  | (?P<punct>[()\[\]{},;#.=@])
+""", re.VERBOSE | re.DOTALL)
+
+
+class VerilogParseError(Exception):
+    pass
+
+
+def tokenize(text):
+    """
+    Split Verilog source into (kind, text) tokens.
+    Whitespace, comments, strings and `directives are skipped.
+    """
+    tokens = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        m = _TOKEN_RE.match(text, pos)
+        if m is None:
+            pos += 1  # unknown character (e.g. non-ASCII in identifiers we don't need)
+            continue
+        kind = m.lastgroup
+        if kind in ('number', 'sysid', 'ident', 'op', 'punct'):
+            tokens.append((kind, m.group(kind)))
+        pos = m.end()
+    return tokens
+
+
+# ---------------------------------------------------------------------------
+# Constant expression evaluation
+# ---------------------------------------------------------------------------
+
+_BINARY_PRECEDENCE = [
+    ('||',),
+    ('&&',),
+    ('|',),
+    ('^',),
+    ('&',),
+    ('==', '!='),
+    ('<', '<=', '>', '>='),
+    ('<<', '>>', '<<<', '>>>'),
+    ('+', '-'),
+    ('*', '/', '%'),
+    ('**',),
+]
+
+
+def _parse_number(text):
+    text = text.replace('_', '').replace(' ', '')
+    if "'" not in text:
+        return float(text) if ('.' in text or 'e' in text.lower()) else int(text)
+    _, value = text.split("'", 1)
+    value = value.lstrip('sS')
+    base = {'b': 2, 'o': 8, 'd': 10, 'h': 16}[value[0].lower()]
+    digits = value[1:]
+    if re.search(r'[xXzZ?]', digits):
+        raise VerilogParseError(f"unknown bits in constant {text}")
+    return int(digits, base)
+
+
+def _apply(op, a, b):
+    if op == '+':  return a + b
+    if op == '-':  return a - b
+    if op == '*':  return a * b
+    if op == '/':  return a // b if isinstance(a, int) and isinstance(b, int) else a / b
+    if op == '%':  return a % b
+    if op == '**': return a ** b
+    if op in ('<<', '<<<'): return a << b
+    if op in ('>>', '>>>'): return a >> b
+    if op == '&':  return a & b
+    if op == '|':  return a | b
+    if op == '^':  return a ^ b
+    if op == '==': return int(a == b)
+    if op == '!=': return int(a != b)
+    if op == '<':  return int(a < b)
+    if op == '<=': return int(a <= b)
+    if op == '>':  return int(a > b)
+    if op == '>=': return int(a >= b)
+    if op == '&&': return int(bool(a) and bool(b))
+    if op == '||': return int(bool(a) or bool(b))
+    raise VerilogParseError(f"unsupported operator {op}")
+
+
+def _clog2(value):
+    return 0 if value <= 1 else int(value - 1).bit_length()
+
+
+class _ExprEvaluator:
+    """Recursive-descent evaluator for Verilog constant expressions."""
+
+    def __init__(self, tokens, env):
+        self.tokens = tokens
+        self.env = env
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def expect(self, text):
+        if self.peek() != text:
+            raise VerilogParseError(f"expected '{text}' in expression")
+        self.pos += 1
+
+    def evaluate(self):
+        value = self.ternary()
+        if self.pos != len(self.tokens):
+            raise VerilogParseError(f"unexpected token '{self.peek()}' in expression")
+        return value
+
+    def ternary(self):
+        cond = self.binary(0)
+        if self.peek() == '?':
+            self.pos += 1
+            a = self.ternary()
+            self.expect(':')
+            b = self.ternary()
+            return a if cond else b
+        return cond
+
+    def binary(self, level):
+        if level == len(_BINARY_PRECEDENCE):
+            return self.unary()
+        ops = _BINARY_PRECEDENCE[level]
+        value = self.binary(level + 1)
+        while self.peek() in ops:
+            op = self.take()[1]
+            if op == '**':
+                value = _apply(op, value, self.binary(level))  # right-associative
+            else:
+                value = _apply(op, value, self.binary(level + 1))
+        return value
+
+    def unary(self):
+        tok = self.peek()
+        if tok in ('+', '-', '!', '~'):
+            self.pos += 1
+            value = self.unary()
+            return {'+': value, '-': -value, '!': int(not value), '~': ~value}[tok]
+        return self.primary()
+
+    def primary(self):
+        if self.pos >= len(self.tokens):
+            raise VerilogParseError("unexpected end of expression")
+        kind, text = self.take()
+        if text == '(':
+            value = self.ternary()
+            self.expect(')')
+            return value
+        if kind == 'number':
+            return _parse_number(text)
+        if kind == 'sysid':
+            self.expect('(')
+            arg = self.ternary()
+            self.expect(')')
+            if text == '$clog2':
+                return _clog2(arg)
+            raise VerilogParseError(f"unsupported system function {text}")
+        if kind == 'ident':
+            if text not in self.env:
+                raise VerilogParseError(f"unknown identifier '{text}'")
+            return self.env[text]
+        raise VerilogParseError(f"unexpected token '{text}' in expression")
+
+
+def evaluate_expr(tokens, env):
+    """Evaluate a constant expression token list against a {name: value} env."""
+    return _ExprEvaluator(tokens, env).evaluate()
+
+
+# ---------------------------------------------------------------------------
+# Module header / declaration parsing
+# ---------------------------------------------------------------------------
+
+class _ModuleParser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i][1] if i < len(self.tokens) else None
+
+    def take(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def at_end(self):
+        return self.pos >= len(self.tokens)
+
+    def skip_balanced(self, open_text, close_text):
+        """Skip from an opening token to its matching close (inclusive)."""
+        depth = 0
+        while not self.at_end():
+            text = self.take()[1]
+            if text == open_text:
+                depth += 1
+            elif text == close_text:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def collect_until(self, stops):
+        """Collect tokens up to (not including) a top-level stop token."""
+        out = []
+        depth = 0
+        while not self.at_end():
+            text = self.peek()
+            if depth == 0 and text in stops:
+                break
+            if text in ('(', '[', '{'):
+                depth += 1
+            elif text in (')', ']', '}'):
+                if depth == 0:
+                    break
+                depth -= 1
+            out.append(self.take())
+        return out
+
+    def parse_range(self):
+        """'[' msb ':' lsb ']' -> (msb_tokens, lsb_tokens); caller is at '['."""
+        self.pos += 1
+        msb = self.collect_until((':',))
+        lsb = []
+        if self.peek() == ':':
+            self.pos += 1
+            lsb = self.collect_until((']',))
+        if self.peek() == ']':
+            self.pos += 1
+        return msb, lsb or [('number', '0')]
+
+    def parse_modules(self):
+        modules = {}
+        while not self.at_end():
+            text = self.take()[1]
+            if text in ('module', 'macromodule') and not self.at_end():
+                module = self.parse_module()
+                if module:
+                    modules[module['name']] = module
+        return modules
 
+    def parse_module(self):
+        # Optional lifetime qualifier (SystemVerilog)
+        if self.peek() in ('automatic', 'static'):
+            self.pos += 1
+        kind, name = self.take()
+        if kind != 'ident':
+            return None
+        module = {'name': name, 'params': [], 'ports': [], 'port_order': []}
 
-def parse_port_widths(verilog_file_path):
+        if self.peek() == '#':
+            self.pos += 1
+            self.parse_param_list(module)
+
+        if self.peek() == '(':
+            self.parse_port_list(module)
+
+        self.parse_body(module)
+        return module
+
+    def parse_param_list(self, module):
+        """#( parameter A = 1, B = 2, localparam C = A+B )"""
+        if self.peek() != '(':
+            return
+        self.pos += 1
+        local = False
+        while not self.at_end() and self.peek() != ')':
+            text = self.peek()
+            if text in ('parameter', 'localparam'):
+                local = text == 'localparam'
+                self.pos += 1
+                continue
+            if text == ',':
+                self.pos += 1
+                continue
+            self.parse_param_assignment(module, local, stops=(',',))
+        self.pos += 1  # ')'
+
+    def parse_param_assignment(self, module, local, stops):
+        """[type] [range] NAME = expr"""
+        while self.peek() in PARAM_TYPES:
+            self.pos += 1
+        if self.peek() == '[':
+            self.parse_range()
+        kind, name = self.take()
+        if kind != 'ident':
+            self.collect_until(stops)
+            return
+        # Unpacked dimensions on parameters are rare; skip them
+        while self.peek() == '[':
+            self.parse_range()
+        expr = []
+        if self.peek() == '=':
+            self.pos += 1
+            expr = self.collect_until(stops)
+        module['params'].append({'name': name, 'expr': expr, 'local': local})
+
+    def parse_port_list(self, module):
+        self.pos += 1  # '('
+        direction = None
+        net_range = None
+        while not self.at_end() and self.peek() != ')':
+            text = self.peek()
+            if text == ',':
+                self.pos += 1
+                continue
+            if text in DIRECTIONS:
+                # ANSI declaration: a new direction resets type and range
+                direction = text
+                net_range = None
+                self.pos += 1
+                continue
+            if text in NET_TYPES or text in ('signed', 'unsigned'):
+                self.pos += 1
+                continue
+            if text == '[':
+                net_range = self.parse_range()
+                continue
+            if text == '.':
+                # Explicit port expression .name(expr): keep the external name
+                self.pos += 1
+                kind, name = self.take()
+                if self.peek() == '(':
+                    self.skip_balanced('(', ')')
+                module['port_order'].append(name)
+                continue
+            kind, name = self.take()
+            if kind != 'ident':
+                continue
+            if self.peek() == '(':
+                self.skip_balanced('(', ')')  # interface/modport style, nothing to size
+            module['port_order'].append(name)
+            if direction:
+                module['ports'].append(self._port(name, direction, net_range))
+            # Unpacked dimensions / default values
+            while self.peek() == '[':
+                self.parse_range()
+            if self.peek() == '=':
+                self.pos += 1
+                self.collect_until((',',))
+        self.pos += 1  # ')'
+
+    @staticmethod
+    def _port(name, direction, net_range):
+        if net_range is None:
+            return {'name': name, 'direction': direction, 'msb': None, 'lsb': None}
+        msb, lsb = net_range
+        return {'name': name, 'direction': direction, 'msb': msb, 'lsb': lsb}
+
+    def parse_body(self, module):
+        """Body-level parameter/localparam and non-ANSI port declarations."""
+        declared = {p['name'] for p in module['ports']}
+        while not self.at_end():
+            text = self.peek()
+            if text == 'endmodule':
+                self.pos += 1
+                return
+            if text in BLOCK_KEYWORDS:
+                # Task/function arguments also use input/output: skip the block
+                end = 'end' + text
+                while not self.at_end() and self.peek() != end:
+                    self.pos += 1
+                continue
+            if text in ('parameter', 'localparam'):
+                local = text == 'localparam'
+                self.pos += 1
+                while not self.at_end():
+                    self.parse_param_assignment(module, local, stops=(',', ';'))
+                    if self.peek() != ',':
+                        break
+                    self.pos += 1
+                continue
+            if text in DIRECTIONS:
+                self.pos += 1
+                self.parse_body_port_decl(module, text, declared)
+                continue
+            self.pos += 1
+
+    def parse_body_port_decl(self, module, direction, declared):
+        """input [W-1:0] a, b;"""
+        net_range = None
+        while not self.at_end() and self.peek() != ';':
+            text = self.peek()
+            if text in NET_TYPES or text in ('signed', 'unsigned', ','):
+                self.pos += 1
+                continue
+            if text == '[':
+                net_range = self.parse_range()
+                continue
+            kind, name = self.take()
+            if kind == 'ident' and name not in declared:
+                module['ports'].append(self._port(name, direction, net_range))
+                declared.add(name)
+        self.pos += 1  # ';'
+
+
+def parse_verilog_source(text):
+    """
+    Parse Verilog text into {module_name: interface}, where interface holds
+    'params' (name, expr tokens, local flag), 'ports' (name, direction,
+    msb/lsb tokens or None for 1-bit) and 'port_order'.
+    """
+    return _ModuleParser(tokenize(text)).parse_modules()
+
+
+# ---------------------------------------------------------------------------
+# Raw-text module scanning (rtl_index on mmap'd bytes, prompt_compactor on str)
+# ---------------------------------------------------------------------------
+
+# `module <name>` at the start of a line (keeps "endmodule" and most comments out)
+_MODULE_START = r'^[ \t]*(?:macro)?module\s+\w+'
+# Skips comments and strings while looking for the header's terminating ';'
+_HEADER_SCAN = r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\])*"|(\()|(\))|(;)'
+_ENDMODULE = r'\bendmodule\b'
+
+MODULE_START_RE = re.compile(_MODULE_START, re.MULTILINE)
+MODULE_START_RE_BYTES = re.compile(_MODULE_START.encode(), re.MULTILINE)
+ENDMODULE_RE = re.compile(_ENDMODULE)
+ENDMODULE_RE_BYTES = re.compile(_ENDMODULE.encode())
+_HEADER_SCAN_RE = re.compile(_HEADER_SCAN, re.DOTALL)
+_HEADER_SCAN_RE_BYTES = re.compile(_HEADER_SCAN.encode(), re.DOTALL)
+
+
+def find_header_end(buf, start, limit=None):
+    """
+    Offset just past the ';' that closes the module header starting at
+    start, or -1. buf is a str, or bytes / an mmap.
+    """
+    scan_re = _HEADER_SCAN_RE if isinstance(buf, str) else _HEADER_SCAN_RE_BYTES
+    depth = 0
+    for m in scan_re.finditer(buf, start, len(buf) if limit is None else limit):
+        if m.lastindex == 1:
+            depth += 1
+        elif m.lastindex == 2:
+            depth -= 1
+        elif m.lastindex == 3 and depth == 0:
+            return m.end()
+    return -1
+
+
+# ---------------------------------------------------------------------------
+# Cached file front-end
+# ---------------------------------------------------------------------------
+
+def _cache_path(digest):
+    return os.path.join(get_cache_dir("verilog"), f"{digest}.json")
+
+
+def parse_verilog_file(verilog_file_path, use_cache=True):
+    """
+    Parse a Verilog file into module interfaces, reusing the on-disk cache
+    when a file with the same content was parsed before.
+    """
+    with open(verilog_file_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(PARSER_VERSION.encode() + b"\0" + raw).hexdigest()
+
+    cache_file = _cache_path(digest) if use_cache else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # corrupt entry: re-parse and overwrite
+
+    modules = parse_verilog_source(raw.decode('utf-8', errors='ignore'))
+
+    if cache_file:
+        tmp_path = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(modules, f)
+        os.replace(tmp_path, cache_file)
+    return modules
+
+
+def resolve_module(module, overrides=None):
     """
-    Parse a Verilog file and extract port bit widths.
-    
-    Args:
-        verilog_file_path: Path to the Verilog source file
-        
+    Evaluate a module's parameters (header defaults, then overrides for
+    non-local parameters, in declaration order) and port widths.
+
     Returns:
-        dict: Inferred parameters, e.g. {'ADDR_WIDTH': 32, 'DATA_WIDTH': 32}
+        (params, ports): {name: value}, [{'name', 'direction', 'width'}]
+        width is None when the range cannot be evaluated.
+    """
+    overrides = overrides or {}
+    params = {}
+    for param in module['params']:
+        name = param['name']
+        if not param['local'] and name in overrides:
+            params[name] = overrides[name]
+            continue
+        try:
+            params[name] = evaluate_expr(param['expr'], params)
+        except (VerilogParseError, ArithmeticError, ValueError, TypeError, KeyError):
+            pass  # leave unresolved; dependent widths will be None
+
+    ports = []
+    for port in module['ports']:
+        width = 1
+        if port['msb'] is not None:
+            try:
+                msb = evaluate_expr(port['msb'], params)
+                lsb = evaluate_expr(port['lsb'], params)
+                width = abs(int(msb) - int(lsb)) + 1
+            except (VerilogParseError, ArithmeticError, ValueError, TypeError, KeyError):
+                width = None
+        ports.append({'name': port['name'], 'direction': port['direction'], 'width': width})
+    return params, ports
+
+
+def infer_widths(ports):
+    """
+    Infer ADDR_WIDTH / DATA_WIDTH from resolved ports (first matching port wins).
     """
-    if not os.path.exists(verilog_file_path):
-        print(f"[Warning] Verilog file not found: {verilog_file_path}")
-        return {}
-    
-    with open(verilog_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    
     inferred = {}
-    
-    # Pattern to match port declarations with bit widths
-    # Examples:
-    #   input  wire [31:0] paddr,
-    #   input wire[ADDR_WIDTH-1:0] paddr,
-    #   output reg  [31:0] prdata,
-    port_pattern = re.compile(
-        r'(input|output)\s+(?:wire|reg)?\s*\[(\d+):0\]\s*(\w+)',
-        re.IGNORECASE
-    )
-    
-    for match in port_pattern.finditer(content):
-        direction = match.group(1)
-        msb = int(match.group(2))
-        port_name = match.group(3).lower()
-        width = msb + 1
-        
+    for port in ports:
+        port_name = port['name'].lower()
+        width = port['width']
+        if width is None:
+            continue
+
         # Infer ADDR_WIDTH from address-related ports
-        if any(keyword in port_name for keyword in ['addr', 'paddr', 'haddr', 'awaddr', 'araddr']):
+        if any(keyword in port_name for keyword in ADDR_KEYWORDS):
             if 'ADDR_WIDTH' not in inferred:
                 inferred['ADDR_WIDTH'] = width
                 print(f"[Parser] Inferred ADDR_WIDTH={width} from port '{port_name}'")
-        
+
         # Infer DATA_WIDTH from data-related ports
-        if any(keyword in port_name for keyword in ['data', 'wdata', 'rdata', 'pwdata', 'prdata', 'hwdata', 'hrdata']):
+        if any(keyword in port_name for keyword in DATA_KEYWORDS):
             if 'DATA_WIDTH' not in inferred:
                 inferred['DATA_WIDTH'] = width
                 print(f"[Parser] Inferred DATA_WIDTH={width} from port '{port_name}'")
-    
-    return inferred
 
-
-def parse_all_dut_sources(source_files, base_dir='.'):
-    """
-    Parse multiple DUT source files and merge inferred widths.
-    
-    Args:
-        source_files: List of relative paths to Verilog files
-        base_dir: Base directory for resolving relative paths
-        
-    Returns:
-        dict: Merged inferred parameters
-    """
-    merged = {}
-    
-    for src_file in source_files:
-        full_path = os.path.join(base_dir, src_file)
-        widths = parse_port_widths(full_path)
-        # First found value wins (don't overwrite)
-        for key, value in widths.items():
-            if key not in merged:
-                merged[key] = value
-    
-    return merged
+    return inferred
@@ -0,0 +1,206 @@
+"""
+Watch Mode (python -m main.run --watch)
+
+Keeps one process alive so the Jinja2 Environment (compiled templates), the
+parsed config and the RTL index stay warm, polls config.yaml, templates/ and
+the DUT sources, and regenerates only what a change can affect:
+
+    templates/vip/apb/*        -> copy_vip_files (vip/apb/*)
+    templates/tb/top.sv        -> generate_tb_top (tb/top.sv)
+    DUT source / filelist      -> copy_vip_files, generate_build_manifest
+    config.yaml port_map edit  -> generate_tb_top
+    other config.yaml edits    -> the steps reading that section
+
+Within the selected steps the incremental manifest decides per output:
+only templates whose source or context hash changed are re-rendered, and
+byte-identical results are not rewritten.
+
+Polling (stat of a few dozen files per interval) is used instead of OS
+file-system notifications so no extra dependency is needed.
+"""
+
+import os
+import time
+
+from .config_loader import load_config
+from .generator import Generator, TEMPLATE_DIR
+from .rtl_index import expand_sources
+
+DEFAULT_INTERVAL = 0.2
+
+# Steps rendering a given template (loader name, see generator.template_name)
+TEMPLATE_STEPS = {
+    'tb/top.sv': 'generate_tb_top',
+    'tb/tb_env.sv': 'generate_tb_env',
+    'tb/tb_pkg.sv': 'generate_tb_pkg',
+    'sim/run.tcl': 'generate_tcl_script',
+    'dpi/wrapper.c': 'generate_dpi_wrapper',
+}
+TEMPLATE_DIR_STEPS = {
+    'vip': ('copy_vip_files', 'generate_build_manifest'),  # manifest lists the VIP class files
+    'test': ('generate_test',),
+}
+
+# Steps reading each config section (see the Generator.generate_* contexts).
+# The build manifest names the shared VIP libraries, keyed by the VIP context.
+CONFIG_STEPS = {
+    ('dut', 'parameters'): ('copy_vip_files', 'generate_tb_top', 'generate_test', 'generate_model_config',
+                            'generate_build_manifest'),
+    ('dut', 'dut_parameters'): ('copy_vip_files', 'generate_tb_top', 'generate_build_manifest'),
+    ('dut', 'source_files'): ('copy_vip_files', 'generate_build_manifest'),
+    ('dut', 'module_name'): ('copy_vip_files', 'generate_tb_top', 'generate_build_manifest'),
+    ('test_plan',): ('copy_vip_files', 'generate_build_manifest'),
+    ('vip',): ('copy_vip_files', 'generate_build_manifest'),
+    ('model',): ('copy_vip_files', 'generate_model_config', 'generate_build_manifest', 'generate_tcl_script'),
+    ('simulation',): ('generate_tcl_script', 'generate_build_manifest'),
+}
+# Anything else (interfaces, output_dir, unknown keys) regenerates every step
+ALL_STEPS = None
+
+
+def steps_for_template(path):
+    """Generator steps rendering a template file, or ALL_STEPS if unknown."""
+    name = os.path.relpath(path, TEMPLATE_DIR).replace("\\", "/")
+    if name in TEMPLATE_STEPS:
+        return {TEMPLATE_STEPS[name]}
+    if name == "vip/vip_signals.yaml":
+        return set()  # planner input only
+    top = name.split("/", 1)[0]
+    if top in TEMPLATE_DIR_STEPS:
+        return set(TEMPLATE_DIR_STEPS[top])
+    return ALL_STEPS
+
+
+def _interfaces_without_port_maps(config):
+    return [{k: v for k, v in intf.items() if k != 'port_map'} for intf in config.get('interfaces', [])]
+
+
+def steps_for_config_change(old, new):
+    """Generator steps affected by the difference between two configs."""
+    steps = set()
+    keys = set(old) | set(new)
+    for key in keys:
+        if old.get(key) == new.get(key):
+            continue
+        if key == 'interfaces':
+            if _interfaces_without_port_maps(old) != _interfaces_without_port_maps(new):
+                return ALL_STEPS
+            steps.add('generate_tb_top')  # only port maps changed
+        elif key == 'dut':
+            old_dut, new_dut = old.get('dut') or {}, new.get('dut') or {}
+            for dut_key in set(old_dut) | set(new_dut):
+                if old_dut.get(dut_key) == new_dut.get(dut_key):
+                    continue
+                if ('dut', dut_key) not in CONFIG_STEPS:
+                    return ALL_STEPS
+                steps.update(CONFIG_STEPS[('dut', dut_key)])
+        elif (key,) in CONFIG_STEPS:
+            steps.update(CONFIG_STEPS[(key,)])
+        else:
+            return ALL_STEPS
+    return steps
+
+
+class WatchSession:
+    def __init__(self, config_path, jobs=1, interval=DEFAULT_INTERVAL):
+        self.config_path = config_path
+        self.jobs = jobs
+        self.interval = interval
+        self.config = load_config(config_path)
+        self.snapshot = {}
+
+    def watched_files(self):
+        files = [self.config_path]
+        for root, dirs, names in os.walk(TEMPLATE_DIR):
+            dirs.sort()
+            files.extend(os.path.join(root, name) for name in sorted(names))
+        sources = self.config['dut'].get('source_files', []) or []
+        dut_files, _ = expand_sources(sources)
+        files.extend(s for s in sources if os.path.isfile(s))  # filelists themselves
+        files.extend(dut_files)
+        return list(dict.fromkeys(os.path.normpath(f) for f in files))
+
+    def take_snapshot(self):
+        snapshot = {}
+        for path in self.watched_files():
+            try:
+                st = os.stat(path)
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                snapshot[path] = None
+        return snapshot
+
+    def changed_files(self):
+        current = self.take_snapshot()
+        changed = [p for p in set(current) | set(self.snapshot)
+                   if current.get(p) != self.snapshot.get(p)]
+        self.snapshot = current
+        return sorted(changed)
+
+    def affected_steps(self, changed):
+        """Steps to run for a set of changed files (ALL_STEPS = None means all)."""
+        steps = set()
+        config_abs = os.path.abspath(self.config_path)
+        template_abs = os.path.abspath(TEMPLATE_DIR)
+
+        # Reload the config first so generation always uses the latest one
+        if any(os.path.abspath(p) == config_abs for p in changed):
+            old = self.config
+            try:
+                self.config = load_config(self.config_path)
+                steps = steps_for_config_change(old, self.config)
+            except SystemExit:
+                print("[Watch] Config invalid, keeping the previous one")
+            if steps is ALL_STEPS:
+                return ALL_STEPS
+
+        for path in changed:
+            path_abs = os.path.abspath(path)
+            if path_abs == config_abs:
+                continue
+            if os.path.commonpath([path_abs, template_abs]) == template_abs:
+                template_steps = steps_for_template(path)
+                if template_steps is ALL_STEPS:
+                    return ALL_STEPS
+                steps |= template_steps
+            else:
+                # DUT source or filelist: port widths, compile units and their includes
+                steps |= {'copy_vip_files', 'generate_build_manifest'}
+        return steps
+
+    def generate(self, steps=ALL_STEPS):
+        start = time.perf_counter()
+        gen = Generator(self.config, incremental=True, jobs=self.jobs)
+        ok = gen.generate(steps=steps)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        scope = "all steps" if steps is ALL_STEPS else ", ".join(sorted(steps))
+        status = "OK" if ok else "ERROR"
+        print(f"[Watch] {status}: {gen.written} written, {gen.skipped} unchanged "
+              f"({scope}) in {elapsed_ms:.1f} ms")
+        return ok
+
+    def run(self):
+        print(f"[Watch] Initial generation from '{self.config_path}'")
+        self.snapshot = self.take_snapshot()
+        self.generate()
+        print(f"[Watch] Watching {len(self.snapshot)} file(s), Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(self.interval)
+                changed = self.changed_files()
+                if not changed:
+                    continue
+                print(f"\n[Watch] Changed: {', '.join(changed)}")
+                steps = self.affected_steps(changed)
+                if steps is not ALL_STEPS and not steps:
+                    print("[Watch] No generated output depends on this change")
+                    continue
+                try:
+                    self.generate(steps)
+                except Exception as e:
+                    print(f"[Error] Generation failed: {e}")
+                # The config may now list other DUT sources: start watching them
+                for path, stat in self.take_snapshot().items():
+                    self.snapshot.setdefault(path, stat)
+        except KeyboardInterrupt:
+            print("\n[Watch] Stopped")
@@ -1,52 +1,119 @@
+from mem_backend import create_memory, load_model_config
+from model_trace import Tracer, OP_WRITE, OP_READ
+
 
 class AHB_Model:
     BYTE     = 0b000
     HALFWORD = 0b001
     WORD     = 0b010
     
-    def __init__(self, mem_size=4096):
-        self.mem = {}
+    def __init__(self, mem_size=None, mem=None, config=None):
+        config = load_model_config() if config is None else config
+        word_bytes = config.get('data_width', 32) // 8
+        if mem_size is None:
+            mem_size = config['ram_depth'] * word_bytes if config.get('ram_depth') else 4096
+        if mem is None:
+            # Accesses are range-checked against mem_size, so a dense buffer always fits
+            mem = create_memory({**config, 'ram_depth': mem_size // word_bytes})
+        self.mem = mem
         self.mem_size = mem_size
+        self.word_bytes = word_bytes
+        self.word_size = word_bytes.bit_length() - 1  # HSIZE of a full bus word
+        self.lane_bits = word_bytes - 1
+        self.word_align = ~(word_bytes - 1)
+        # Transaction trace sink, off by default (see model_trace.py)
+        self.trace = Tracer.from_config("AHB_Model", config)
         
+    def lanes(self, addr, size):
+        """
+        (word address, byte offset, byte count) of an HSIZE transfer. Sub-word
+        data is right-aligned on HWDATA/HRDATA and lands on the addressed lanes.
+        """
+        nbytes = min(1 << size, self.word_bytes)
+        return addr & self.word_align, addr & self.lane_bits & ~(nbytes - 1), nbytes
+
     def write(self, addr, data, size=WORD):
         if addr >= self.mem_size:
-            print(f"[AHB_Model] ERROR: Address 0x{addr:08x} out of range")
+            self.trace.error(f"Address 0x{addr:08x} out of range")
             return
-        
-        if size == self.BYTE:
-            self.mem[addr] = data & 0xFF
-            print(f"[AHB_Model] Write BYTE: Addr=0x{addr:08x}, Data=0x{data & 0xFF:02x}")
-        elif size == self.HALFWORD:
-            aligned_addr = addr & ~0x1
-            self.mem[aligned_addr] = data & 0xFFFF
-            print(f"[AHB_Model] Write HALFWORD: Addr=0x{aligned_addr:08x}, Data=0x{data & 0xFFFF:04x}")
+
+        if size >= self.word_size:
+            word_addr, offset = addr & self.word_align, 0
+            self.mem.store(word_addr, data)
+            data &= self.mem.mask
         else:
-            aligned_addr = addr & ~0x3
-            self.mem[aligned_addr] = data & 0xFFFFFFFF
-            print(f"[AHB_Model] Write WORD: Addr=0x{aligned_addr:08x}, Data=0x{data & 0xFFFFFFFF:08x}")
+            word_addr, offset, nbytes = self.lanes(addr, size)
+            data &= (1 << (8 * nbytes)) - 1
+            self.mem.store_masked(word_addr, data << (8 * offset), ((1 << nbytes) - 1) << offset)
+        if self.trace.enabled:
+            self.trace.txn(OP_WRITE, word_addr + offset, data, size)
+
+    def write_masked(self, addr, data, strb):
+        """Byte-strobed write of lane-positioned data (same lanes as an HSIZE write)."""
+        if addr >= self.mem_size:
+            self.trace.error(f"Address 0x{addr:08x} out of range")
+            return
+        self.mem.store_masked(addr & self.word_align, data, strb)
+        if self.trace.enabled:
+            self.trace.txn(OP_WRITE, addr & self.word_align, data)
 
     def read(self, addr, size=WORD):
         if addr >= self.mem_size:
-            print(f"[AHB_Model] ERROR: Address 0x{addr:08x} out of range")
+            self.trace.error(f"Address 0x{addr:08x} out of range")
             return 0
-        
-        if size == self.BYTE:
-            data = self.mem.get(addr, 0) & 0xFF
-            print(f"[AHB_Model] Read BYTE: Addr=0x{addr:08x}, Data=0x{data:02x}")
-        elif size == self.HALFWORD:
-            aligned_addr = addr & ~0x1
-            data = self.mem.get(aligned_addr, 0) & 0xFFFF
-            print(f"[AHB_Model] Read HALFWORD: Addr=0x{aligned_addr:08x}, Data=0x{data:04x}")
+
+        if size >= self.word_size:
+            word_addr, offset = addr & self.word_align, 0
+            data = self.mem.load(word_addr)
         else:
-            aligned_addr = addr & ~0x3
-            data = self.mem.get(aligned_addr, 0) & 0xFFFFFFFF
-            print(f"[AHB_Model] Read WORD: Addr=0x{aligned_addr:08x}, Data=0x{data:08x}")
-        
+            word_addr, offset, nbytes = self.lanes(addr, size)
+            data = (self.mem.load(word_addr) >> (8 * offset)) & ((1 << (8 * nbytes)) - 1)
+        if self.trace.enabled:
+            self.trace.txn(OP_READ, word_addr + offset, data, size)
         return data
 
+    def write_many(self, addrs, datas, size=WORD):
+        # Out-of-range addresses are reported per transaction
+        if self.trace.enabled or max(addrs, default=0) >= self.mem_size:
+            for addr, data in zip(addrs, datas):
+                self.write(addr, data, size)
+            return
+        align = self.word_align
+        if size >= self.word_size:
+            self.mem.store_many([addr & align for addr in addrs], datas)
+            return
+        # One lane computation for the whole batch, then masked word stores
+        nbytes = 1 << size
+        data_mask = (1 << (8 * nbytes)) - 1
+        lane_select = self.lane_bits & ~(nbytes - 1)
+        strb = (1 << nbytes) - 1
+        self.mem.store_masked_many(
+            [addr & align for addr in addrs],
+            [(data & data_mask) << (8 * (addr & lane_select)) for addr, data in zip(addrs, datas)],
+            [strb << (addr & lane_select) for addr in addrs])
+
+    def write_masked_many(self, addrs, datas, strbs):
+        if self.trace.enabled or max(addrs, default=0) >= self.mem_size:
+            for addr, data, strb in zip(addrs, datas, strbs):
+                self.write_masked(addr, data, strb)
+            return
+        self.mem.store_masked_many([addr & self.word_align for addr in addrs], datas, strbs)
+
+    def read_many(self, addrs, size=WORD):
+        if self.trace.enabled or max(addrs, default=0) >= self.mem_size:
+            return [self.read(addr, size) for addr in addrs]
+        align = self.word_align
+        words = self.mem.load_many([addr & align for addr in addrs])
+        if size >= self.word_size:
+            return words
+        nbytes = 1 << size
+        data_mask = (1 << (8 * nbytes)) - 1
+        lane_select = self.lane_bits & ~(nbytes - 1)
+        return [(word >> (8 * (addr & lane_select))) & data_mask for addr, word in zip(addrs, words)]
+
     def reset(self):
         self.mem.clear()
-        print("[AHB_Model] Memory reset")
+        self.trace.info("Memory reset")
 
 
 model = AHB_Model()
@@ -60,5 +127,21 @@ def dpi_mem_read(addr):
     return model.read(addr, size=AHB_Model.WORD)
 
 
+def dpi_mem_write_many(addrs, datas):
+    model.write_many(addrs, datas, size=AHB_Model.WORD)
+
+
+def dpi_mem_read_many(addrs):
+    return model.read_many(addrs, size=AHB_Model.WORD)
+
+
+def dpi_mem_write_masked(addr, data, strb):
+    model.write_masked(addr, data, strb)
+
+
+def dpi_mem_write_masked_many(addrs, datas, strbs):
+    model.write_masked_many(addrs, datas, strbs)
+
+
 def dpi_mem_reset():
     model.reset()
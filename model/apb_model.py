@@ -1,28 +1,54 @@
+from mem_backend import create_memory, load_model_config
+from model_trace import Tracer, OP_WRITE, OP_READ
+
 
 class APB_Model:
-    def __init__(self):
-        self.mem = {}
+    def __init__(self, mem=None, config=None):
+        config = load_model_config() if config is None else config
+        # Compact word storage sized from model_config.json (see mem_backend.py)
+        self.mem = mem if mem is not None else create_memory(config)
+        # Transaction trace sink, off by default (see model_trace.py)
+        self.trace = Tracer.from_config("APB_Model", config)
 
     def write(self, addr, data):
         """
         Write data to the specified address.
         Address is word-aligned (checking logic can be added here).
         """
-        # Align address to 32-bit word boundary equivalent if needed, 
-        # but here we assume the testbench passes aligned addresses or we treat strictly.
-        # Simple Key-Value storage
-        self.mem[addr] = data
-        print(f"[APB_Model] Write: Addr=0x{addr:08x}, Data=0x{data:08x}")
+        # The backend is word-indexed, so an unaligned address maps onto its
+        # containing word (the testbench passes aligned addresses).
+        self.mem.store(addr, data)
+        if self.trace.enabled:
+            self.trace.txn(OP_WRITE, addr, data)
 
     def read(self, addr):
         """
         Read data from the specified address.
         Returns 0 if address is uninitialized (like the RTL default).
         """
-        data = self.mem.get(addr, 0)
-        print(f"[APB_Model] Read : Addr=0x{addr:08x}, Data=0x{data:08x}")
+        data = self.mem.load(addr)
+        if self.trace.enabled:
+            self.trace.txn(OP_READ, addr, data)
         return data
 
+    def write_many(self, addrs, datas):
+        """
+        Apply a block of writes in order (vectorized DPI batch path).
+        """
+        if self.trace.enabled:
+            for addr, data in zip(addrs, datas):
+                self.write(addr, data)
+        else:
+            self.mem.store_many(addrs, datas)
+
+    def read_many(self, addrs):
+        """
+        Read a block of addresses, returning the data as a list in order.
+        """
+        if self.trace.enabled:
+            return [self.read(addr) for addr in addrs]
+        return self.mem.load_many(addrs)
+
 # Global instance for DPI-C to interact with
 model = APB_Model()
 
@@ -32,3 +58,9 @@ def dpi_mem_write(addr, data):
 
 def dpi_mem_read(addr):
     return model.read(addr)
+
+def dpi_mem_write_many(addrs, datas):
+    model.write_many(addrs, datas)
+
+def dpi_mem_read_many(addrs):
+    return model.read_many(addrs)
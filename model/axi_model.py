@@ -1,17 +1,54 @@
 
+from mem_backend import create_memory, load_model_config
+from model_trace import Tracer, OP_WRITE, OP_READ
+
+
+# AxBURST encodings
+BURST_FIXED = 0
+BURST_INCR  = 1
+BURST_WRAP  = 2
+
+
+def burst_addrs(addr, length, size, burst):
+    """
+    Byte address of every beat of a burst (AXI4 spec A3.4.1).
+    length is AxLEN (beats - 1), size is AxSIZE (2**size bytes per beat).
+    """
+    beats = length + 1
+    nbytes = 1 << size
+    if burst == BURST_FIXED:
+        return [addr] * beats
+    if burst == BURST_WRAP:
+        total = nbytes * beats
+        lower = addr & ~(total - 1)
+        start = addr - lower
+        return [lower + (start + i * nbytes) % total for i in range(beats)]
+    aligned = addr & ~(nbytes - 1)
+    return [addr] + [aligned + i * nbytes for i in range(1, beats)]
+
+
 class AXI_Model:
-    def __init__(self):
-        self.mem = {}
+    def __init__(self, mem=None, config=None):
+        config = load_model_config() if config is None else config
+        # Compact word storage sized from model_config.json (see mem_backend.py)
+        self.mem = mem if mem is not None else create_memory(config)
+        # Transaction trace sink, off by default (see model_trace.py)
+        self.trace = Tracer.from_config("AXI_Model", config)
 
-    def write(self, addr, data):
+    def write(self, addr, data, strb=None):
         """
         Write data to the specified address.
-        AXI is byte-addressable, but here we treat it as word-aligned for simplicity in this model.
+        Data is lane-positioned on the word containing addr; strb (WSTRB)
+        selects the byte lanes written, None = full word.
         """
         # Align address to 32-bit word boundary (mask lower 2 bits)
         aligned_addr = addr & ~0x3
-        self.mem[aligned_addr] = data
-        print(f"[AXI_Model] Write: Addr=0x{addr:08x} (Aligned: 0x{aligned_addr:08x}), Data=0x{data:08x}")
+        if strb is None:
+            self.mem.store(aligned_addr, data)
+        else:
+            self.mem.store_masked(aligned_addr, data, strb)
+        if self.trace.enabled:
+            self.trace.txn(OP_WRITE, aligned_addr, data)
 
     def read(self, addr):
         """
@@ -19,10 +56,55 @@ class AXI_Model:
         Returns 0 if address is uninitialized.
         """
         aligned_addr = addr & ~0x3
-        data = self.mem.get(aligned_addr, 0)
-        print(f"[AXI_Model] Read : Addr=0x{addr:08x} (Aligned: 0x{aligned_addr:08x}), Data=0x{data:08x}")
+        data = self.mem.load(aligned_addr)
+        if self.trace.enabled:
+            self.trace.txn(OP_READ, aligned_addr, data)
         return data
 
+    def write_many(self, addrs, datas):
+        """
+        Apply a block of writes in order (vectorized DPI batch path).
+        """
+        if self.trace.enabled:
+            for addr, data in zip(addrs, datas):
+                self.write(addr, data)
+        else:
+            self.mem.store_many([addr & ~0x3 for addr in addrs], datas)
+
+    def write_masked_many(self, addrs, datas, strbs):
+        """
+        Apply a block of strobed writes in order (WSTRB-heavy batch path).
+        """
+        if self.trace.enabled:
+            for addr, data, strb in zip(addrs, datas, strbs):
+                self.write(addr, data, strb)
+        else:
+            self.mem.store_masked_many([addr & ~0x3 for addr in addrs], datas, strbs)
+
+    def write_burst(self, addr, length, size, burst, datas, strbs=None):
+        """
+        Apply every beat of a write burst (datas/strbs: one entry per beat).
+        """
+        addrs = burst_addrs(addr, length, size, burst)
+        if strbs is None:
+            self.write_many(addrs, datas)
+        else:
+            self.write_masked_many(addrs, datas, strbs)
+
+    def read_burst(self, addr, length, size, burst):
+        """
+        Read every beat of a burst, returning the data as a list in beat order.
+        """
+        return self.read_many(burst_addrs(addr, length, size, burst))
+
+    def read_many(self, addrs):
+        """
+        Read a block of addresses, returning the data as a list in order.
+        """
+        if self.trace.enabled:
+            return [self.read(addr) for addr in addrs]
+        return self.mem.load_many([addr & ~0x3 for addr in addrs])
+
 # Global instance for DPI-C to interact with
 model = AXI_Model()
 
@@ -37,3 +119,21 @@ def dpi_mem_write(addr, data):
 
 def dpi_mem_read(addr):
     return model.read(addr)
+
+def dpi_mem_write_many(addrs, datas):
+    model.write_many(addrs, datas)
+
+def dpi_mem_write_masked(addr, data, strb):
+    model.write(addr, data, strb)
+
+def dpi_mem_write_masked_many(addrs, datas, strbs):
+    model.write_masked_many(addrs, datas, strbs)
+
+def dpi_mem_write_burst(addr, length, size, burst, datas, strbs):
+    model.write_burst(addr, length, size, burst, datas, strbs)
+
+def dpi_mem_read_burst(addr, length, size, burst):
+    return model.read_burst(addr, length, size, burst)
+
+def dpi_mem_read_many(addrs):
+    return model.read_many(addrs)
@@ -0,0 +1,218 @@
+"""
+Compact Memory Backend for the Python Golden Models
+
+Word-addressed storage shared by APB_Model, AXI_Model and AHB_Model.
+Words live in preallocated `array` buffers instead of a dict of boxed ints:
+
+- DenseMemory: one flat buffer sized from RAM_DEPTH x DATA_WIDTH
+- PagedMemory: lazily allocated fixed-size pages for sparse 32-bit spaces
+
+Both return 0 for locations that were never written (like the RTL default).
+
+Partial writes (AXI WSTRB, AHB HSIZE lanes) use store_masked / store_masked_many:
+the byte strobe selects a precomputed bit mask and the word is updated with one
+masked operation (old & ~mask | data & mask), so there is no per-byte loop.
+Sizing comes from model_config.json, written next to run.tcl by the generator.
+"""
+
+import json
+import os
+from array import array
+
+MODEL_CONFIG_FILE = "model_config.json"
+PAGE_WORDS = 1024  # Words per page in sparse mode
+
+
+def load_model_config(path=None):
+    """
+    Load the golden model configuration emitted by the generator.
+
+    Looks at `path`, then $MODEL_CONFIG, then ./model_config.json.
+    Returns an empty dict when no file is found (models fall back to defaults).
+    """
+    path = path or os.environ.get("MODEL_CONFIG", MODEL_CONFIG_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f) or {}
+
+
+def _typecode(data_width):
+    """Smallest unsigned array typecode that holds one data word."""
+    for code in ("I", "L", "Q"):
+        if array(code).itemsize * 8 >= data_width:
+            return code
+    raise ValueError(f"DATA_WIDTH={data_width} is wider than 64 bits")
+
+
+def _zeroed(code, n):
+    return array(code, bytes(array(code).itemsize * n))
+
+
+def lane_masks(word_bytes):
+    """
+    Bit mask for every byte strobe value of a word: lane_masks(4)[0b0101] == 0x00FF00FF.
+    Strobe bits beyond the word are ignored.
+    """
+    masks = [0]
+    for lane in range(word_bytes):
+        byte = 0xFF << (8 * lane)
+        masks += [m | byte for m in masks]
+    return masks
+
+
+class PagedMemory:
+    """
+    Sparse word memory: pages of PAGE_WORDS words are allocated on first write.
+    """
+
+    def __init__(self, data_width=32):
+        self.data_width = data_width
+        self.word_bytes = max(data_width // 8, 1)
+        self.shift = self.word_bytes.bit_length() - 1
+        self.mask = (1 << data_width) - 1
+        self.code = _typecode(data_width)
+        self.full_strb = (1 << self.word_bytes) - 1
+        self.strb_masks = lane_masks(self.word_bytes)
+        self.pages = {}
+
+    def load(self, addr):
+        index = addr >> self.shift
+        page = self.pages.get(index // PAGE_WORDS)
+        if page is None:
+            return 0
+        return page[index % PAGE_WORDS]
+
+    def store(self, addr, data):
+        index = addr >> self.shift
+        page_no = index // PAGE_WORDS
+        page = self.pages.get(page_no)
+        if page is None:
+            page = self.pages[page_no] = _zeroed(self.code, PAGE_WORDS)
+        page[index % PAGE_WORDS] = data & self.mask
+
+    def store_masked(self, addr, data, strb):
+        """Write only the byte lanes enabled in strb (data is lane-positioned)."""
+        mask = self.strb_masks[strb & self.full_strb]
+        index = addr >> self.shift
+        page_no = index // PAGE_WORDS
+        page = self.pages.get(page_no)
+        if page is None:
+            page = self.pages[page_no] = _zeroed(self.code, PAGE_WORDS)
+        offset = index % PAGE_WORDS
+        page[offset] = (page[offset] & ~mask) | (data & mask)
+
+    def load_many(self, addrs):
+        return [self.load(addr) for addr in addrs]
+
+    def store_many(self, addrs, datas):
+        for addr, data in zip(addrs, datas):
+            self.store(addr, data)
+
+    def store_masked_many(self, addrs, datas, strbs):
+        for addr, data, strb in zip(addrs, datas, strbs):
+            self.store_masked(addr, data, strb)
+
+    def clear(self):
+        self.pages.clear()
+
+
+class DenseMemory:
+    """
+    Flat preallocated word memory covering byte addresses [0, depth * word_bytes).
+
+    Accesses beyond the sized range spill into a PagedMemory so the model
+    keeps the old dict semantics (any address can be written and read back).
+    """
+
+    def __init__(self, depth, data_width=32):
+        self.depth = depth
+        self.data_width = data_width
+        self.word_bytes = max(data_width // 8, 1)
+        self.shift = self.word_bytes.bit_length() - 1
+        self.mask = (1 << data_width) - 1
+        self.full_strb = (1 << self.word_bytes) - 1
+        self.strb_masks = lane_masks(self.word_bytes)
+        self.words = _zeroed(_typecode(data_width), depth)
+        self.overflow = None
+
+    def load(self, addr):
+        index = addr >> self.shift
+        if index < self.depth:
+            return self.words[index]
+        if self.overflow is None:
+            return 0
+        return self.overflow.load(addr)
+
+    def store(self, addr, data):
+        index = addr >> self.shift
+        if index < self.depth:
+            self.words[index] = data & self.mask
+            return
+        if self.overflow is None:
+            self.overflow = PagedMemory(self.data_width)
+        self.overflow.store(addr, data)
+
+    def store_masked(self, addr, data, strb):
+        """Write only the byte lanes enabled in strb (data is lane-positioned)."""
+        index = addr >> self.shift
+        if index < self.depth:
+            mask = self.strb_masks[strb & self.full_strb]
+            self.words[index] = (self.words[index] & ~mask) | (data & mask)
+            return
+        if self.overflow is None:
+            self.overflow = PagedMemory(self.data_width)
+        self.overflow.store_masked(addr, data, strb)
+
+    def load_many(self, addrs):
+        words, depth, shift = self.words, self.depth, self.shift
+        out = []
+        for addr in addrs:
+            index = addr >> shift
+            out.append(words[index] if index < depth else self.load(addr))
+        return out
+
+    def store_many(self, addrs, datas):
+        words, depth, shift, mask = self.words, self.depth, self.shift, self.mask
+        for addr, data in zip(addrs, datas):
+            index = addr >> shift
+            if index < depth:
+                words[index] = data & mask
+            else:
+                self.store(addr, data)
+
+    def store_masked_many(self, addrs, datas, strbs):
+        words, depth, shift = self.words, self.depth, self.shift
+        masks, full_strb = self.strb_masks, self.full_strb
+        for addr, data, strb in zip(addrs, datas, strbs):
+            index = addr >> shift
+            if index < depth:
+                mask = masks[strb & full_strb]
+                words[index] = (words[index] & ~mask) | (data & mask)
+            else:
+                self.store_masked(addr, data, strb)
+
+    def clear(self):
+        self.words = _zeroed(self.words.typecode, self.depth)
+        self.overflow = None
+
+
+def create_memory(config=None):
+    """
+    Build the memory backend described by a model config dict.
+
+    Keys (all optional):
+        data_width: word width in bits (default 32)
+        ram_depth:  number of words for dense mode
+        memory:     "dense", "sparse" or "auto" (dense when ram_depth is known)
+    """
+    config = config or {}
+    data_width = int(config.get("data_width", 32))
+    ram_depth = config.get("ram_depth")
+    mode = config.get("memory", "auto")
+
+    if mode == "sparse" or (mode == "auto" and not ram_depth):
+        return PagedMemory(data_width)
+    if not ram_depth:
+        raise ValueError("Dense memory mode requires 'ram_depth' in the model config")
+    return DenseMemory(int(ram_depth), data_width)
@@ -0,0 +1,113 @@
+"""
+Transaction Trace Sink for the Python Golden Models
+
+Replaces the per-transaction `print` calls in the models. Tracing is off by
+default, so the model hot path only checks `tracer.enabled`.
+
+Levels (model.trace.level in config.yaml, or $MODEL_TRACE_LEVEL; number or name):
+    0 OFF   - no transaction output (errors are still printed)
+    1 TXN   - record every transaction to a buffered CSV/binary trace file
+    2 DEBUG - TXN plus the old console echo of every transaction
+
+Binary records are fixed-width little-endian: seq(u64) op(u8) size(u8) pad(2) addr(u32) data(u64).
+"""
+
+import atexit
+import os
+import struct
+
+TRACE_OFF   = 0
+TRACE_TXN   = 1
+TRACE_DEBUG = 2
+
+OP_WRITE = 0
+OP_READ  = 1
+OP_NAMES = {OP_WRITE: "W", OP_READ: "R"}
+
+BIN_RECORD = struct.Struct("<QBBxxIQ")
+
+LEVEL_NAMES = {"OFF": TRACE_OFF, "TXN": TRACE_TXN, "DEBUG": TRACE_DEBUG}
+
+
+def parse_level(value):
+    """Trace level from an int or a level name; anything else warns and means OFF."""
+    text = str(value).strip()
+    if text.upper() in LEVEL_NAMES:
+        return LEVEL_NAMES[text.upper()]
+    try:
+        return int(text)
+    except ValueError:
+        print(f"[Warning] Unknown model trace level {value!r} "
+              f"(expected 0-2 or {'/'.join(LEVEL_NAMES)}), tracing is off")
+        return TRACE_OFF
+
+
+class Tracer:
+    def __init__(self, name, level=TRACE_OFF, path=None, fmt="csv", flush_size=4096):
+        self.name = name
+        self.level = parse_level(os.environ.get("MODEL_TRACE_LEVEL", level))
+        self.enabled = self.level >= TRACE_TXN
+        self.fmt = fmt
+        self.flush_size = max(int(flush_size), 1)
+        self.path = path or f"{name.lower()}_trace.{'bin' if fmt == 'bin' else 'csv'}"
+        self.seq = 0
+        self._rows = []
+        self._file = None
+
+        if self.enabled:
+            mode = "wb" if fmt == "bin" else "w"
+            self._file = open(self.path, mode)
+            if fmt != "bin":
+                self._file.write("seq,op,addr,data,size\n")
+            atexit.register(self.close)
+
+    @classmethod
+    def from_config(cls, name, config):
+        """Build a tracer from the 'trace' section of model_config.json."""
+        trace_cfg = (config or {}).get("trace", {}) or {}
+        return cls(
+            name,
+            level=trace_cfg.get("level", TRACE_OFF),
+            path=trace_cfg.get("path"),
+            fmt=trace_cfg.get("format", "csv"),
+            flush_size=trace_cfg.get("flush_size", 4096),
+        )
+
+    def txn(self, op, addr, data, size=0):
+        """Record one transaction. Callers should check `enabled` first."""
+        self.seq += 1
+        if self.fmt == "bin":
+            self._rows.append(BIN_RECORD.pack(self.seq, op, size, addr, data))
+        else:
+            self._rows.append(f"{self.seq},{OP_NAMES[op]},0x{addr:08x},0x{data:x},{size}\n")
+
+        if self.level >= TRACE_DEBUG:
+            kind = "Write" if op == OP_WRITE else "Read "
+            print(f"[{self.name}] {kind}: Addr=0x{addr:08x}, Data=0x{data:08x}")
+
+        if len(self._rows) >= self.flush_size:
+            self.flush()
+
+    def info(self, msg):
+        if self.level >= TRACE_DEBUG:
+            print(f"[{self.name}] {msg}")
+
+    def error(self, msg):
+        print(f"[{self.name}] ERROR: {msg}")
+
+    def flush(self):
+        if self._file is None or not self._rows:
+            return
+        if self.fmt == "bin":
+            self._file.write(b"".join(self._rows))
+        else:
+            self._file.write("".join(self._rows))
+        self._rows.clear()
+        self._file.flush()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
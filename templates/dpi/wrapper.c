@@ -1,56 +1,90 @@
 #include <Python.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
 #include "svdpi.h"
 
 // Python Module and Function References
 static PyObject *pModule = NULL;
 
+// Function handles are resolved once in dpi_python_init() and reused for
+// every transaction, so the hot path never repeats the attribute lookup.
+static PyObject *pWriteFunc     = NULL;  // dpi_mem_write(addr, data)
+static PyObject *pReadFunc      = NULL;  // dpi_mem_read(addr)
+static PyObject *pWriteManyFunc = NULL;  // dpi_mem_write_many(addrs, datas) (optional)
+static PyObject *pReadManyFunc  = NULL;  // dpi_mem_read_many(addrs)         (optional)
+static PyObject *pWriteMaskedFunc     = NULL;  // dpi_mem_write_masked(addr, data, strb)        (optional)
+static PyObject *pWriteMaskedManyFunc = NULL;  // dpi_mem_write_masked_many(addrs, datas, strbs) (optional)
+static PyObject *pWriteBurstFunc = NULL;  // dpi_mem_write_burst(addr, len, size, burst, datas, strbs) (optional)
+static PyObject *pReadBurstFunc  = NULL;  // dpi_mem_read_burst(addr, len, size, burst)               (optional)
+
+// Look up a callable in the model module. Optional functions may be missing;
+// the batch entry points then fall back to the per-transaction handles.
+static PyObject *resolve_func(const char *name, int required) {
+    PyObject *pFunc = PyObject_GetAttrString(pModule, name);
+    if (pFunc && PyCallable_Check(pFunc)) {
+        return pFunc;
+    }
+    Py_XDECREF(pFunc);
+    if (required) {
+        if (PyErr_Occurred()) PyErr_Print();
+        fprintf(stderr, "[DPI-C] Error: Cannot find function '%s'\n", name);
+    } else {
+        PyErr_Clear();
+    }
+    return NULL;
+}
+
 // Initialize Python Interpreter and Load Module
 void dpi_python_init() {
     if (pModule != NULL) return; // Already initialized
 
     Py_Initialize();
-    
+
     // Add current directory to sys.path
     PyRun_SimpleString("import sys");
-    PyRun_SimpleString("sys.path.append('.')"); 
+    PyRun_SimpleString("sys.path.append('.')");
     PyRun_SimpleString("sys.path.append('./model')"); // Assuming model is in ./model
 
     pModule = PyImport_ImportModule("{{ model_module_name }}");
-    
+
     if (pModule == NULL) {
         PyErr_Print();
         fprintf(stderr, "[DPI-C] Error: Failed to import python module '{{ model_module_name }}'\n");
-    } else {
-        printf("[DPI-C] Python module '{{ model_module_name }}' loaded successfully.\n");
+        return;
     }
+    printf("[DPI-C] Python module '{{ model_module_name }}' loaded successfully.\n");
+
+    pWriteFunc     = resolve_func("dpi_mem_write", 1);
+    pReadFunc      = resolve_func("dpi_mem_read", 1);
+    pWriteManyFunc = resolve_func("dpi_mem_write_many", 0);
+    pReadManyFunc  = resolve_func("dpi_mem_read_many", 0);
+    pWriteMaskedFunc     = resolve_func("dpi_mem_write_masked", 0);
+    pWriteMaskedManyFunc = resolve_func("dpi_mem_write_masked_many", 0);
+    pWriteBurstFunc = resolve_func("dpi_mem_write_burst", 0);
+    pReadBurstFunc  = resolve_func("dpi_mem_read_burst", 0);
+}
+
+// Call a cached handle with two unsigned int arguments, returning the result
+// (new reference) or NULL after printing the Python error.
+static PyObject *call_func(PyObject *pFunc, PyObject *pArg0, PyObject *pArg1) {
+    PyObject *pValue = PyObject_CallFunctionObjArgs(pFunc, pArg0, pArg1, NULL);
+    if (pValue == NULL) PyErr_Print();
+    return pValue;
 }
 
 // Function to call Python 'dpi_mem_write'
 // SV signature: import "DPI-C" context function void dpi_mem_write(int addr, int data);
 void dpi_mem_write(int addr, int data) {
     if (pModule == NULL) dpi_python_init();
+    if (pWriteFunc == NULL) return;
 
-    if (pModule != NULL) {
-        PyObject *pFunc = PyObject_GetAttrString(pModule, "dpi_mem_write");
-        if (pFunc && PyCallable_Check(pFunc)) {
-            PyObject *pArgs = PyTuple_New(2);
-            PyTuple_SetItem(pArgs, 0, PyLong_FromUnsignedLong((unsigned int)addr));
-            PyTuple_SetItem(pArgs, 1, PyLong_FromUnsignedLong((unsigned int)data));
-            
-            PyObject *pValue = PyObject_CallObject(pFunc, pArgs);
-            if (pValue != NULL) {
-                Py_DECREF(pValue);
-            } else {
-                PyErr_Print();
-            }
-            Py_DECREF(pArgs);
-            Py_DECREF(pFunc);
-        } else {
-            if (PyErr_Occurred()) PyErr_Print();
-            fprintf(stderr, "[DPI-C] Error: Cannot find function 'dpi_mem_write'\n");
-        }
-    }
+    PyObject *pAddr = PyLong_FromUnsignedLong((unsigned int)addr);
+    PyObject *pData = PyLong_FromUnsignedLong((unsigned int)data);
+    PyObject *pValue = call_func(pWriteFunc, pAddr, pData);
+    Py_XDECREF(pValue);
+    Py_DECREF(pAddr);
+    Py_DECREF(pData);
 }
 
 // Function to call Python 'dpi_mem_read'
@@ -58,31 +92,343 @@ void dpi_mem_write(int addr, int data) {
 int dpi_mem_read(int addr) {
     int result = 0;
     if (pModule == NULL) dpi_python_init();
+    if (pReadFunc == NULL) return result;
+
+    PyObject *pAddr = PyLong_FromUnsignedLong((unsigned int)addr);
+    PyObject *pValue = call_func(pReadFunc, pAddr, NULL);
+    if (pValue != NULL) {
+        result = (int)PyLong_AsUnsignedLong(pValue);
+        Py_DECREF(pValue);
+    }
+    Py_DECREF(pAddr);
+    return result;
+}
+
+// Byte-strobed write (AXI WSTRB, AHB HSIZE lanes): data is lane-positioned and
+// only the lanes set in strb are written. Models without a masked API get a
+// full-word write.
+// SV signature: import "DPI-C" context function void dpi_mem_write_masked(int addr, int data, int strb);
+void dpi_mem_write_masked(int addr, int data, int strb) {
+    if (pModule == NULL) dpi_python_init();
+    if (pWriteMaskedFunc == NULL) {
+        dpi_mem_write(addr, data);
+        return;
+    }
+
+    PyObject *pAddr = PyLong_FromUnsignedLong((unsigned int)addr);
+    PyObject *pData = PyLong_FromUnsignedLong((unsigned int)data);
+    PyObject *pStrb = PyLong_FromUnsignedLong((unsigned int)strb);
+    PyObject *pValue = PyObject_CallFunctionObjArgs(pWriteMaskedFunc, pAddr, pData, pStrb, NULL);
+    if (pValue == NULL) PyErr_Print();
+    Py_XDECREF(pValue);
+    Py_DECREF(pAddr);
+    Py_DECREF(pData);
+    Py_DECREF(pStrb);
+}
+
+// Copy n elements of an SV open int array into a new Python list.
+static PyObject *open_array_to_list(const svOpenArrayHandle h, int n) {
+    PyObject *pList = PyList_New(n);
+    int low = svLow(h, 1);
+    for (int i = 0; i < n; i++) {
+        unsigned int v = *(unsigned int *)svGetArrElemPtr1(h, low + i);
+        PyList_SET_ITEM(pList, i, PyLong_FromUnsignedLong(v));
+    }
+    return pList;
+}
+
+// Clamp a caller-supplied element count to the open array's actual size,
+// so a bad n can never read or write past the end of the SV array.
+static int clamp_count(const svOpenArrayHandle h, int n, const char *func) {
+    int size = svSize(h, 1);
+    if (n > size) {
+        printf("[DPI-C] Warning: %s called with n=%d but the array has %d element(s)\n", func, n, size);
+        return size;
+    }
+    return n;
+}
+
+// Batched write: one Python call for n transactions.
+// SV signature: import "DPI-C" context function void dpi_mem_write_batch(input int addrs[], input int datas[], input int n);
+void dpi_mem_write_batch(const svOpenArrayHandle addrs, const svOpenArrayHandle datas, int n) {
+    if (pModule == NULL) dpi_python_init();
+    n = clamp_count(addrs, n, "dpi_mem_write_batch");
+    n = clamp_count(datas, n, "dpi_mem_write_batch");
+    if (pWriteFunc == NULL || n <= 0) return;
 
-    if (pModule != NULL) {
-        PyObject *pFunc = PyObject_GetAttrString(pModule, "dpi_mem_read");
-        if (pFunc && PyCallable_Check(pFunc)) {
-            PyObject *pArgs = PyTuple_New(1);
-            PyTuple_SetItem(pArgs, 0, PyLong_FromUnsignedLong((unsigned int)addr));
-            
-            PyObject *pValue = PyObject_CallObject(pFunc, pArgs);
+    PyObject *pAddrs = open_array_to_list(addrs, n);
+    PyObject *pDatas = open_array_to_list(datas, n);
+
+    if (pWriteManyFunc != NULL) {
+        PyObject *pValue = call_func(pWriteManyFunc, pAddrs, pDatas);
+        Py_XDECREF(pValue);
+    } else {
+        // Model has no vectorized API: still saves the SV->C crossings
+        for (int i = 0; i < n; i++) {
+            PyObject *pValue = call_func(pWriteFunc, PyList_GET_ITEM(pAddrs, i), PyList_GET_ITEM(pDatas, i));
+            if (pValue == NULL) break;
+            Py_DECREF(pValue);
+        }
+    }
+    Py_DECREF(pAddrs);
+    Py_DECREF(pDatas);
+}
+
+// Batched read: fills results[0..n-1] with the model's expected data.
+// SV signature: import "DPI-C" context function void dpi_mem_read_batch(input int addrs[], output int results[], input int n);
+void dpi_mem_read_batch(const svOpenArrayHandle addrs, const svOpenArrayHandle results, int n) {
+    if (pModule == NULL) dpi_python_init();
+    n = clamp_count(addrs, n, "dpi_mem_read_batch");
+    n = clamp_count(results, n, "dpi_mem_read_batch");
+    if (pReadFunc == NULL || n <= 0) return;
+
+    PyObject *pAddrs = open_array_to_list(addrs, n);
+    int low = svLow(results, 1);
+
+    if (pReadManyFunc != NULL) {
+        PyObject *pValue = call_func(pReadManyFunc, pAddrs, NULL);
+        PyObject *pSeq = pValue ? PySequence_Fast(pValue, "dpi_mem_read_many must return a sequence") : NULL;
+        if (pSeq != NULL) {
+            Py_ssize_t len = PySequence_Fast_GET_SIZE(pSeq);
+            for (int i = 0; i < n; i++) {
+                int *dst = (int *)svGetArrElemPtr1(results, low + i);
+                *dst = (i < len) ? (int)PyLong_AsUnsignedLong(PySequence_Fast_GET_ITEM(pSeq, i)) : 0;
+            }
+            Py_DECREF(pSeq);
+        } else if (pValue != NULL) {
+            PyErr_Print();
+        }
+        Py_XDECREF(pValue);
+    } else {
+        for (int i = 0; i < n; i++) {
+            int *dst = (int *)svGetArrElemPtr1(results, low + i);
+            PyObject *pValue = call_func(pReadFunc, PyList_GET_ITEM(pAddrs, i), NULL);
+            *dst = 0;
             if (pValue != NULL) {
-                result = (int)PyLong_AsUnsignedLong(pValue);
+                *dst = (int)PyLong_AsUnsignedLong(pValue);
                 Py_DECREF(pValue);
-            } else {
+            }
+        }
+    }
+    Py_DECREF(pAddrs);
+}
+
+// Batched strobed write: one Python call for n partial (or full) writes.
+// SV signature: import "DPI-C" context function void dpi_mem_write_masked_batch(input int addrs[], input int datas[], input int strbs[], input int n);
+void dpi_mem_write_masked_batch(const svOpenArrayHandle addrs, const svOpenArrayHandle datas,
+                                const svOpenArrayHandle strbs, int n) {
+    if (pModule == NULL) dpi_python_init();
+    n = clamp_count(addrs, n, "dpi_mem_write_masked_batch");
+    n = clamp_count(datas, n, "dpi_mem_write_masked_batch");
+    n = clamp_count(strbs, n, "dpi_mem_write_masked_batch");
+    if (n <= 0) return;
+    if (pWriteMaskedManyFunc == NULL && pWriteMaskedFunc == NULL) {
+        dpi_mem_write_batch(addrs, datas, n);
+        return;
+    }
+
+    PyObject *pAddrs = open_array_to_list(addrs, n);
+    PyObject *pDatas = open_array_to_list(datas, n);
+    PyObject *pStrbs = open_array_to_list(strbs, n);
+
+    if (pWriteMaskedManyFunc != NULL) {
+        PyObject *pValue = PyObject_CallFunctionObjArgs(pWriteMaskedManyFunc, pAddrs, pDatas, pStrbs, NULL);
+        if (pValue == NULL) PyErr_Print();
+        Py_XDECREF(pValue);
+    } else {
+        for (int i = 0; i < n; i++) {
+            PyObject *pValue = PyObject_CallFunctionObjArgs(pWriteMaskedFunc, PyList_GET_ITEM(pAddrs, i),
+                                                            PyList_GET_ITEM(pDatas, i), PyList_GET_ITEM(pStrbs, i), NULL);
+            if (pValue == NULL) {
                 PyErr_Print();
+                break;
             }
-            Py_DECREF(pArgs);
-            Py_DECREF(pFunc);
-        } else {
-            if (PyErr_Occurred()) PyErr_Print();
-            fprintf(stderr, "[DPI-C] Error: Cannot find function 'dpi_mem_read'\n");
+            Py_DECREF(pValue);
         }
     }
-    return result;
+    Py_DECREF(pAddrs);
+    Py_DECREF(pDatas);
+    Py_DECREF(pStrbs);
+}
+
+// ---------------------------------------------------------------------------
+// Bursts (AXI INCR/WRAP/FIXED): all beats cross into Python in one call.
+// len is AxLEN (beats - 1), size is AxSIZE, burst is AxBURST.
+// ---------------------------------------------------------------------------
+#define BURST_FIXED 0
+#define BURST_WRAP  2
+
+// Beat address (AXI4 spec A3.4.1), used when the model has no burst API
+static unsigned int burst_beat_addr(unsigned int addr, int len, int size, int burst, int i) {
+    unsigned int nbytes = 1u << size;
+    unsigned int total = nbytes * (unsigned int)(len + 1);
+    unsigned int lower;
+    if (burst == BURST_FIXED) return addr;
+    if (burst == BURST_WRAP) {
+        lower = addr & ~(total - 1);
+        return lower + (addr - lower + (unsigned int)i * nbytes) % total;
+    }
+    return (i == 0) ? addr : (addr & ~(nbytes - 1)) + (unsigned int)i * nbytes;
+}
+
+// SV signature: import "DPI-C" context function void dpi_mem_write_burst(int addr, int len, int size, int burst,
+//                                                                       input int datas[], input int strbs[]);
+void dpi_mem_write_burst(int addr, int len, int size, int burst,
+                         const svOpenArrayHandle datas, const svOpenArrayHandle strbs) {
+    int n = len + 1;
+    if (pModule == NULL) dpi_python_init();
+    n = clamp_count(datas, n, "dpi_mem_write_burst");
+    n = clamp_count(strbs, n, "dpi_mem_write_burst");
+    if (pModule == NULL || n <= 0) return;
+
+    // Per beat when the model has no burst API, or for the beats present in a short array
+    if (pWriteBurstFunc == NULL || n < len + 1) {
+        int dlow = svLow(datas, 1);
+        int slow = svLow(strbs, 1);
+        for (int i = 0; i < n; i++) {
+            dpi_mem_write_masked((int)burst_beat_addr((unsigned int)addr, len, size, burst, i),
+                                 *(int *)svGetArrElemPtr1(datas, dlow + i),
+                                 *(int *)svGetArrElemPtr1(strbs, slow + i));
+        }
+        return;
+    }
+
+    PyObject *pDatas = open_array_to_list(datas, n);
+    PyObject *pStrbs = open_array_to_list(strbs, n);
+    PyObject *pValue = PyObject_CallFunction(pWriteBurstFunc, "IiiiOO", (unsigned int)addr, len, size, burst,
+                                             pDatas, pStrbs);
+    if (pValue == NULL) PyErr_Print();
+    Py_XDECREF(pValue);
+    Py_DECREF(pDatas);
+    Py_DECREF(pStrbs);
+}
+
+// Fills results[0..len] with the expected data of every beat.
+// SV signature: import "DPI-C" context function void dpi_mem_read_burst(int addr, int len, int size, int burst,
+//                                                                      output int results[]);
+void dpi_mem_read_burst(int addr, int len, int size, int burst, const svOpenArrayHandle results) {
+    int n = len + 1;
+    int low = svLow(results, 1);
+    if (pModule == NULL) dpi_python_init();
+    n = clamp_count(results, n, "dpi_mem_read_burst");
+    if (pModule == NULL || n <= 0) return;
+
+    if (pReadBurstFunc == NULL) {
+        for (int i = 0; i < n; i++) {
+            *(int *)svGetArrElemPtr1(results, low + i) =
+                dpi_mem_read((int)burst_beat_addr((unsigned int)addr, len, size, burst, i));
+        }
+        return;
+    }
+
+    PyObject *pValue = PyObject_CallFunction(pReadBurstFunc, "Iiii", (unsigned int)addr, len, size, burst);
+    PyObject *pSeq = pValue ? PySequence_Fast(pValue, "dpi_mem_read_burst must return a sequence") : NULL;
+    if (pSeq != NULL) {
+        Py_ssize_t got = PySequence_Fast_GET_SIZE(pSeq);
+        for (int i = 0; i < n; i++) {
+            int *dst = (int *)svGetArrElemPtr1(results, low + i);
+            *dst = (i < got) ? (int)PyLong_AsUnsignedLong(PySequence_Fast_GET_ITEM(pSeq, i)) : 0;
+        }
+        Py_DECREF(pSeq);
+    } else {
+        PyErr_Print();
+    }
+    Py_XDECREF(pValue);
+}
+
+// ---------------------------------------------------------------------------
+// Transaction recording (model.check_mode: record)
+// Scoreboards append fixed-width records to a binary log instead of calling
+// the Python model; main/utils/txn_check.py checks the log after the run.
+// Layout (little-endian), see txn_check.py:
+//   header 32 bytes: "UVMTXN01" record_size(u16) data_width(u16) addr_width(u16)
+//                    pad(2) protocol(8) pad(8)
+//   record 32 bytes: time(u64) addr(u64) data(u64) strb(u32) kind(u8) size(u8) resp(u8) id(u8)
+// ---------------------------------------------------------------------------
+#define TXN_RECORD_SIZE 32
+#define TXN_BUFFER_SIZE (1 << 20)
+
+static FILE *txnFile = NULL;
+static int txnUsers = 0;  // scoreboards sharing the log
+
+static void put_le(unsigned char *p, unsigned long long v, int n) {
+    for (int i = 0; i < n; i++) p[i] = (unsigned char)(v >> (8 * i));
+}
+
+// Flush buffered records if the simulator exits without final_phase
+static void txn_atexit(void) {
+    if (txnFile != NULL) {
+        fclose(txnFile);
+        txnFile = NULL;
+    }
+}
+
+// SV signature: import "DPI-C" function void dpi_txn_open(string path, string protocol, int data_width, int addr_width);
+void dpi_txn_open(const char *path, const char *protocol, int data_width, int addr_width) {
+    static int atexit_registered = 0;
+    unsigned char header[32] = {0};
+
+    txnUsers++;
+    if (txnFile != NULL) return;  // already opened by another scoreboard
+
+    txnFile = fopen(path, "wb");
+    if (txnFile == NULL) {
+        fprintf(stderr, "[DPI-C] Error: Cannot open transaction log '%s'\n", path);
+        return;
+    }
+    setvbuf(txnFile, NULL, _IOFBF, TXN_BUFFER_SIZE);
+
+    memcpy(header, "UVMTXN01", 8);
+    put_le(header + 8, TXN_RECORD_SIZE, 2);
+    put_le(header + 10, (unsigned int)data_width, 2);
+    put_le(header + 12, (unsigned int)addr_width, 2);
+    strncpy((char *)header + 16, protocol, 8);
+    fwrite(header, 1, sizeof(header), txnFile);
+
+    if (!atexit_registered) {
+        atexit(txn_atexit);
+        atexit_registered = 1;
+    }
+    printf("[DPI-C] Recording transactions to '%s'\n", path);
+}
+
+// SV signature: import "DPI-C" function void dpi_txn_record(int kind, longint unsigned addr, longint unsigned data,
+//                                                          int strb, int size, int resp, int id, longint unsigned timestamp);
+void dpi_txn_record(int kind, unsigned long long addr, unsigned long long data,
+                    int strb, int size, int resp, int id, unsigned long long timestamp) {
+    unsigned char rec[TXN_RECORD_SIZE];
+    if (txnFile == NULL) return;
+
+    put_le(rec, timestamp, 8);
+    put_le(rec + 8, addr, 8);
+    put_le(rec + 16, data, 8);
+    put_le(rec + 24, (unsigned int)strb, 4);
+    rec[28] = (unsigned char)kind;
+    rec[29] = (unsigned char)size;
+    rec[30] = (unsigned char)resp;
+    rec[31] = (unsigned char)id;
+    fwrite(rec, 1, TXN_RECORD_SIZE, txnFile);
+}
+
+// SV signature: import "DPI-C" function void dpi_txn_close();
+void dpi_txn_close(void) {
+    if (txnUsers > 0) txnUsers--;
+    if (txnUsers == 0) txn_atexit();
 }
 
 // Clean up (Optional, usually simulation ends abruptly)
 void dpi_python_finalize() {
+    Py_XDECREF(pWriteFunc);
+    Py_XDECREF(pReadFunc);
+    Py_XDECREF(pWriteManyFunc);
+    Py_XDECREF(pReadManyFunc);
+    Py_XDECREF(pWriteMaskedFunc);
+    Py_XDECREF(pWriteMaskedManyFunc);
+    Py_XDECREF(pWriteBurstFunc);
+    Py_XDECREF(pReadBurstFunc);
+    Py_XDECREF(pModule);
+    pWriteFunc = pReadFunc = pWriteManyFunc = pReadManyFunc = NULL;
+    pWriteMaskedFunc = pWriteMaskedManyFunc = pWriteBurstFunc = pReadBurstFunc = NULL;
+    pModule = NULL;
     Py_Finalize();
 }
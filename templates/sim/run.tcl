@@ -1,10 +1,16 @@
 # Tcl script to run simulation in Vivado (Project-less flow)
 # Run with: vivado -mode batch -source run.tcl
+# Build only (compile + elaborate, used by python -m main.regress):
+#           vivado -mode batch -source run.tcl -tclargs build
+# Builds are incremental (unchanged units are not recompiled); full rebuild:
+#           vivado -mode batch -source run.tcl -tclargs clean
 
 #=============================================================================
 # PROCEDURE: save_report - saves simulation log to report directory
+#   Also writes summary_<timestamp>.json (iterations, matches, mismatches,
+#   first failing address, runtime) in the format of main/utils/sim_monitor.py
 #=============================================================================
-proc save_report {log_file report_dir timestamp protocol} {
+proc save_report {log_file report_dir timestamp protocol runtime} {
     if {[file exists $log_file]} {
         set dest_log [file join $report_dir $log_file]
         file copy -force $log_file $dest_log
@@ -16,15 +22,32 @@ proc save_report {log_file report_dir timestamp protocol} {
         puts $fp "Log File: $log_file"
         puts $fp ""
         
+        set reads 0
+        set mismatches 0
+        set errors 0
+        set fatals 0
+        set first_addr ""
+        set in_summary 0
         if {[catch {
             set log_content [open $log_file r]
-            set in_summary 0
             while {[gets $log_content line] >= 0} {
                 if {[string match "*UVM Report Summary*" $line]} {
                     set in_summary 1
                 }
                 if {$in_summary} {
                     puts $fp $line
+                    continue
+                }
+                if {[string match {*\[SCB\] READ:*} $line]} {
+                    incr reads
+                } elseif {[regexp {^UVM_(ERROR|FATAL) [^@]*@} $line -> severity]} {
+                    if {$severity eq "ERROR"} { incr errors } else { incr fatals }
+                    if {[string match {*\[SCB_MISMATCH\]*} $line]} {
+                        incr mismatches
+                        if {$first_addr eq "" && [regexp {Addr=0x([0-9a-fA-F]+)} $line -> addr]} {
+                            set first_addr "0x[string tolower $addr]"
+                        }
+                    }
                 }
             }
             close $log_content
@@ -32,22 +55,179 @@ proc save_report {log_file report_dir timestamp protocol} {
             puts $fp "Error reading log: $err"
         }
         close $fp
+
+        if {$in_summary && $errors == 0 && $fatals == 0} { set status "PASS" } else { set status "FAIL" }
+        set first_json [expr {$first_addr eq "" ? "null" : "\"$first_addr\""}]
+        set json_file [file join $report_dir "summary_$timestamp.json"]
+        set jf [open $json_file w]
+        puts $jf "\{"
+        puts $jf "  \"status\": \"$status\","
+        puts $jf "  \"protocol\": \"$protocol\","
+        puts $jf "  \"completed\": [expr {$in_summary ? "true" : "false"}],"
+        puts $jf "  \"iterations\": $reads,"
+        puts $jf "  \"matches\": [expr {max(0, $reads - $mismatches)}],"
+        puts $jf "  \"mismatches\": $mismatches,"
+        puts $jf "  \"uvm_errors\": $errors,"
+        puts $jf "  \"uvm_fatals\": $fatals,"
+        puts $jf "  \"first_mismatch_addr\": $first_json,"
+        puts $jf "  \"runtime_s\": $runtime,"
+        puts $jf "  \"log\": \"[file tail $log_file]\""
+        puts $jf "\}"
+        close $jf
         
         puts "\n========================================="
         puts "  Simulation Complete"
         puts "========================================="
         puts "Log:     $dest_log"
         puts "Summary: $summary_file"
+        puts "Result:  $status ($reads iterations, $mismatches mismatches)"
         puts "=========================================\n"
     } else {
         puts "ERROR: Log file not found: $log_file"
     }
 }
 
+#=============================================================================
+# Incremental build
+#   Content checksums (size + CRC-32 from Tcl's built-in zlib) of wrapper.c,
+#   the Python/GCC toolchain and the dependencies of every compilation unit in
+#   {{ build_manifest }} are kept in xsim.dir/build_state.tcl. Steps whose
+#   inputs are unchanged are skipped; -tclargs clean forces a full rebuild.
+#=============================================================================
+proc file_checksum {path} {
+    if {![file isfile $path]} { return "missing" }
+    set fp [open $path rb]
+    set crc 0
+    set size 0
+    while {![eof $fp]} {
+        set chunk [read $fp 1048576]
+        set crc [zlib crc32 $chunk $crc]
+        incr size [string length $chunk]
+    }
+    close $fp
+    return "$size:$crc"
+}
+
+proc inputs_key {paths args} {
+    set parts $args
+    foreach path $paths {
+        lappend parts "$path=[file_checksum $path]"
+    }
+    return [join $parts "\n"]
+}
+
+proc load_build_state {path} {
+    if {![file exists $path]} { return [dict create] }
+    set fp [open $path r]
+    set state [read $fp]
+    close $fp
+    if {[catch {dict size $state}]} { return [dict create] }
+    return $state
+}
+
+proc save_build_state {path state} {
+    set fp [open $path w]
+    puts $fp $state
+    close $fp
+}
+
+# Copies src to dst unless dst already has the same content; returns 1 if copied
+proc copy_if_changed {src dst} {
+    if {[file exists $dst] && [file size $src] == [file size $dst]} {
+        if {[file mtime $src] == [file mtime $dst] || [file_checksum $src] eq [file_checksum $dst]} {
+            return 0
+        }
+    }
+    file copy -force $src $dst
+    return 1
+}
+
+# Seconds after which another build's VIP library lock is considered stale
+set ::vip_lock_timeout 1800
+
+# Compiles a shared VIP library (see vip_libraries in {{ build_manifest }}) once
+# per Vivado version and returns its "-L name=path" argument, or "" on errors.
+# Builds running in parallel wait on a lock file instead of compiling it twice.
+proc ensure_vip_library {lib tool_version} {
+    set name [dict get $lib name]
+    regsub -all {[^A-Za-z0-9_.-]} $tool_version "_" version_tag
+    set dir [file join [dict get $lib dir] "xsim_$version_tag"]
+    set lib_arg "$name=[file join $dir $name]"
+    set stamp [file join $dir ".complete"]
+    if {[file exists $stamp]} {
+        puts "VIP library $name: precompiled"
+        return $lib_arg
+    }
+
+    file mkdir [dict get $lib dir]
+    set lock "$dir.lock"
+    while {[catch {open $lock {WRONLY CREAT EXCL}} lock_fp]} {
+        if {[file exists $stamp]} {
+            puts "VIP library $name: compiled by another build"
+            return $lib_arg
+        }
+        if {[catch {file mtime $lock} mtime] == 0 && [clock seconds] - $mtime > $::vip_lock_timeout} {
+            file delete -force $lock
+        }
+        after 1000
+    }
+    # The previous lock holder may have finished between our checks
+    if {[file exists $stamp]} {
+        close $lock_fp
+        file delete -force $lock
+        puts "VIP library $name: compiled by another build"
+        return $lib_arg
+    }
+
+    set include_flags [list]
+    foreach incdir [dict get $lib incdirs] { lappend include_flags -i $incdir }
+    puts "VIP library $name: compiling into $dir"
+    file delete -force $dir
+    file mkdir $dir
+    set failed [catch {exec xvlog -sv -L uvm -work $lib_arg {*}$include_flags {*}[dict get $lib sources] \
+        >@stdout 2>@1} err]
+    if {$failed} {
+        puts "Error: $err"
+        file delete -force $dir
+    } else {
+        close [open $stamp w]
+    }
+    close $lock_fp
+    file delete -force $lock
+    return [expr {$failed ? "" : $lib_arg}]
+}
+
+#=============================================================================
+# PROCEDURE: check_transactions - offline scoreboard check (check_mode: record)
+#   The scoreboards wrote every transaction to {{ txn_log }}; compare them
+#   against the golden model with main/utils/txn_check.py
+#=============================================================================
+proc check_transactions {report_dir timestamp} {
+    set txn_log "{{ txn_log }}"
+    set summary [file join $report_dir "txn_check_$timestamp.json"]
+    set cmd [list "{{ python_exe }}" -m main.utils.txn_check $txn_log --summary $summary]
+    if {![file exists $txn_log]} {
+        puts "ERROR: Transaction log not found: $txn_log"
+        return 0
+    }
+    if {[auto_execok [lindex $cmd 0]] eq ""} {
+        puts "Python not found, check the transactions with:"
+        puts "  cd [pwd] && python -m main.utils.txn_check $txn_log"
+        return 0
+    }
+    puts "### Checking recorded transactions (txn_check) ###"
+    set old_path [expr {[info exists ::env(PYTHONPATH)] ? $::env(PYTHONPATH) : ""}]
+    set ::env(PYTHONPATH) [join [concat [list "{{ project_root }}"] $old_path] $::tcl_platform(pathSeparator)]
+    set failed [catch {exec {*}$cmd >@stdout 2>@1}]
+    if {$old_path eq ""} { unset ::env(PYTHONPATH) } else { set ::env(PYTHONPATH) $old_path }
+    return [expr {!$failed}]
+}
+
 #=============================================================================
 # PROCEDURE: run_simulation - main simulation flow
+#   Returns 1 when the snapshot was built (and simulated), 0 on build errors
 #=============================================================================
-proc run_simulation {} {
+proc run_simulation { {build_only 0} {clean 0} } {
     # === Setup Report Directory ===
     set base_dir [file dirname [file dirname [pwd]]]
     set report_dir [file join $base_dir "report"]
@@ -60,23 +240,27 @@ proc run_simulation {} {
     
     puts "### \[0/3\] Compiling C Wrapper (gcc -> dll) ###"
     
-    # Clean up previous build artifacts
-    file delete -force "xsim.dir"
-    file delete -force "dpi.dll" "apb_dpi.dll" "libdpi.dll"
+    # Build state survives between runs; a clean build starts from scratch
+    set state_file "xsim.dir/build_state.tcl"
+    if {$clean} {
+        puts "Clean build: removing xsim.dir"
+        file delete -force "xsim.dir"
+    }
+    file delete -force "dpi.dll" "apb_dpi.dll"
     
     # Find GCC in Vivado installation
     set vivado_dir $::env(XILINX_VIVADO)
     set gcc_glob [glob -nocomplain -directory "$vivado_dir/tps/mingw" "*"]
     if {$gcc_glob eq ""} {
         puts "Error: Could not find MinGW in $vivado_dir/tps/mingw"
-        return
+        return 0
     }
     set mingw_dir [lindex $gcc_glob 0]
     set gcc_exe "$mingw_dir/win64.o/nt/bin/gcc.exe"
     
     if {![file exists $gcc_exe]} {
         puts "Error: GCC not found at $gcc_exe"
-        return
+        return 0
     }
     
     puts "Using GCC: $gcc_exe"
@@ -100,7 +284,7 @@ proc run_simulation {} {
     
     if {$python_glob eq ""} {
         puts "Error: Could not find Python in [join $possible_tps_dirs , ]"
-        return
+        return 0
     }
     set python_dir [lindex $python_glob 0]
     set python_include "$python_dir/include"
@@ -112,7 +296,7 @@ proc run_simulation {} {
     set python_lib_files [glob -nocomplain -directory $python_libs "python*.lib"]
     if {$python_lib_files eq ""} {
         puts "Error: Could not find .lib in $python_libs"
-        return
+        return 0
     }
     
     set python_lib_path ""
@@ -139,87 +323,177 @@ proc run_simulation {} {
     set ar_exe "$gcc_bin_dir/ar.exe"
     if {![file exists $ar_exe]} {
         puts "Error: AR not found at $ar_exe"
-        return
+        return 0
     }
     
     # Create output directory
     set out_dir "xsim.dir/work/xsc"
     file mkdir $out_dir
-    
-    # Compile wrapper
-    puts "Compiling wrapper.c -> wrapper.o"
-    set wrapper_obj "$out_dir/wrapper.o"
-    if {[catch {exec $gcc_exe -c -fPIC -o $wrapper_obj $wrapper_native \
-        -I$svdpi_include_native \
-        -I$python_include_native \
-        >@stdout 2>@1} err]} {
-        puts "Error Compiling: $err"
-        return
+
+    # Compiled libraries are only valid for the Vivado version that built them
+    set tool_version [expr {[catch {version -short} v] ? "unknown" : $v}]
+    set state [load_build_state $state_file]
+    if {[dict size $state] > 0 && (![dict exists $state tool] || [dict get $state tool] ne $tool_version)} {
+        puts "Vivado version changed: full rebuild"
+        file delete -force "xsim.dir"
+        file mkdir $out_dir
+        set state [dict create]
     }
+    dict set state tool $tool_version
     
-    # Link DLL
-    puts "Linking wrapper.o -> libdpi.dll"
+    set wrapper_obj "$out_dir/wrapper.o"
     set dpi_dll "$out_dir/libdpi.dll"
     set dpi_a   "$out_dir/libdpi.a"
-    
-    if {[catch {exec $gcc_exe -shared -o $dpi_dll $wrapper_obj \
-        $python_lib_native \
-        "-Wl,--out-implib,$dpi_a" \
-        >@stdout 2>@1} err]} {
-        puts "Error Linking DLL: $err"
-        return
+
+    # wrapper.c and the toolchain it is built against (headers, import library)
+    set dpi_key [inputs_key [list "wrapper.c" "$python_include/Python.h" $python_lib_path "$svdpi_include/svdpi.h"] $gcc_exe]
+    set dpi_rebuilt 0
+    if {[file exists $dpi_dll] && [dict exists $state dpi] && [dict get $state dpi] eq $dpi_key} {
+        puts "wrapper.c and toolchain unchanged: reusing libdpi.dll"
+    } else {
+        # Compile wrapper
+        puts "Compiling wrapper.c -> wrapper.o"
+        if {[catch {exec $gcc_exe -c -fPIC -o $wrapper_obj $wrapper_native \
+            -I$svdpi_include_native \
+            -I$python_include_native \
+            >@stdout 2>@1} err]} {
+            puts "Error Compiling: $err"
+            return 0
+        }
+        
+        # Link DLL
+        puts "Linking wrapper.o -> libdpi.dll"
+        if {[catch {exec $gcc_exe -shared -o $dpi_dll $wrapper_obj \
+            $python_lib_native \
+            "-Wl,--out-implib,$dpi_a" \
+            >@stdout 2>@1} err]} {
+            puts "Error Linking DLL: $err"
+            return 0
+        }
+        set dpi_rebuilt 1
+        dict set state dpi $dpi_key
+        save_build_state $state_file $state
     }
     
-    # Copy DLLs and model
+    # Copy DLLs and model (only files whose content differs)
     set python_dlls [glob -nocomplain -directory $python_dir "python3*.dll"]
     if {$python_dlls eq ""} {
         set python_dlls [glob -nocomplain -directory "$python_dir/bin" "python3*.dll"]
     }
     
     if {$python_dlls ne ""} {
-        foreach dll $python_dlls {
-            file copy -force $dll .
-        }
-        set mingw_dlls [glob -nocomplain -directory $gcc_bin_dir "lib*.dll"]
-        foreach dll $mingw_dlls {
-            file copy -force $dll .
+        set runtime_files [concat $python_dlls [glob -nocomplain -directory $gcc_bin_dir "lib*.dll"] [list $dpi_dll]]
+        foreach model_file [list "../../model/{{ model_file }}"{% for f in model_support_files %} "../../model/{{ f }}"{% endfor %}] {
+            if {[file exists $model_file]} {
+                lappend runtime_files $model_file
+            } else {
+                puts "WARNING: Python model not found at $model_file"
+            }
         }
-        file copy -force $dpi_dll .
-        
-        set model_file "../../model/{{ model_file }}"
-        if {[file exists $model_file]} {
-            file copy -force $model_file .
-        } else {
-            puts "WARNING: Python model not found at $model_file"
+        set copied 0
+        foreach src $runtime_files {
+            incr copied [copy_if_changed $src [file tail $src]]
         }
+        puts "Runtime files: $copied copied, [expr {[llength $runtime_files] - $copied}] up to date"
     }
     
     puts "### \[1/3\] Compiling (xvlog) ###"
-    if {[catch {exec xvlog -sv -L uvm \
-        {{ vip_include_flags }} \
-        {{ dut_files }} \
-        {{ vip_files }} \
-        {{ tb_files }} \
-        >@stdout 2>@1} err]} {
-        puts "Error: $err"
-        return
+    source "{{ build_manifest }}"
+
+    # Shared VIP libraries: compiled once per variant, then linked with -L
+    set lib_flags [list]
+    foreach lib $vip_libraries {
+        set lib_arg [ensure_vip_library $lib $tool_version]
+        if {$lib_arg eq ""} { return 0 }
+        lappend lib_flags -L $lib_arg
+    }
+
+    # Units whose dependencies (or linked libraries) changed, plus the units importing their packages
+    set rebuilt [dict create]
+    set incdirs [list]
+    set sources [list]
+    foreach unit $build_units {
+        set name [dict get $unit name]
+        set key [inputs_key [dict get $unit deps] {*}[dict get $unit incdirs] {*}$lib_flags]
+        set dirty [expr {![dict exists $state unit $name] || [dict get $state unit $name] ne $key}]
+        foreach used [dict get $unit uses] {
+            if {[dict exists $rebuilt $used]} { set dirty 1 }
+        }
+        if {$dirty} {
+            dict set rebuilt $name $key
+            foreach dir [dict get $unit incdirs] {
+                if {[lsearch -exact $incdirs $dir] < 0} { lappend incdirs $dir }
+            }
+            lappend sources {*}[dict get $unit sources]
+        }
+    }
+    
+    if {[dict size $rebuilt] == 0} {
+        puts "All [llength $build_units] compilation units up to date"
+    } else {
+        puts "Recompiling [dict size $rebuilt] of [llength $build_units] compilation units"
+        set include_flags [list]
+        foreach dir $incdirs { lappend include_flags -i $dir }
+        if {[catch {exec xvlog -sv -L uvm {*}$lib_flags {*}$include_flags {*}$sources >@stdout 2>@1} err]} {
+            puts "Error: $err"
+            return 0
+        }
+        dict for {name key} $rebuilt {
+            dict set state unit $name $key
+        }
+        save_build_state $state_file $state
     }
     
     puts "### \[2/3\] Elaborating (xelab) ###"
-    if {[catch {exec xelab -L uvm -debug typical top -s top_snapshot -sv_lib libdpi -sv_root . \
-        >@stdout 2>@1} err]} {
-        puts "Error: $err"
-        return
+    set elab_flags [list -L uvm {*}$lib_flags -debug typical top -s top_snapshot -sv_lib libdpi -sv_root .]
+    if {[dict size $rebuilt] == 0 && !$dpi_rebuilt && [file exists "xsim.dir/top_snapshot"]
+            && [dict exists $state elab] && [dict get $state elab] eq $elab_flags} {
+        puts "Snapshot top_snapshot up to date"
+    } else {
+        # Invalidate first: a failed elaboration must not leave a stale snapshot marked current
+        dict unset state elab
+        save_build_state $state_file $state
+        if {[catch {exec xelab {*}$elab_flags >@stdout 2>@1} err]} {
+            puts "Error: $err"
+            return 0
+        }
+        dict set state elab $elab_flags
+        save_build_state $state_file $state
+    }
+
+    if {$build_only} {
+        puts "### Build complete: snapshot top_snapshot (simulation skipped) ###"
+        return 1
     }
     
     puts "### \[3/3\] Simulating (xsim) ###"
+{%- if check_mode == 'record' %}
+    file delete -force "{{ txn_log }}"
+{%- endif %}
+    set sim_start [clock milliseconds]
+{%- if max_quit_count %}
+    # Fail-fast: UVM stops the test after {{ max_quit_count }} UVM_ERRORs (simulation.max_errors)
+    catch {exec xsim top_snapshot -runall -testplusarg "UVM_MAX_QUIT_COUNT={{ max_quit_count }},NO" -log $log_file >@stdout 2>@1} sim_result
+{%- else %}
     catch {exec xsim top_snapshot -runall -log $log_file >@stdout 2>@1} sim_result
+{%- endif %}
+    set runtime [expr {([clock milliseconds] - $sim_start) / 1000.0}]
     
     # Save report after simulation
-    save_report $log_file $report_dir $timestamp "{{ protocol }}"
+    save_report $log_file $report_dir $timestamp "{{ protocol }}" $runtime
+{%- if check_mode == 'record' %}
+    check_transactions $report_dir $timestamp
+{%- endif %}
+    return 1
 }
 
 #=============================================================================
 # MAIN - Execute simulation
 #=============================================================================
-run_simulation
+set tclargs [expr {[info exists ::argv] ? $::argv : [list]}]
+set build_only [expr {[lsearch -exact $tclargs "build"] >= 0}]
+set clean_build [expr {[lsearch -exact $tclargs "clean"] >= 0}]
+# The snapshot may be left from an earlier run, so the build result decides the exit code
+if {![run_simulation $build_only $clean_build] && $build_only} {
+    exit 1
+}
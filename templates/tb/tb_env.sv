@@ -24,6 +24,9 @@ class tb_env extends uvm_env;
     function void connect_phase(uvm_phase phase);
         {% for intf in interfaces %}
         {{ intf.name }}.monitor.item_collected_port.connect({{ intf.name }}_scb.item_collected_export);
+        {% if intf.protocol == 'axi' %}
+        {{ intf.name }}.monitor.request_port.connect({{ intf.name }}_scb.request_export);
+        {% endif %}
         {% endfor %}
     endfunction
 
@@ -7,6 +7,16 @@ package ahb_pkg;
     //==========================================================================
     import "DPI-C" context function void dpi_mem_write(int addr, int data);
     import "DPI-C" context function int  dpi_mem_read(int addr);
+    import "DPI-C" context function void dpi_mem_write_batch(input int addrs[], input int datas[], input int n);
+    import "DPI-C" context function void dpi_mem_read_batch(input int addrs[], output int results[], input int n);
+    // Byte-strobed writes (HSIZE lanes)
+    import "DPI-C" context function void dpi_mem_write_masked(int addr, int data, int strb);
+    import "DPI-C" context function void dpi_mem_write_masked_batch(input int addrs[], input int datas[], input int strbs[], input int n);
+    // Record mode (model.check_mode: record): binary transaction log, no Python call
+    import "DPI-C" function void dpi_txn_open(string path, string protocol, int data_width, int addr_width);
+    import "DPI-C" function void dpi_txn_record(int kind, longint unsigned addr, longint unsigned data,
+                                                int strb, int size, int resp, int id, longint unsigned timestamp);
+    import "DPI-C" function void dpi_txn_close();
 
     //==========================================================================
     // Include VIP Components
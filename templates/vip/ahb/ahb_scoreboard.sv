@@ -18,6 +18,22 @@ class ahb_scoreboard #(
     int unsigned match_count;
     int unsigned mismatch_count;
 
+    //==========================================================================
+    // DPI Batching (model.dpi_batch_size in config.yaml)
+    //   0 or 1 = call the Python model per transaction,
+    //   N > 1  = queue N transactions and flush them with dpi_mem_*_batch
+    //==========================================================================
+    localparam int DPI_BATCH_SIZE = {{ dpi_batch_size | default(0) }};
+    ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) pending[$];
+
+    //==========================================================================
+    // Record Mode (model.check_mode: record in config.yaml)
+    //   Transactions are appended to a binary log instead of calling the
+    //   Python model; python -m main.utils.txn_check compares them offline.
+    //==========================================================================
+    localparam bit RECORD_MODE = {{ 1 if check_mode == 'record' else 0 }};
+    int unsigned recorded_count;
+
     //==========================================================================
     // Constructor
     //==========================================================================
@@ -35,6 +51,17 @@ class ahb_scoreboard #(
     //==========================================================================
     virtual function void write(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
         int expected_data;
+
+        if (RECORD_MODE) begin
+            record(item);
+            return;
+        end
+
+        if (DPI_BATCH_SIZE > 1) begin
+            pending.push_back(item);
+            if (pending.size() >= DPI_BATCH_SIZE) flush_pending();
+            return;
+        end
         
         if (item.write) begin
             //==================================================================
@@ -47,8 +74,8 @@ class ahb_scoreboard #(
             $display("[SCB_WRITE] Calling Python Model: Addr=0x%0h Data=0x%0h", 
                      item.addr, item.data);
             
-            // Call Python Golden Model via DPI-C
-            dpi_mem_write(item.addr, item.data);
+            // Call Python Golden Model via DPI-C (only the HSIZE byte lanes)
+            dpi_mem_write_masked(item.addr, lane_data(item), lane_strb(item));
             
         end else begin
             //==================================================================
@@ -61,27 +88,145 @@ class ahb_scoreboard #(
             expected_data = dpi_mem_read(item.addr);
             $display("[SCB_READ] Python returned: 0x%0h", expected_data);
             
-            `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h", 
-                                        item.addr, item.rdata, expected_data), UVM_MEDIUM)
-
-            // Compare DUT vs Golden Model
-            if (item.rdata !== expected_data) begin
-                mismatch_count++;
-                `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h", 
-                                                     item.addr, item.rdata, expected_data))
-            end else begin
-                match_count++;
-                `uvm_info("SCB_MATCH", $sformatf("Data Match! Addr=0x%0h Data=0x%0h", 
-                                                  item.addr, item.rdata), UVM_HIGH)
-            end
+            compare_read(item, read_lanes(item, expected_data));
+        end
+
+        check_resp(item);
+    endfunction
+
+    //==========================================================================
+    // Compare DUT vs Golden Model
+    //==========================================================================
+    function void compare_read(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item, int expected_data);
+        `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h", 
+                                    item.addr, item.rdata, expected_data), UVM_MEDIUM)
+
+        if (item.rdata !== expected_data) begin
+            mismatch_count++;
+            `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h", 
+                                                 item.addr, item.rdata, expected_data))
+        end else begin
+            match_count++;
+            `uvm_info("SCB_MATCH", $sformatf("Data Match! Addr=0x%0h Data=0x%0h", 
+                                              item.addr, item.rdata), UVM_HIGH)
         end
+    endfunction
+
+    //==========================================================================
+    // HSIZE Byte Lanes
+    // The slave takes sub-word write data from the low bits of HWDATA and
+    // returns sub-word reads zero-extended on HRDATA (see ahb_model.py); the
+    // Python model stores whole words, so writes become byte-strobed words.
+    //==========================================================================
+    function int unsigned lane_bytes(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        return (item.size >= $clog2(DATA_WIDTH / 8)) ? DATA_WIDTH / 8 : 1 << item.size;
+    endfunction
+
+    function int unsigned lane_offset(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        return item.addr & (DATA_WIDTH / 8 - 1) & ~(lane_bytes(item) - 1);
+    endfunction
+
+    function int unsigned lane_mask(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        return (64'd1 << (8 * lane_bytes(item))) - 1;
+    endfunction
+
+    function int unsigned lane_strb(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        return ((1 << lane_bytes(item)) - 1) << lane_offset(item);
+    endfunction
+
+    // Write data moved onto its byte lanes of the memory word
+    function int unsigned lane_data(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        return (item.data & lane_mask(item)) << (8 * lane_offset(item));
+    endfunction
+
+    // Expected HRDATA for a read of the given memory word
+    function int unsigned read_lanes(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item, int unsigned word);
+        return (word >> (8 * lane_offset(item))) & lane_mask(item);
+    endfunction
 
-        // Check for error response
+    // Check for error response
+    function void check_resp(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
         if (item.resp == 1'b1) begin
             `uvm_warning("SCB_RESP", $sformatf("ERROR response received for Addr=0x%0h", item.addr))
         end
     endfunction
 
+    //==========================================================================
+    // Batch Flush
+    // Queued transactions are replayed in program order: each run of
+    // consecutive writes (or reads) becomes a single DPI batch call.
+    //==========================================================================
+    function void flush_pending();
+        int addrs[];
+        int datas[];
+        int strbs[];
+        int results[];
+        int first;
+        int last;
+        int n;
+
+        first = 0;
+        while (first < pending.size()) begin
+            last = first;
+            while (last < pending.size() && pending[last].write == pending[first].write) last++;
+            n = last - first;
+
+            addrs = new[n];
+            for (int i = 0; i < n; i++) addrs[i] = pending[first + i].addr;
+
+            if (pending[first].write) begin
+                datas = new[n];
+                strbs = new[n];
+                for (int i = 0; i < n; i++) begin
+                    datas[i] = lane_data(pending[first + i]);
+                    strbs[i] = lane_strb(pending[first + i]);
+                end
+                write_count += n;
+                dpi_mem_write_masked_batch(addrs, datas, strbs, n);
+            end else begin
+                results = new[n];
+                read_count += n;
+                dpi_mem_read_batch(addrs, results, n);
+                for (int i = 0; i < n; i++) compare_read(pending[first + i], read_lanes(pending[first + i], results[i]));
+            end
+
+            for (int i = first; i < last; i++) check_resp(pending[i]);
+            first = last;
+        end
+        pending.delete();
+    endfunction
+
+    //==========================================================================
+    // Record Mode
+    //==========================================================================
+    function void start_of_simulation_phase(uvm_phase phase);
+        super.start_of_simulation_phase(phase);
+        if (RECORD_MODE) dpi_txn_open("{{ txn_log }}", "ahb", DATA_WIDTH, ADDR_WIDTH);
+    endfunction
+
+    // Read records carry the data observed on the bus
+    function void record(ahb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        dpi_txn_record(item.write ? 0 : 1, item.addr, item.write ? item.data : item.rdata,
+                       lane_strb(item), item.size, item.resp, 0, $time);
+        recorded_count++;
+        if (item.write) write_count++;
+        else read_count++;
+        check_resp(item);
+    endfunction
+
+    function void final_phase(uvm_phase phase);
+        super.final_phase(phase);
+        if (RECORD_MODE) dpi_txn_close();
+    endfunction
+
+    //==========================================================================
+    // Check Phase (drain transactions still queued at end of run phase)
+    //==========================================================================
+    function void check_phase(uvm_phase phase);
+        super.check_phase(phase);
+        if (pending.size() > 0) flush_pending();
+    endfunction
+
     //==========================================================================
     // Report Phase
     //==========================================================================
@@ -94,8 +239,12 @@ class ahb_scoreboard #(
         `uvm_info("SCB_REPORT", $sformatf("Read Matches    : %0d", match_count), UVM_NONE)
         `uvm_info("SCB_REPORT", $sformatf("Read Mismatches : %0d", mismatch_count), UVM_NONE)
         `uvm_info("SCB_REPORT", "========================================", UVM_NONE)
-        
-        if (mismatch_count > 0) begin
+
+        if (RECORD_MODE) begin
+            // Reads were not compared yet: the offline check decides
+            `uvm_info("SCB_RECORD", $sformatf("Recorded %0d transaction(s) to {{ txn_log }}, check with: python -m main.utils.txn_check",
+                                              recorded_count), UVM_NONE)
+        end else if (mismatch_count > 0) begin
             `uvm_error("SCB_FAIL", $sformatf("TEST FAILED: %0d mismatches detected!", mismatch_count))
         end else begin
             `uvm_info("SCB_PASS", "TEST PASSED: All reads matched!", UVM_NONE)
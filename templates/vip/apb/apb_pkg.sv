@@ -8,6 +8,13 @@ package apb_pkg;
     // DPI Imports for Scoreboard
     import "DPI-C" context function void dpi_mem_write(int addr, int data);
     import "DPI-C" context function int  dpi_mem_read(int addr);
+    import "DPI-C" context function void dpi_mem_write_batch(input int addrs[], input int datas[], input int n);
+    import "DPI-C" context function void dpi_mem_read_batch(input int addrs[], output int results[], input int n);
+    // Record mode (model.check_mode: record): binary transaction log, no Python call
+    import "DPI-C" function void dpi_txn_open(string path, string protocol, int data_width, int addr_width);
+    import "DPI-C" function void dpi_txn_record(int kind, longint unsigned addr, longint unsigned data,
+                                                int strb, int size, int resp, int id, longint unsigned timestamp);
+    import "DPI-C" function void dpi_txn_close();
 
     // Include VIP Components
     // Note: These will be templated files, but here we include the file names.
@@ -8,6 +8,18 @@ class apb_scoreboard #(
     // Analysis Import (Connect to Monitor)
     uvm_analysis_imp #(apb_seq_item#(ADDR_WIDTH, DATA_WIDTH), apb_scoreboard#(ADDR_WIDTH, DATA_WIDTH)) item_collected_export;
 
+    // DPI Batching (model.dpi_batch_size in config.yaml)
+    // 0 or 1 = call the Python model per transaction,
+    // N > 1  = queue N transactions and flush them with dpi_mem_*_batch
+    localparam int DPI_BATCH_SIZE = {{ dpi_batch_size | default(0) }};
+    apb_seq_item#(ADDR_WIDTH, DATA_WIDTH) pending[$];
+
+    // Record Mode (model.check_mode: record in config.yaml)
+    // Transactions are appended to a binary log instead of calling the
+    // Python model; python -m main.utils.txn_check compares them offline.
+    localparam bit RECORD_MODE = {{ 1 if check_mode == 'record' else 0 }};
+    int unsigned recorded_count;
+
     function new(string name, uvm_component parent);
         super.new(name, parent);
         item_collected_export = new("item_collected_export", this);
@@ -16,7 +28,18 @@ class apb_scoreboard #(
     // Implement write method for analysis imp
     virtual function void write(apb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
         int expected_data;
-        
+
+        if (RECORD_MODE) begin
+            record(item);
+            return;
+        end
+
+        if (DPI_BATCH_SIZE > 1) begin
+            pending.push_back(item);
+            if (pending.size() >= DPI_BATCH_SIZE) flush_pending();
+            return;
+        end
+
         if (item.write) begin
             // WRITE Operation
             `uvm_info("SCB", $sformatf("WRITE: Addr=0x%0h Data=0x%0h", item.addr, item.data), UVM_MEDIUM)
@@ -29,23 +52,88 @@ class apb_scoreboard #(
             $display("[SCB_READ] Calling Python for Addr=0x%0h", item.addr);
             expected_data = dpi_mem_read(item.addr);
             $display("[SCB_READ] Python returned: 0x%0h", expected_data);
-            
+
             // 2. Compare with Actual Data (item.data or item.rdata depending on seq_item definition)
             // Assuming 'data' holds the read data in monitoring context, or 'rdata'
-            // Let's check apb_seq_item.sv -> usually 'data' is payload. 
+            // Let's check apb_seq_item.sv -> usually 'data' is payload.
             // If monitored item puts read data in 'data', use 'data'.
             // In typical APB mon, we capture PRDATA into item.data or item.rdata.
-            
-            `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h", 
-                                       item.addr, item.rdata, expected_data), UVM_MEDIUM)
+            compare_read(item, expected_data);
+        end
+    endfunction
+
+    // Compare DUT read data against the model's expected value
+    function void compare_read(apb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item, int expected_data);
+        `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h",
+                                   item.addr, item.rdata, expected_data), UVM_MEDIUM)
 
-            if (item.rdata !== expected_data) begin
-                `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h", 
-                                                     item.addr, item.rdata, expected_data))
+        if (item.rdata !== expected_data) begin
+            `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h",
+                                                 item.addr, item.rdata, expected_data))
+        end else begin
+            `uvm_info("SCB_MATCH", "Read Data Match!", UVM_HIGH)
+        end
+    endfunction
+
+    // Flush queued transactions in program order: each run of consecutive
+    // writes (or reads) becomes a single DPI batch call.
+    function void flush_pending();
+        int addrs[];
+        int datas[];
+        int results[];
+        int first;
+        int last;
+        int n;
+
+        first = 0;
+        while (first < pending.size()) begin
+            last = first;
+            while (last < pending.size() && pending[last].write == pending[first].write) last++;
+            n = last - first;
+
+            addrs = new[n];
+            for (int i = 0; i < n; i++) addrs[i] = pending[first + i].addr;
+
+            if (pending[first].write) begin
+                datas = new[n];
+                for (int i = 0; i < n; i++) datas[i] = pending[first + i].data;
+                dpi_mem_write_batch(addrs, datas, n);
             end else begin
-                `uvm_info("SCB_MATCH", "Read Data Match!", UVM_HIGH)
+                results = new[n];
+                dpi_mem_read_batch(addrs, results, n);
+                for (int i = 0; i < n; i++) compare_read(pending[first + i], results[i]);
             end
+            first = last;
         end
+        pending.delete();
+    endfunction
+
+    // Record mode: open the log before the first transaction, close it at the end
+    function void start_of_simulation_phase(uvm_phase phase);
+        super.start_of_simulation_phase(phase);
+        if (RECORD_MODE) dpi_txn_open("{{ txn_log }}", "apb", DATA_WIDTH, ADDR_WIDTH);
+    endfunction
+
+    // Read records carry the data observed on the bus
+    function void record(apb_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        dpi_txn_record(item.write ? 0 : 1, item.addr, item.write ? item.data : item.rdata,
+                       (1 << (DATA_WIDTH / 8)) - 1, $clog2(DATA_WIDTH / 8), item.resp, 0, $time);
+        recorded_count++;
+    endfunction
+
+    function void final_phase(uvm_phase phase);
+        super.final_phase(phase);
+        if (RECORD_MODE) begin
+            dpi_txn_close();
+            `uvm_info("SCB", $sformatf("Recorded %0d transaction(s) to {{ txn_log }}, check with: python -m main.utils.txn_check",
+                                       recorded_count), UVM_NONE)
+        end
+    endfunction
+
+    // Drain transactions still queued when the run phase ends
+    function void check_phase(uvm_phase phase);
+        super.check_phase(phase);
+        if (pending.size() > 0) flush_pending();
     endfunction
 
 endclass
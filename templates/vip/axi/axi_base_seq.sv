@@ -1,4 +1,3 @@
-
 class axi_base_seq #(
     int ADDR_WIDTH = {{ ADDR_WIDTH }},
     int DATA_WIDTH = {{ DATA_WIDTH }}
@@ -23,36 +22,53 @@ class axi_base_seq #(
     localparam int ADDR_MAX   = 1020;
     localparam int ADDR_ALIGN = 4;
     {% endif %}
+    {% set burst_plan = (test_plan.constraints.burst if test_plan else none) or {} %}
+    // Bursts (test_plan.constraints.burst): AxLEN < MAX_BEATS, AxBURST from the listed types
+    localparam int MAX_BEATS  = {{ burst_plan.max_beats | default(1) }};
+
+    // Writes issued before they are read back (vip.axi.outstanding): with
+    // N > 1 the driver keeps up to N writes, then N reads, in flight
+    localparam int WINDOW     = {{ vip_options.outstanding | default(1) }};
 
     task body();
-        bit [ADDR_WIDTH-1:0] addr;
-        bit [DATA_WIDTH-1:0] data;
+        axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) written[$];
         
-        `uvm_info(get_type_name(), $sformatf("Starting %0d iterations of AXI Write-Read Test...", ITERATIONS), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("Starting %0d iterations of AXI Write-Read Test (up to %0d beats, window %0d)...", ITERATIONS, MAX_BEATS, WINDOW), UVM_LOW)
 
         repeat(ITERATIONS) begin
-             if (!std::randomize(addr, data) with { 
-                addr >= ADDR_MIN;
-                addr <= ADDR_MAX;
-                addr % ADDR_ALIGN == 0;
-            }) `uvm_error("RND", "Randomization failed")
-
-            // Write
+            // Write: random ID, start address, burst type, length and per-beat data
             `uvm_do_with(req, {
                 kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE;
-                addr == local::addr;
-                data == local::data;
-                strb == {(DATA_WIDTH/8){1'b1}};
-            })
-            
-            // Read
-            `uvm_do_with(req, {
-                kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::READ;
-                addr == local::addr;
+                addr % ADDR_ALIGN == 0;
+                len < MAX_BEATS;
+                burst inside { {{- burst_plan.types | default(['INCR']) | join(', ') -}} };
+                // Every beat of the burst stays inside [ADDR_MIN, ADDR_MAX]
+                (burst == FIXED) -> (addr >= ADDR_MIN && addr <= ADDR_MAX);
+                (burst == INCR)  -> (addr >= ADDR_MIN && addr + (len << size) <= ADDR_MAX);
+                (burst == WRAP)  -> (addr - addr % ((len + 1) << size) >= ADDR_MIN &&
+                                     addr - addr % ((len + 1) << size) + (len << size) <= ADDR_MAX);
             })
+            written.push_back(req);
+
+            if (written.size() >= WINDOW) begin
+                foreach (written[i]) read_back(written[i]);
+                written.delete();
+            end
         end
+        foreach (written[i]) read_back(written[i]);
 
         `uvm_info(get_type_name(), "Sequence complete", UVM_LOW)
     endtask
 
+    // Read the same beats as a completed write (any ID)
+    task read_back(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) wr);
+        `uvm_do_with(req, {
+            kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::READ;
+            addr  == wr.addr;
+            len   == wr.len;
+            size  == wr.size;
+            burst == wr.burst;
+        })
+    endtask
+
 endclass
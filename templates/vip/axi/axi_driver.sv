@@ -7,6 +7,23 @@ class axi_driver #(
 
     virtual axi_if#(ADDR_WIDTH, DATA_WIDTH) vif;
 
+    typedef axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item_t;
+
+    // Outstanding Transactions (vip.axi.outstanding in config.yaml)
+    // 1     = one transaction at a time (AW/W -> B, AR -> R in series),
+    // N > 1 = pipelined: up to N writes and N reads in flight, each channel
+    //         driven by its own thread, responses matched by BID/RID
+    localparam int OUTSTANDING = {{ vip_options.outstanding | default(1) }};
+
+    // Pipelined mode state
+    mailbox #(item_t) aw_mbx = new();
+    mailbox #(item_t) w_mbx  = new();
+    mailbox #(item_t) ar_mbx = new();
+    item_t            in_flight[$];   // issue order
+    int unsigned      rx_beats[item_t];
+    int               writes_in_flight;
+    int               reads_in_flight;
+
     function new(string name, uvm_component parent);
         super.new(name, parent);
     endfunction
@@ -25,14 +42,27 @@ class axi_driver #(
         vif.arvalid <= 0;
         vif.rready  <= 0;
         vif.wstrb   <= {(DATA_WIDTH/8){1'b1}};
+        vif.awid    <= 0;
+        vif.arid    <= 0;
+        vif.wlast   <= 0;
+        vif.awlen   <= 0;
+        vif.awsize  <= $clog2(DATA_WIDTH/8);
+        vif.awburst <= 2'b01; // INCR
+        vif.arlen   <= 0;
+        vif.arsize  <= $clog2(DATA_WIDTH/8);
+        vif.arburst <= 2'b01;
 
         wait(vif.aresetn == 1);
         @(posedge vif.aclk);
 
-        forever begin
-            seq_item_port.get_next_item(req);
-            drive_transfer(req);
-            seq_item_port.item_done();
+        if (OUTSTANDING > 1) begin
+            run_pipelined();
+        end else begin
+            forever begin
+                seq_item_port.get_next_item(req);
+                drive_transfer(req);
+                seq_item_port.item_done();
+            end
         end
     endtask
 
@@ -45,37 +75,50 @@ class axi_driver #(
     endtask
 
     task drive_write(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
-        `uvm_info("DRV", $sformatf("WRITE Start: Addr=0x%0h Data=0x%0h", item.addr, item.data), UVM_HIGH)
+        `uvm_info("DRV", $sformatf("WRITE Start: Addr=0x%0h Beats=%0d Burst=%s Data[0]=0x%0h",
+                                   item.addr, item.beats(), item.burst.name(), item.data[0]), UVM_HIGH)
 
         // 1. Write Address Channel
+        vif.awid    <= item.id;
         vif.awaddr  <= item.addr;
+        vif.awlen   <= item.len;
+        vif.awsize  <= item.size;
+        vif.awburst <= item.burst;
         vif.awvalid <= 1;
-        
-        // 2. Write Data Channel
-        vif.wdata   <= item.data;
-        vif.wstrb   <= item.strb;
-        vif.wvalid  <= 1;
 
-        // 3. Response Ready
+        // 2. Response Ready
         vif.bready  <= 1;
 
-        // Wait for Handshakes
+        // Wait for Handshakes (address and data channels run in parallel)
         fork
             begin
                 wait_aw_handshake();
             end
             begin
-                wait_w_handshake();
+                drive_w_beats(item);
             end
         join
 
         // Wait for Response
         wait_b_handshake();
+        item.resp = vif.bresp;
         vif.bready <= 0;
 
         `uvm_info("DRV", "WRITE Done", UVM_HIGH)
     endtask
 
+    // 3. Write Data Channel: one beat per W handshake, WLAST on the final beat
+    task drive_w_beats(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        foreach (item.data[i]) begin
+            vif.wdata  <= item.data[i];
+            vif.wstrb  <= item.strb[i];
+            vif.wlast  <= (i == item.len);
+            vif.wvalid <= 1;
+            wait_w_handshake();
+        end
+        vif.wlast <= 0;
+    endtask
+
     task wait_aw_handshake();
         do begin
             @(posedge vif.aclk);
@@ -97,10 +140,15 @@ class axi_driver #(
     endtask
 
     task drive_read(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
-        `uvm_info("DRV", $sformatf("READ Start: Addr=0x%0h", item.addr), UVM_HIGH)
+        `uvm_info("DRV", $sformatf("READ Start: Addr=0x%0h Beats=%0d Burst=%s",
+                                   item.addr, item.beats(), item.burst.name()), UVM_HIGH)
 
         // 1. Read Address Channel
+        vif.arid    <= item.id;
         vif.araddr  <= item.addr;
+        vif.arlen   <= item.len;
+        vif.arsize  <= item.size;
+        vif.arburst <= item.burst;
         vif.arvalid <= 1;
         vif.rready  <= 1; // Always ready to receive data
 
@@ -110,15 +158,178 @@ class axi_driver #(
         end while (!(vif.arvalid && vif.arready));
         vif.arvalid <= 0;
 
-        // Wait for Read Data (R Handshake)
-        do begin
-            @(posedge vif.aclk);
-        end while (!(vif.rvalid && vif.rready));
-
-        item.data = vif.rdata;
+        // Wait for Read Data (one R handshake per beat; beats are counted
+        // rather than relying on RLAST, which AXI4-Lite slaves do not drive)
+        item.data = new[item.beats()];
+        foreach (item.data[i]) begin
+            do begin
+                @(posedge vif.aclk);
+            end while (!(vif.rvalid && vif.rready));
+            item.data[i] = vif.rdata;
+        end
+        item.resp = vif.rresp;
         vif.rready <= 0;
 
-        `uvm_info("DRV", $sformatf("READ Done: Data=0x%0h", item.data), UVM_HIGH)
+        `uvm_info("DRV", $sformatf("READ Done: Data[0]=0x%0h", item.data[0]), UVM_HIGH)
+    endtask
+
+    //==========================================================================
+    // Pipelined Mode (OUTSTANDING > 1)
+    //==========================================================================
+    // item_done() is called once a transaction is queued for its address
+    // channel, so the sequence keeps issuing while earlier responses are
+    // pending; the monitor publishes the completed transactions.
+    task run_pipelined();
+        vif.bready <= 1;
+        vif.rready <= 1;
+        fork
+            issue_thread();
+            aw_thread();
+            w_thread();
+            b_thread();
+            ar_thread();
+            r_thread();
+        join
+    endtask
+
+    task issue_thread();
+        item_t item;
+        forever begin
+            seq_item_port.get_next_item(req);
+            item = req;
+            // Wait for a free slot and for conflicting transactions to finish
+            while ((item.kind == item_t::WRITE ? writes_in_flight : reads_in_flight) >= OUTSTANDING
+                   || has_hazard(item))
+                @(posedge vif.aclk);
+
+            in_flight.push_back(item);
+            if (item.kind == item_t::WRITE) begin
+                writes_in_flight++;
+                aw_mbx.put(item);
+                w_mbx.put(item);
+            end else begin
+                reads_in_flight++;
+                item.data = new[item.beats()];
+                rx_beats[item] = 0;
+                ar_mbx.put(item);
+            end
+            seq_item_port.item_done();
+        end
+    endtask
+
+    // Transactions with different IDs may complete in any order, so an access
+    // overlapping an in-flight write (or a write overlapping an in-flight
+    // read) waits: the DUT and the model then see the same ordering.
+    function bit has_hazard(item_t item);
+        foreach (in_flight[i]) begin
+            if ((item.kind == item_t::WRITE || in_flight[i].kind == item_t::WRITE) && item.overlaps(in_flight[i]))
+                return 1;
+        end
+        return 0;
+    endfunction
+
+    task aw_thread();
+        item_t item;
+        forever begin
+            aw_mbx.get(item);
+            `uvm_info("DRV", $sformatf("WRITE Issue: ID=%0d Addr=0x%0h Beats=%0d Burst=%s",
+                                       item.id, item.addr, item.beats(), item.burst.name()), UVM_HIGH)
+            vif.awid    <= item.id;
+            vif.awaddr  <= item.addr;
+            vif.awlen   <= item.len;
+            vif.awsize  <= item.size;
+            vif.awburst <= item.burst;
+            vif.awvalid <= 1;
+            wait_aw_handshake();
+        end
+    endtask
+
+    // W beats follow AW order (AXI4 has no write data interleaving)
+    task w_thread();
+        item_t item;
+        forever begin
+            w_mbx.get(item);
+            drive_w_beats(item);
+        end
+    endtask
+
+    task b_thread();
+        item_t item;
+        forever begin
+            wait_b_handshake();
+            item = take_in_flight(item_t::WRITE, vif.bid);
+            if (item == null) begin
+                `uvm_error("DRV", $sformatf("B response with ID=%0d has no outstanding write", vif.bid))
+                continue;
+            end
+            item.resp = vif.bresp;
+            writes_in_flight--;
+            remove_in_flight(item);
+            `uvm_info("DRV", $sformatf("WRITE Done: ID=%0d Addr=0x%0h", item.id, item.addr), UVM_HIGH)
+        end
+    endtask
+
+    task ar_thread();
+        item_t item;
+        forever begin
+            ar_mbx.get(item);
+            `uvm_info("DRV", $sformatf("READ Issue: ID=%0d Addr=0x%0h Beats=%0d Burst=%s",
+                                       item.id, item.addr, item.beats(), item.burst.name()), UVM_HIGH)
+            vif.arid    <= item.id;
+            vif.araddr  <= item.addr;
+            vif.arlen   <= item.len;
+            vif.arsize  <= item.size;
+            vif.arburst <= item.burst;
+            vif.arvalid <= 1;
+            do begin
+                @(posedge vif.aclk);
+            end while (!(vif.arvalid && vif.arready));
+            vif.arvalid <= 0;
+        end
+    endtask
+
+    // Read data of different IDs may interleave; beats are counted per
+    // transaction (ARLEN + 1) rather than relying on RLAST
+    task r_thread();
+        item_t item;
+        forever begin
+            do begin
+                @(posedge vif.aclk);
+            end while (!(vif.rvalid && vif.rready));
+            item = take_in_flight(item_t::READ, vif.rid);
+            if (item == null) begin
+                `uvm_error("DRV", $sformatf("R beat with ID=%0d has no outstanding read", vif.rid))
+                continue;
+            end
+            item.data[rx_beats[item]] = vif.rdata;
+            item.resp = vif.rresp;
+            if (++rx_beats[item] == item.beats()) begin
+                rx_beats.delete(item);
+                reads_in_flight--;
+                remove_in_flight(item);
+                `uvm_info("DRV", $sformatf("READ Done: ID=%0d Addr=0x%0h Data[0]=0x%0h",
+                                           item.id, item.addr, item.data[0]), UVM_HIGH)
+            end
+        end
     endtask
 
+    // Oldest in-flight transaction of a kind with this ID (the oldest of any
+    // ID when the slave does not drive BID/RID)
+    function item_t take_in_flight(item_t::kind_e kind, logic [item_t::ID_WIDTH-1:0] id);
+        foreach (in_flight[i]) begin
+            if (in_flight[i].kind == kind && ($isunknown(id) || in_flight[i].id == id))
+                return in_flight[i];
+        end
+        return null;
+    endfunction
+
+    function void remove_in_flight(item_t item);
+        foreach (in_flight[i]) begin
+            if (in_flight[i] == item) begin
+                in_flight.delete(i);
+                return;
+            end
+        end
+    endfunction
+
 endclass
@@ -1,65 +1,79 @@
 
 interface axi_if #(
     int ADDR_WIDTH = {{ ADDR_WIDTH }},
-    int DATA_WIDTH = {{ DATA_WIDTH }}
+    int DATA_WIDTH = {{ DATA_WIDTH }},
+    int ID_WIDTH   = {{ vip_options.id_width | default(4) }}
 ) (
     input bit aclk, 
     input bit aresetn
 );
 
     // Write Address Channel
+    logic [ID_WIDTH-1:0]   awid;
     logic [ADDR_WIDTH-1:0] awaddr;
+    logic [7:0]            awlen;    // beats - 1
+    logic [2:0]            awsize;   // bytes per beat = 2**awsize
+    logic [1:0]            awburst;  // 00: FIXED, 01: INCR, 10: WRAP
     logic                  awvalid;
     logic                  awready;
 
     // Write Data Channel
     logic [DATA_WIDTH-1:0] wdata;
     logic [(DATA_WIDTH/8)-1:0] wstrb;
+    logic                  wlast;
     logic                  wvalid;
     logic                  wready;
 
     // Write Response Channel
+    // (BID/RID left unconnected, e.g. AXI4-Lite slaves: responses are taken in order)
+    logic [ID_WIDTH-1:0] bid;
     logic [1:0]  bresp;
     logic        bvalid;
     logic        bready;
 
     // Read Address Channel
+    logic [ID_WIDTH-1:0]   arid;
     logic [ADDR_WIDTH-1:0] araddr;
+    logic [7:0]            arlen;
+    logic [2:0]            arsize;
+    logic [1:0]            arburst;
     logic                  arvalid;
     logic                  arready;
 
     // Read Data Channel
+    logic [ID_WIDTH-1:0]   rid;
     logic [DATA_WIDTH-1:0] rdata;
     logic [1:0]            rresp;
+    logic                  rlast;
     logic                  rvalid;
     logic                  rready;
 
     // Modports
     modport master (
         input  aclk, aresetn, 
-        output awaddr, awvalid, input awready,
-        output wdata, wstrb, wvalid, input wready,
-        input  bresp, bvalid, output bready,
-        output araddr, arvalid, input arready,
-        input  rdata, rresp, rvalid, output rready
+        output awid, awaddr, awlen, awsize, awburst, awvalid, input awready,
+        output wdata, wstrb, wlast, wvalid, input wready,
+        input  bid, bresp, bvalid, output bready,
+        output arid, araddr, arlen, arsize, arburst, arvalid, input arready,
+        input  rid, rdata, rresp, rlast, rvalid, output rready
     );
 
     modport slave (
         input  aclk, aresetn, 
-        input  awaddr, awvalid, output awready,
-        input  wdata, wstrb, wvalid, output wready,
-        output bresp, bvalid, input  bready,
-        input  araddr, arvalid, output arready,
-        output rdata, rresp, rvalid, input  rready
+        input  awid, awaddr, awlen, awsize, awburst, awvalid, output awready,
+        input  wdata, wstrb, wlast, wvalid, output wready,
+        output bid, bresp, bvalid, input  bready,
+        input  arid, araddr, arlen, arsize, arburst, arvalid, output arready,
+        output rid, rdata, rresp, rlast, rvalid, input  rready
     );
 
     modport monitor (
         input aclk, aresetn,
-        input awaddr, awvalid, awready,
-        input wdata, wstrb, wvalid, wready,
-        input bresp, bvalid, bready,
-        input araddr, arvalid, arready,
-        input rdata, rresp, rvalid, rready
+        input awid, awaddr, awlen, awsize, awburst, awvalid, awready,
+        input wdata, wstrb, wlast, wvalid, wready,
+        input bid, bresp, bvalid, bready,
+        input arid, araddr, arlen, arsize, arburst, arvalid, arready,
+        input rid, rdata, rresp, rlast, rvalid, rready
     );
 
 endinterface
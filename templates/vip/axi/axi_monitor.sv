@@ -1,16 +1,30 @@
-
 class axi_monitor #(
     int ADDR_WIDTH = {{ ADDR_WIDTH }},
     int DATA_WIDTH = {{ DATA_WIDTH }}
 ) extends uvm_monitor;
     `uvm_component_param_utils(axi_monitor#(ADDR_WIDTH, DATA_WIDTH))
 
+    typedef axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item_t;
+
     virtual axi_if#(ADDR_WIDTH, DATA_WIDTH) vif;
-    uvm_analysis_port #(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)) item_collected_port;
+    // Completed transactions (writes at B, reads at their last R beat)
+    uvm_analysis_port #(item_t) item_collected_port;
+    // Read requests at AR acceptance, before any data (ID-ordered checking)
+    uvm_analysis_port #(item_t) request_port;
+
+    // Transactions between address phase and completion, in acceptance order
+    item_t       aw_wait_data[$];   // AW seen, W beats not complete yet
+    item_t       wr_wait_resp[$];   // AW + W complete, waiting for B
+    item_t       rd_wait_data[$];   // AR seen, R beats pending
+    int unsigned rx_beats[item_t];
+    // W bursts completed before their AW (allowed by the protocol)
+    bit [DATA_WIDTH-1:0]     w_data_q[$][$];
+    bit [(DATA_WIDTH/8)-1:0] w_strb_q[$][$];
 
     function new(string name, uvm_component parent);
         super.new(name, parent);
         item_collected_port = new("item_collected_port", this);
+        request_port = new("request_port", this);
     endfunction
 
     function void build_phase(uvm_phase phase);
@@ -19,72 +33,143 @@ class axi_monitor #(
             `uvm_fatal("NOVIF", {"Virtual interface must be set for: ", get_full_name(), ".vif"});
     endfunction
 
+    // One thread per channel: with outstanding transactions an AW/AR can be
+    // accepted while earlier responses are still pending. All channels are
+    // sampled on the clock edge where VALID && READY holds, the same edges
+    // the driver uses, so back-to-back beats are not missed.
     task run_phase(uvm_phase phase);
-        // Fork separate monitors for Read and Write channels since they can overlap
         fork
-            monitor_write();
-            monitor_read();
+            monitor_aw();
+            monitor_w();
+            monitor_b();
+            monitor_ar();
+            monitor_r();
         join
     endtask
 
-    task monitor_write();
-        axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item;
-        bit [ADDR_WIDTH-1:0] captured_addr;
-        bit [DATA_WIDTH-1:0] captured_data;
-
+    task monitor_aw();
+        item_t item;
         forever begin
-            item = axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::type_id::create("item");
-            item.kind = axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE;
+            do @(posedge vif.aclk); while (!(vif.awvalid && vif.awready));
+            item = item_t::type_id::create("item");
+            item.kind  = item_t::WRITE;
+            item.id    = vif.awid;
+            item.addr  = vif.awaddr;
+            item.len   = vif.awlen;
+            item.size  = vif.awsize;
+            item.burst = item_t::burst_e'(vif.awburst);
+            aw_wait_data.push_back(item);
+            pair_write_data();
+        end
+    endtask
 
-            // Wait for Write Address Handshake
-            wait(vif.awvalid && vif.awready);
-            captured_addr = vif.awaddr;
-            @(posedge vif.aclk);
+    // Write data beats up to WLAST; bursts are paired with AWs in order
+    task monitor_w();
+        bit [DATA_WIDTH-1:0]     beat_data[$];
+        bit [(DATA_WIDTH/8)-1:0] beat_strb[$];
+        forever begin
+            beat_data.delete();
+            beat_strb.delete();
+            do begin
+                do @(posedge vif.aclk); while (!(vif.wvalid && vif.wready));
+                beat_data.push_back(vif.wdata);
+                beat_strb.push_back(vif.wstrb);
+            end while (!vif.wlast);
+            w_data_q.push_back(beat_data);
+            w_strb_q.push_back(beat_strb);
+            pair_write_data();
+        end
+    endtask
 
-            // Capture Write Data
-            if (!(vif.wvalid && vif.wready)) begin
-                wait(vif.wvalid && vif.wready);
-            end
-            captured_data = vif.wdata;
-            @(posedge vif.aclk);
+    function void pair_write_data();
+        item_t item;
+        while (aw_wait_data.size() > 0 && w_data_q.size() > 0) begin
+            item = aw_wait_data.pop_front();
+            item.data = w_data_q.pop_front();
+            item.strb = w_strb_q.pop_front();
+            if (item.data.size() != item.beats())
+                `uvm_warning("MON", $sformatf("WRITE Addr=0x%0h: %0d data beats, AWLEN announced %0d",
+                                              item.addr, item.data.size(), item.beats()))
+            wr_wait_resp.push_back(item);
+        end
+    endfunction
 
-            // Wait for Response
-            if (!(vif.bvalid && vif.bready)) begin
-                wait(vif.bvalid && vif.bready);
+    task monitor_b();
+        item_t item;
+        forever begin
+            do @(posedge vif.aclk); while (!(vif.bvalid && vif.bready));
+            item = take(wr_wait_resp, vif.bid);
+            if (item == null) begin
+                `uvm_error("MON", $sformatf("B response with ID=%0d has no outstanding write", vif.bid))
+                continue;
             end
-            @(posedge vif.aclk);
+            item.resp = vif.bresp;
 
             // Publish Item
-            item.addr = captured_addr;
-            item.data = captured_data;
             item_collected_port.write(item);
-            $display("[MON] WRITE: Addr=0x%0h Data=0x%0h", item.addr, item.data);
+            $display("[MON] WRITE: ID=%0d Addr=0x%0h Beats=%0d Data[0]=0x%0h", item.id, item.addr, item.data.size(), item.data[0]);
         end
     endtask
 
-    task monitor_read();
-        axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item;
-        
+    task monitor_ar();
+        item_t item;
         forever begin
-            item = axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::type_id::create("item");
-            item.kind = axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::READ;
-
-            // Wait for AR Handshake
-            wait(vif.arvalid && vif.arready);
-            item.addr = vif.araddr;
-            @(posedge vif.aclk);
+            do @(posedge vif.aclk); while (!(vif.arvalid && vif.arready));
+            item = item_t::type_id::create("item");
+            item.kind  = item_t::READ;
+            item.id    = vif.arid;
+            item.addr  = vif.araddr;
+            item.len   = vif.arlen;
+            item.size  = vif.arsize;
+            item.burst = item_t::burst_e'(vif.arburst);
+            item.data  = new[item.beats()];
+            rx_beats[item] = 0;
+            rd_wait_data.push_back(item);
+            request_port.write(item);
+        end
+    endtask
 
-            // Wait for R Handshake
-            if (!(vif.rvalid && vif.rready)) begin
-                wait(vif.rvalid && vif.rready);
+    // R beats: ARLEN + 1 per read (RLAST is not used, AXI4-Lite slaves do not
+    // drive it); beats of different IDs may interleave
+    task monitor_r();
+        item_t item;
+        forever begin
+            do @(posedge vif.aclk); while (!(vif.rvalid && vif.rready));
+            item = null;
+            foreach (rd_wait_data[i]) begin
+                if ($isunknown(vif.rid) || rd_wait_data[i].id == vif.rid) begin
+                    item = rd_wait_data[i];
+                    break;
+                end
             end
-            item.data = vif.rdata;
-            @(posedge vif.aclk);
+            if (item == null) begin
+                `uvm_error("MON", $sformatf("R beat with ID=%0d has no outstanding read", vif.rid))
+                continue;
+            end
+            item.data[rx_beats[item]] = vif.rdata;
+            item.resp = vif.rresp;
+            if (++rx_beats[item] < item.beats()) continue;
+            rx_beats.delete(item);
+            void'(take(rd_wait_data, item.id));
 
             // Publish Item
             item_collected_port.write(item);
-            $display("[MON] READ: Addr=0x%0h Data=0x%0h", item.addr, item.data);
+            $display("[MON] READ: ID=%0d Addr=0x%0h Beats=%0d Data[0]=0x%0h", item.id, item.addr, item.data.size(), item.data[0]);
         end
     endtask
 
+    // Remove and return the oldest transaction with this ID (the oldest of any
+    // ID when the slave does not drive BID/RID)
+    function item_t take(ref item_t q[$], input logic [item_t::ID_WIDTH-1:0] id);
+        item_t item;
+        foreach (q[i]) begin
+            if ($isunknown(id) || q[i].id == id) begin
+                item = q[i];
+                q.delete(i);
+                return item;
+            end
+        end
+        return null;
+    endfunction
+
 endclass
@@ -2,6 +2,23 @@
 // DPI Imports
 import "DPI-C" context function void dpi_mem_write(int addr, int data);
 import "DPI-C" context function int  dpi_mem_read(int addr);
+import "DPI-C" context function void dpi_mem_write_batch(input int addrs[], input int datas[], input int n);
+import "DPI-C" context function void dpi_mem_read_batch(input int addrs[], output int results[], input int n);
+// Byte-strobed writes (WSTRB)
+import "DPI-C" context function void dpi_mem_write_masked(int addr, int data, int strb);
+import "DPI-C" context function void dpi_mem_write_masked_batch(input int addrs[], input int datas[], input int strbs[], input int n);
+// Bursts (INCR/WRAP/FIXED): one model call moves every beat
+import "DPI-C" context function void dpi_mem_write_burst(int addr, int len, int size, int burst,
+                                                         input int datas[], input int strbs[]);
+import "DPI-C" context function void dpi_mem_read_burst(int addr, int len, int size, int burst, output int results[]);
+// Record mode (model.check_mode: record): binary transaction log, no Python call
+import "DPI-C" function void dpi_txn_open(string path, string protocol, int data_width, int addr_width);
+import "DPI-C" function void dpi_txn_record(int kind, longint unsigned addr, longint unsigned data,
+                                            int strb, int size, int resp, int id, longint unsigned timestamp);
+import "DPI-C" function void dpi_txn_close();
+
+// Read requests from the monitor (AR accepted), see write_request()
+`uvm_analysis_imp_decl(_request)
 
 class axi_scoreboard #(
     int ADDR_WIDTH = {{ ADDR_WIDTH }},
@@ -10,32 +27,204 @@ class axi_scoreboard #(
     `uvm_component_param_utils(axi_scoreboard#(ADDR_WIDTH, DATA_WIDTH))
 
     uvm_analysis_imp #(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH), axi_scoreboard#(ADDR_WIDTH, DATA_WIDTH)) item_collected_export;
+    uvm_analysis_imp_request #(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH), axi_scoreboard#(ADDR_WIDTH, DATA_WIDTH)) request_export;
+
+    // DPI Batching (model.dpi_batch_size in config.yaml)
+    // 0 or 1 = call the Python model per transaction,
+    // N > 1  = queue N transactions and flush them with dpi_mem_*_batch
+    localparam int DPI_BATCH_SIZE = {{ dpi_batch_size | default(0) }};
+    axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) pending[$];
+
+    // Record Mode (model.check_mode: record in config.yaml)
+    // Transactions are appended to a binary log instead of calling the
+    // Python model; python -m main.utils.txn_check compares them offline.
+    localparam bit RECORD_MODE = {{ 1 if check_mode == 'record' else 0 }};
+    int unsigned recorded_count;
+
+    // Outstanding Transactions (vip.axi.outstanding in config.yaml)
+    // N > 1: reads of different IDs may complete out of order. The expected
+    // data is taken from the model when the AR is accepted and queued per
+    // ID; AXI returns same-ID reads in order, so a completed read pops the
+    // front of its ID's queue.
+    localparam int OUTSTANDING = {{ vip_options.outstanding | default(1) }};
+    typedef int beats_t[];
+    beats_t expected_q[int][$];
 
     function new(string name, uvm_component parent);
         super.new(name, parent);
         item_collected_export = new("item_collected_export", this);
+        request_export = new("request_export", this);
+    endfunction
+
+    function void write_request(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        beats_t expected;
+
+        if (RECORD_MODE || OUTSTANDING <= 1 || item.kind != axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::READ) return;
+
+        // Writes completed before this AR must be in the model
+        if (pending.size() > 0) flush_pending();
+        expected = new[item.beats()];
+        if (item.len > 0) dpi_mem_read_burst(item.addr, item.len, item.size, item.burst, expected);
+        else expected[0] = dpi_mem_read(item.addr);
+        expected_q[item.id].push_back(expected);
     endfunction
 
     function void write(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
         int expected_data;
 
+        if (RECORD_MODE) begin
+            record(item);
+            return;
+        end
+
+        if (OUTSTANDING > 1 && item.kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::READ) begin
+            check_ordered_read(item);
+            return;
+        end
+
+        // Bursts go to the model in one call, after the single beats queued before them
+        if (item.len > 0) begin
+            if (pending.size() > 0) flush_pending();
+            if (item.kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE) write_burst(item);
+            else read_burst(item);
+            return;
+        end
+
+        if (DPI_BATCH_SIZE > 1) begin
+            pending.push_back(item);
+            if (pending.size() >= DPI_BATCH_SIZE) flush_pending();
+            return;
+        end
+
         if (item.kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE) begin
-            `uvm_info("SCB", $sformatf("WRITE: Addr=0x%0h Data=0x%0h", item.addr, item.data), UVM_MEDIUM)
+            `uvm_info("SCB", $sformatf("WRITE: Addr=0x%0h Data=0x%0h Strb=0x%0h", item.addr, item.data[0], item.strb[0]), UVM_MEDIUM)
             
-            // Update Python Model
-            dpi_mem_write(item.addr, item.data);
+            // Update Python Model (only the lanes enabled by WSTRB)
+            dpi_mem_write_masked(item.addr, item.data[0], item.strb[0]);
             
         end else begin
             // Read from Python Model (Expected)
             expected_data = dpi_mem_read(item.addr);
-            
-            `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h", item.addr, item.data, expected_data), UVM_MEDIUM)
+            compare_read(item, 0, expected_data);
+        end
+    endfunction
+
+    function void write_burst(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        int datas[];
+        int strbs[];
+
+        `uvm_info("SCB", $sformatf("WRITE: Addr=0x%0h Burst=%s Beats=%0d Data[0]=0x%0h",
+                                   item.addr, item.burst.name(), item.beats(), item.data[0]), UVM_MEDIUM)
+        datas = new[item.beats()];
+        strbs = new[item.beats()];
+        foreach (datas[i]) begin
+            datas[i] = item.data[i];
+            strbs[i] = item.strb[i];
+        end
+        dpi_mem_write_burst(item.addr, item.len, item.size, item.burst, datas, strbs);
+    endfunction
+
+    function void read_burst(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        int results[];
+
+        results = new[item.beats()];
+        dpi_mem_read_burst(item.addr, item.len, item.size, item.burst, results);
+        foreach (results[i]) compare_read(item, i, results[i]);
+    endfunction
+
+    function void check_ordered_read(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        beats_t expected;
+
+        if (!expected_q.exists(item.id) || expected_q[item.id].size() == 0) begin
+            `uvm_error("SCB", $sformatf("READ ID=%0d Addr=0x%0h completed without a request", item.id, item.addr))
+            return;
+        end
+        expected = expected_q[item.id].pop_front();
+        foreach (item.data[i]) compare_read(item, i, (i < expected.size()) ? expected[i] : 0);
+    endfunction
+
+    // Compare one read beat against the model's expected value
+    function void compare_read(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item, int unsigned beat, int expected_data);
+        bit [ADDR_WIDTH-1:0] addr = item.beat_addr(beat);
+
+        `uvm_info("SCB", $sformatf("READ: Addr=0x%0h | DUT=0x%0h vs Model=0x%0h", addr, item.data[beat], expected_data), UVM_MEDIUM)
+
+        if (item.data[beat] !== expected_data) begin
+            `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h", addr, item.data[beat], expected_data))
+        end else begin
+            `uvm_info("SCB_MATCH", "Read Data Match!", UVM_MEDIUM)
+        end
+    endfunction
+
+    // Flush queued transactions in program order: each run of consecutive
+    // writes (or reads) becomes a single DPI batch call.
+    function void flush_pending();
+        int addrs[];
+        int datas[];
+        int strbs[];
+        int results[];
+        int first;
+        int last;
+        int n;
+
+        first = 0;
+        while (first < pending.size()) begin
+            last = first;
+            while (last < pending.size() && pending[last].kind == pending[first].kind) last++;
+            n = last - first;
 
-            if (item.data !== expected_data) begin
-                `uvm_error("SCB_MISMATCH", $sformatf("Data Mismatch! Addr=0x%0h DUT=0x%0h Exp=0x%0h", item.addr, item.data, expected_data))
+            addrs = new[n];
+            for (int i = 0; i < n; i++) addrs[i] = pending[first + i].addr;
+
+            if (pending[first].kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE) begin
+                datas = new[n];
+                strbs = new[n];
+                for (int i = 0; i < n; i++) begin
+                    datas[i] = pending[first + i].data[0];
+                    strbs[i] = pending[first + i].strb[0];
+                end
+                dpi_mem_write_masked_batch(addrs, datas, strbs, n);
             end else begin
-                `uvm_info("SCB_MATCH", "Read Data Match!", UVM_MEDIUM)
+                results = new[n];
+                dpi_mem_read_batch(addrs, results, n);
+                for (int i = 0; i < n; i++) compare_read(pending[first + i], 0, results[i]);
             end
+            first = last;
+        end
+        pending.delete();
+    endfunction
+
+    // Record mode: open the log before the first transaction, close it at the end
+    function void start_of_simulation_phase(uvm_phase phase);
+        super.start_of_simulation_phase(phase);
+        if (RECORD_MODE) dpi_txn_open("{{ txn_log }}", "axi", DATA_WIDTH, ADDR_WIDTH);
+    endfunction
+
+    // One record per beat, at the beat address; read records carry the data observed on the bus
+    function void record(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) item);
+        foreach (item.data[i]) begin
+            dpi_txn_record(item.kind == axi_seq_item#(ADDR_WIDTH, DATA_WIDTH)::WRITE ? 0 : 1, item.beat_addr(i), item.data[i],
+                           (i < item.strb.size()) ? item.strb[i] : '1, item.size, item.resp, item.id, $time);
+        end
+        recorded_count += item.data.size();
+    endfunction
+
+    function void final_phase(uvm_phase phase);
+        super.final_phase(phase);
+        if (RECORD_MODE) begin
+            dpi_txn_close();
+            `uvm_info("SCB", $sformatf("Recorded %0d transaction(s) to {{ txn_log }}, check with: python -m main.utils.txn_check",
+                                       recorded_count), UVM_NONE)
+        end
+    endfunction
+
+    // Drain transactions still queued when the run phase ends
+    function void check_phase(uvm_phase phase);
+        super.check_phase(phase);
+        if (pending.size() > 0) flush_pending();
+        foreach (expected_q[id]) begin
+            if (expected_q[id].size() > 0)
+                `uvm_error("SCB", $sformatf("%0d read(s) with ID=%0d never completed", expected_q[id].size(), id))
         end
     endfunction
 
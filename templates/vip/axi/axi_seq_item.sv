@@ -1,4 +1,3 @@
-
 class axi_seq_item #(
     int ADDR_WIDTH = {{ ADDR_WIDTH }},
     int DATA_WIDTH = {{ DATA_WIDTH }}
@@ -8,25 +7,132 @@ class axi_seq_item #(
     typedef enum bit {READ, WRITE} kind_e;
     rand kind_e kind;
 
-    // Address and Data
-    rand bit [ADDR_WIDTH-1:0] addr;
-    rand bit [DATA_WIDTH-1:0] data;
-    rand bit [(DATA_WIDTH/8)-1:0] strb;
+    // Burst Type (AxBURST)
+    typedef enum bit [1:0] {FIXED = 2'b00, INCR = 2'b01, WRAP = 2'b10} burst_e;
+
+    localparam int BUS_BYTES = DATA_WIDTH / 8;
+    localparam int BUS_SIZE  = $clog2(BUS_BYTES);
+    localparam int ID_WIDTH  = {{ vip_options.id_width | default(4) }};  // vip.axi.id_width
+
+    // Transaction ID (AxID): responses with the same ID return in order
+    rand bit [ID_WIDTH-1:0] id;
+
+    // Address and Burst
+    rand bit [ADDR_WIDTH-1:0] addr;  // start address
+    rand bit [7:0]            len;   // AxLEN: beats - 1 (0 = single transfer)
+    rand bit [2:0]            size;  // AxSIZE: bytes per beat = 2**size
+    rand burst_e              burst;
+
+    // One entry per beat (write data / captured read data)
+    rand bit [DATA_WIDTH-1:0]     data[];
+    rand bit [(DATA_WIDTH/8)-1:0] strb[];
 
     // Response
     bit [1:0] resp; // 00: OKAY, 01: EXOKAY, 10: SLVERR, 11: DECERR
 
+    constraint c_beats {
+        data.size() == len + 1;
+        strb.size() == len + 1;
+        // Default: write every lane the beat occupies (all lanes for full-width aligned beats)
+        foreach (strb[i]) soft strb[i] == lanes_of(addr, len, size, burst, i);
+    }
+
+    // A narrow beat (size < BUS_SIZE) must not assert strobes outside its byte lanes
+    constraint c_narrow_strb {
+        foreach (strb[i]) (size < BUS_SIZE) -> (strb[i] & ~lanes_of(addr, len, size, burst, i)) == 0;
+    }
+
+    // AXI4 burst rules
+    constraint c_burst {
+        size <= BUS_SIZE;
+        soft size == BUS_SIZE;
+        soft burst == INCR;
+        soft len == 0;
+        (burst == FIXED) -> len < 16;
+        (burst == WRAP)  -> len inside {1, 3, 7, 15};
+        (burst == WRAP)  -> addr % (1 << size) == 0;
+        // An INCR burst must not cross a 4KB boundary
+        (burst == INCR)  -> (addr % 4096) + ((len + 1) << size) <= 4096;
+    }
+
     `uvm_object_param_utils_begin(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH))
         `uvm_field_enum(kind_e, kind, UVM_ALL_ON)
+        `uvm_field_int(id, UVM_ALL_ON)
         `uvm_field_int(addr, UVM_ALL_ON)
-        `uvm_field_int(data, UVM_ALL_ON)
-        `uvm_field_int(strb, UVM_ALL_ON)
+        `uvm_field_int(len, UVM_ALL_ON)
+        `uvm_field_int(size, UVM_ALL_ON)
+        `uvm_field_enum(burst_e, burst, UVM_ALL_ON)
+        `uvm_field_array_int(data, UVM_ALL_ON)
+        `uvm_field_array_int(strb, UVM_ALL_ON)
         `uvm_field_int(resp, UVM_ALL_ON)
     `uvm_object_utils_end
 
     function new(string name = "axi_seq_item");
         super.new(name);
-        strb = {(DATA_WIDTH/8){1'b1}}; // Default full write
+        // Single full-width INCR beat unless randomized otherwise
+        size  = BUS_SIZE;
+        burst = INCR;
+        data  = new[1];
+        strb  = new[1];
+        strb[0] = {(DATA_WIDTH/8){1'b1}};
+    endfunction
+
+    function int unsigned beats();
+        return len + 1;
+    endfunction
+
+    // Address of beat i (AXI4 spec, A3.4.1); same arithmetic as AXI_Model.burst_addrs
+    function bit [ADDR_WIDTH-1:0] beat_addr(int unsigned i);
+        return addr_of(addr, len, size, burst, i);
+    endfunction
+
+    // The burst fields are arguments (not members) so the constraints above
+    // can call these: the solver picks addr/len/size/burst before the strobes
+    function bit [ADDR_WIDTH-1:0] addr_of(bit [ADDR_WIDTH-1:0] addr, bit [7:0] len, bit [2:0] size,
+                                          burst_e burst, int unsigned i);
+        bit [ADDR_WIDTH-1:0] nbytes = 1 << size;
+        bit [ADDR_WIDTH-1:0] total  = nbytes * (len + 1);
+        bit [ADDR_WIDTH-1:0] lower;
+        case (burst)
+            FIXED: return addr;
+            WRAP: begin
+                lower = addr & ~(total - 1);
+                return lower + ((addr - lower + i * nbytes) % total);
+            end
+            default: return (i == 0) ? addr : (addr & ~(nbytes - 1)) + i * nbytes;
+        endcase
+    endfunction
+
+    // Byte lanes driven by beat i (AXI4 spec, A3.4.3: narrow and unaligned transfers)
+    function bit [(DATA_WIDTH/8)-1:0] lanes_of(bit [ADDR_WIDTH-1:0] addr, bit [7:0] len, bit [2:0] size,
+                                               burst_e burst, int unsigned i);
+        bit [ADDR_WIDTH-1:0] a      = addr_of(addr, len, size, burst, i);
+        bit [ADDR_WIDTH-1:0] nbytes = 1 << size;
+        int unsigned         lo     = a % BUS_BYTES;                                // first byte (unaligned start)
+        int unsigned         hi     = (a & ~(nbytes - 1)) % BUS_BYTES + nbytes - 1; // end of the size-aligned window
+        bit [BUS_BYTES:0]    one    = 1;
+        return ((one << (hi + 1)) - 1) & ~((one << lo) - 1);
+    endfunction
+
+    // Byte range [lo, hi] touched by the burst
+    function void byte_range(output bit [ADDR_WIDTH-1:0] lo, output bit [ADDR_WIDTH-1:0] hi);
+        bit [ADDR_WIDTH-1:0] nbytes = 1 << size;
+        bit [ADDR_WIDTH-1:0] a;
+        lo = '1;
+        hi = '0;
+        for (int unsigned i = 0; i < beats(); i++) begin
+            a = beat_addr(i) & ~(nbytes - 1);
+            if (a < lo) lo = a;
+            if (a + nbytes - 1 > hi) hi = a + nbytes - 1;
+        end
+    endfunction
+
+    // True if both transactions touch a common byte
+    function bit overlaps(axi_seq_item#(ADDR_WIDTH, DATA_WIDTH) other);
+        bit [ADDR_WIDTH-1:0] lo, hi, other_lo, other_hi;
+        byte_range(lo, hi);
+        other.byte_range(other_lo, other_hi);
+        return (lo <= other_hi) && (other_lo <= hi);
     endfunction
 
 endclass
@@ -0,0 +1,43 @@
+"""
+Matrix expansion (--matrix): variant names and sweep-key checks.
+"""
+
+import pytest
+import yaml
+
+from main.utils.batch import expand_matrix
+
+
+def write_matrix(tmp_path, sweep, name=None):
+    matrix = {'base': {'project_name': "dut", 'output_dir': str(tmp_path / "out")}, 'sweep': sweep}
+    if name:
+        matrix['name'] = name
+    path = tmp_path / "matrix.yaml"
+    path.write_text(yaml.safe_dump(matrix))
+    return str(path)
+
+
+def test_variant_names(tmp_path):
+    path = write_matrix(tmp_path, {'dut.parameters.DATA_WIDTH': [32, 64]},
+                        name="{project_name}_dw{DATA_WIDTH}")
+    variants = expand_matrix(path)
+    assert [name for name, _ in variants] == ["dut_dw32", "dut_dw64"]
+    assert variants[1][1]['dut']['parameters']['DATA_WIDTH'] == 64
+    assert variants[1][1]['output_dir'] == str(tmp_path / "out" / "dut_dw64")
+
+
+@pytest.mark.parametrize("name", ["{project_name}_{ADDR_WIDTH}", "{project_name}_{0}"])
+def test_unknown_name_field(tmp_path, capsys, name):
+    path = write_matrix(tmp_path, {'dut.parameters.DATA_WIDTH': [32]}, name=name)
+    with pytest.raises(SystemExit):
+        expand_matrix(path)
+    out = capsys.readouterr().out
+    assert "[Error]" in out
+    assert "{project_name}, {DATA_WIDTH}" in out
+
+
+def test_colliding_sweep_keys(tmp_path, capsys):
+    path = write_matrix(tmp_path, {'dut.parameters.WIDTH': [8], 'vip.apb.WIDTH': [16]})
+    with pytest.raises(SystemExit):
+        expand_matrix(path)
+    assert "'dut.parameters.WIDTH' and 'vip.apb.WIDTH'" in capsys.readouterr().out
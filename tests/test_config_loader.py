@@ -0,0 +1,50 @@
+"""
+Config validation of the AXI burst options (test_plan.constraints.burst).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from main.utils.config_loader import validate_config
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def config(monkeypatch):
+    # Template and DUT paths are resolved from the project root
+    monkeypatch.chdir(REPO_ROOT)
+    return {
+        'project_name': "t",
+        'output_dir': "/tmp/unused",
+        'dut': {'source_files': ["UVM/APB/APB_REG.v"]},
+        'interfaces': [{'name': "s_axi", 'protocol': "axi"}],
+    }
+
+
+def with_burst(config, **burst):
+    config['test_plan'] = {'constraints': {'burst': burst}}
+    return config
+
+
+@pytest.mark.parametrize("burst", [
+    {},
+    {'types': ["WRAP"], 'max_beats': 2},
+    {'types': ["INCR", "WRAP"], 'max_beats': 1},
+    {'types': ["FIXED", "INCR"], 'max_beats': 256},
+])
+def test_accepted(config, burst):
+    validate_config(with_burst(config, **burst))
+
+
+@pytest.mark.parametrize("burst, message", [
+    ({'types': ["WRAP"], 'max_beats': 1}, "WRAP bursts need at least 2 beats"),
+    ({'types': ["WRAP"]}, "WRAP bursts need at least 2 beats"),
+    ({'types': ["INCR"], 'max_beats': 257}, "max_beats must be 1..256"),
+    ({'types': ["SPLIT"]}, "Unsupported burst type 'SPLIT'"),
+])
+def test_rejected(config, capsys, burst, message):
+    with pytest.raises(SystemExit):
+        validate_config(with_burst(config, **burst))
+    assert message in capsys.readouterr().out
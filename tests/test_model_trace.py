@@ -0,0 +1,40 @@
+"""
+Model trace level parsing (model.trace.level / $MODEL_TRACE_LEVEL).
+"""
+
+from pathlib import Path
+
+import pytest
+
+MODEL_DIR = Path(__file__).resolve().parent.parent / "model"
+
+
+@pytest.fixture
+def model_trace(monkeypatch):
+    # The models import their support files as top-level modules
+    monkeypatch.syspath_prepend(str(MODEL_DIR))
+    monkeypatch.delenv("MODEL_TRACE_LEVEL", raising=False)
+    import model_trace
+    return model_trace
+
+
+@pytest.mark.parametrize("value, level", [
+    (0, 0), (2, 2), ("1", 1), ("OFF", 0), ("txn", 1), (" Debug ", 2),
+])
+def test_levels(model_trace, value, level):
+    assert model_trace.parse_level(value) == level
+
+
+@pytest.mark.parametrize("value", ["verbose", "", None, "1.5"])
+def test_unknown_level_warns_and_disables(model_trace, capsys, value):
+    assert model_trace.parse_level(value) == model_trace.TRACE_OFF
+    assert "[Warning] Unknown model trace level" in capsys.readouterr().out
+
+
+def test_env_overrides_config(model_trace, monkeypatch, tmp_path):
+    monkeypatch.setenv("MODEL_TRACE_LEVEL", "TXN")
+    tracer = model_trace.Tracer("APB", level="OFF", path=str(tmp_path / "t.csv"))
+    try:
+        assert tracer.enabled and tracer.level == model_trace.TRACE_TXN
+    finally:
+        tracer.close()
@@ -0,0 +1,167 @@
+"""
+OllamaClient against a local stub server (no Ollama needed).
+
+The stub speaks the /api/generate NDJSON protocol over chunked keep-alive
+connections; each test scripts what it sends back.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from main import ai_planner
+from main.utils.ollama_client import OllamaClient, OllamaError
+
+YAML_TOKENS = ["Here you go:\n```y", "aml\nproject_name: t", "b\n``", "`\n", "Trailing explanation", "..."]
+
+
+def ndjson(tokens, done=True):
+    lines = [json.dumps({"response": t, "done": False}).encode() + b"\n" for t in tokens]
+    if done:
+        lines.append(json.dumps({"response": "", "done": True}).encode() + b"\n")
+    return lines
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server.connections.append(self.client_address)
+        mode = server.mode
+
+        if mode == "http_error":
+            body = b"model not found"
+            self.send_response(500)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for line in server.lines:
+                self._chunk(line)
+            if mode == "truncated":
+                self.wfile.write(b"40\r\n{\"response\": ")  # chunk cut short
+                self.wfile.flush()
+                self.close_connection = True
+                return
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client stopped reading at the closing fence
+        if mode == "drop_idle":
+            # Close the kept-alive connection without telling the client
+            self.close_connection = True
+
+
+@pytest.fixture
+def stub():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.mode = "stream"
+    httpd.lines = ndjson(YAML_TOKENS)
+    httpd.connections = []
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def client_for(httpd):
+    return OllamaClient(host=f"127.0.0.1:{httpd.server_address[1]}", timeout=5)
+
+
+def test_stops_at_closing_fence(stub):
+    client = client_for(stub)
+    text = client.generate("m", "p")
+    assert text.endswith("```\n")
+    assert "Trailing" not in text
+    # Stopped mid-stream: the connection is dropped, not pooled
+    assert client._pool.qsize() == 0
+
+
+def test_reads_whole_stream_without_fence_stop(stub):
+    text = client_for(stub).generate("m", "p", stop_at_fence=False)
+    assert text == "".join(YAML_TOKENS)
+
+
+def test_reuses_connection(stub):
+    stub.lines = ndjson(["no fence here"])
+    client = client_for(stub)
+    assert client.generate("m", "p") == "no fence here"
+    assert client.generate("m", "p") == "no fence here"
+    assert len(stub.connections) == 2
+    assert stub.connections[0] == stub.connections[1]
+
+
+def test_retries_once_on_closed_pooled_connection(stub):
+    stub.mode = "drop_idle"
+    stub.lines = ndjson(["no fence here"])
+    client = client_for(stub)
+    assert client.generate("m", "p") == "no fence here"
+    # The pooled connection is now closed server-side: one retry on a new one
+    assert client.generate("m", "p") == "no fence here"
+    assert len(stub.connections) == 2
+    assert stub.connections[0] != stub.connections[1]
+
+
+def test_unreachable_server_raises_after_retry():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    port = httpd.server_address[1]
+    httpd.server_close()
+    with pytest.raises(OllamaError):
+        OllamaClient(host=f"127.0.0.1:{port}", timeout=5).generate("m", "p")
+
+
+def test_http_error(stub):
+    stub.mode = "http_error"
+    with pytest.raises(OllamaError, match="HTTP 500"):
+        client_for(stub).generate("m", "p")
+
+
+def test_error_event(stub):
+    stub.lines = [json.dumps({"error": "model 'm' not found"}).encode() + b"\n"]
+    with pytest.raises(OllamaError, match="not found"):
+        client_for(stub).generate("m", "p")
+
+
+def test_malformed_ndjson(stub):
+    stub.lines = ndjson(["partial "], done=False) + [b"this is not json\n"]
+    with pytest.raises(OllamaError):
+        client_for(stub).generate("m", "p")
+
+
+def test_truncated_stream(stub):
+    stub.mode = "truncated"
+    stub.lines = ndjson(["partial "], done=False)
+    with pytest.raises(OllamaError):
+        client_for(stub).generate("m", "p")
+
+
+@pytest.mark.parametrize("mode", ["http_error", "malformed"])
+def test_call_ollama_falls_back_to_cli(stub, monkeypatch, mode):
+    if mode == "malformed":
+        stub.lines = [b"{not json\n"]
+    else:
+        stub.mode = mode
+    cli_prompts = []
+    monkeypatch.setattr(ai_planner, "OLLAMA_BACKEND", "http")
+    monkeypatch.setattr(ai_planner, "get_client", lambda: client_for(stub))
+    monkeypatch.setattr(ai_planner, "call_ollama_cli", lambda prompt: cli_prompts.append(prompt) or "from cli")
+    assert ai_planner.call_ollama("prompt") == "from cli"
+    assert cli_prompts == ["prompt"]
@@ -0,0 +1,83 @@
+"""
+Planner cache and per-spec retries under concurrent --spec-dir planning.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from main import ai_planner
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("UVMGEN_CACHE_DIR", str(tmp_path / "cache"))
+    return Path(ai_planner.get_cache_dir("planner"))
+
+
+def test_evict_skips_entries_removed_by_another_thread(cache_dir, monkeypatch):
+    live = cache_dir / "live.yaml"
+    live.write_text("a: 1\n")
+    ghost = cache_dir / "ghost.yaml"  # listed, then evicted elsewhere before stat
+    # live is listed twice: the second unlink finds it already gone
+    monkeypatch.setattr(Path, "glob", lambda self, pattern: iter([live, ghost, live]))
+    monkeypatch.setattr(ai_planner, "PLAN_CACHE_MAX_ENTRIES", 0)
+    ai_planner.evict_plan_cache()
+    assert not live.exists()
+
+
+def test_load_survives_concurrent_eviction(cache_dir, monkeypatch):
+    (cache_dir / "k.yaml").write_text("project_name: t\n")
+
+    def evicted(path, times):
+        raise FileNotFoundError(path)
+    monkeypatch.setattr(ai_planner.os, "utime", evicted)
+    assert ai_planner.load_cached_plan("k") == {'project_name': "t"}
+
+
+def test_plan_one_spec_retries_after_exception(tmp_path, monkeypatch):
+    spec = tmp_path / "dut.txt"
+    spec.write_text("spec")
+    calls = []
+
+    def flaky(user_input, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise ConnectionResetError("dropped")
+        return {'project_name': "t"}
+    monkeypatch.setattr(ai_planner, "generate_test_plan", flaky)
+
+    result = ai_planner.plan_one_spec(spec, tmp_path, retries=2, use_cache=False)
+    assert result['ok'] and result['error'] is None
+    assert result['attempts'] == 2
+    assert (tmp_path / "dut.yaml").exists()
+
+
+def test_plan_one_spec_reports_last_error(tmp_path, monkeypatch):
+    spec = tmp_path / "dut.txt"
+    spec.write_text("spec")
+
+    def broken(user_input, **kwargs):
+        raise ConnectionResetError("dropped")
+    monkeypatch.setattr(ai_planner, "generate_test_plan", broken)
+
+    result = ai_planner.plan_one_spec(spec, tmp_path, retries=1, use_cache=False)
+    assert not result['ok']
+    assert result['attempts'] == 2
+    assert "dropped" in result['error']
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_spec_dir_passes_compact(tmp_path, monkeypatch, compact):
+    spec_dir = tmp_path / "specs"
+    spec_dir.mkdir()
+    (spec_dir / "a.txt").write_text("spec")
+    seen = []
+
+    def plan(user_input, **kwargs):
+        seen.append(kwargs['compact'])
+        return {'project_name': "t"}
+    monkeypatch.setattr(ai_planner, "generate_test_plan", plan)
+
+    assert ai_planner.plan_spec_dir(str(spec_dir), str(tmp_path / "out"), jobs=1, compact=compact)
+    assert seen == [compact]
@@ -0,0 +1,63 @@
+"""
+Phase summary of --profile: template renders are folded into the step
+that queued them, for both the in-process and the pooled (-j > 1) path.
+"""
+
+from main.utils import profiler
+from main.utils.profiler import TraceRecorder
+
+
+def recorder_with(events):
+    recorder = TraceRecorder()
+    for name, cat, start, end, args in events:
+        recorder.complete(name, cat, recorder.origin + start, recorder.origin + end, args)
+    return recorder
+
+
+def summary_rows(recorder, capsys):
+    recorder.print_summary()
+    rows = {}
+    for line in capsys.readouterr().out.splitlines():
+        fields = line.split()
+        if len(fields) == 7 and fields[1] != "Phase":
+            rows[fields[1]] = (float(fields[2]), float(fields[3]))
+    return rows
+
+
+def test_in_process_renders_fold_into_their_step(capsys):
+    recorder = recorder_with([
+        ("generate_tb_env", "phase", 0.000, 0.001, {}),
+        ("render_and_write", "phase", 0.001, 0.012, {}),
+        ("tb/tb_env.sv", "render", 0.001, 0.010, {'phase': "generate_tb_env"}),
+    ])
+    rows = summary_rows(recorder, capsys)
+    assert rows["generate_tb_env"] == (10.0, 9.0)
+    assert rows["render_and_write"] == (2.0, 0.0)
+
+
+def test_pooled_renders_fold_into_their_step(capsys):
+    recorder = recorder_with([
+        ("copy_vip_files", "phase", 0.000, 0.001, {}),
+        ("generate_test", "phase", 0.001, 0.002, {}),
+        ("render_and_write", "phase", 0.002, 0.020, {}),
+        ("render_pool", "pool", 0.002, 0.017, {}),
+        ("vip/apb/apb_pkg.sv", "render", 0.010, 0.016, {'phase': "copy_vip_files", 'worker': True}),
+        ("vip/apb/apb_agent.sv", "render", 0.012, 0.016, {'phase': "copy_vip_files", 'worker': True}),
+        ("tests/base_test.sv", "render", 0.014, 0.016, {'phase': "generate_test", 'worker': True}),
+    ])
+    rows = summary_rows(recorder, capsys)
+    assert rows["copy_vip_files"] == (11.0, 10.0)
+    assert rows["generate_test"] == (3.0, 2.0)
+    assert rows["render_and_write"] == (3.0, 0.0)
+
+
+def test_record_span_is_noop_without_tracing(monkeypatch):
+    monkeypatch.setattr(profiler, "_recorder", None)
+    profiler.record_span("x", 0.5, cat="render")
+    recorder = profiler.enable_tracing()
+    try:
+        profiler.record_span("x", 0.5, cat="render", phase="p")
+        (event,) = recorder.events
+        assert event['dur'] == 500000.0 and event['args'] == {'phase': "p"}
+    finally:
+        monkeypatch.setattr(profiler, "_recorder", None)
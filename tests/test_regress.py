@@ -0,0 +1,58 @@
+"""
+Regression runner against the fake simulator preset (no Vivado needed).
+"""
+
+import json
+import sys
+
+import pytest
+
+from main import regress
+
+FAKE_CMD = regress.SIMULATOR_PRESETS['fake'] + " --iterations 20 --fail-seeds 2 --fatal-seeds 3"
+
+
+@pytest.fixture
+def sim_dir(tmp_path):
+    path = tmp_path / "sim"
+    path.mkdir()
+    return str(path)
+
+
+def by_seed(results):
+    return {r['seed']: r for r in results}
+
+
+def test_status_per_seed(sim_dir, tmp_path):
+    results = by_seed(regress.run_regression(sim_dir, [1, 2, 3], FAKE_CMD, 3, str(tmp_path / "run")))
+    assert results[1]['status'] == "PASS" and results[1]['mismatches'] == 0
+    assert results[2]['status'] == "FAIL" and results[2]['mismatches'] > 0
+    assert results[2]['first_mismatch_addr']
+    assert results[3]['status'] == "FAIL" and results[3]['uvm_fatals'] == 1
+    assert (tmp_path / "run" / "seed_1" / "summary.json").exists()
+
+
+def test_mismatch_budget_aborts_seed(sim_dir, tmp_path):
+    cmd = regress.SIMULATOR_PRESETS['fake'] + " --fail-seeds 2"
+    (result,) = regress.run_regression(sim_dir, [2], cmd, 1, str(tmp_path / "run"), max_mismatches=3)
+    assert result['status'] == "ABORTED"
+    assert result['mismatches'] > 3
+    assert result['abort_reason'].endswith("> budget 3")
+
+
+def test_report_json(sim_dir, tmp_path, monkeypatch, capsys):
+    run_dir = tmp_path / "run"
+    monkeypatch.setattr(sys, "argv", ["regress", "--simulator", "fake", "--sim-dir", sim_dir,
+                                      "--seed-list", "1,2,3", "--jobs", "2", "--out", str(run_dir),
+                                      "--sim-cmd", FAKE_CMD])
+    with pytest.raises(SystemExit) as exit_info:
+        regress.main()
+    assert exit_info.value.code == 1
+
+    report = json.loads((run_dir / "report.json").read_text())
+    assert report['sim_cmd'] == FAKE_CMD
+    assert report['jobs'] == 2
+    assert report['passed'] == 1
+    assert report['failed_seeds'] == [2, 3]
+    assert [(s['seed'], s['status']) for s in report['seeds']] == [(1, "PASS"), (2, "FAIL"), (3, "FAIL")]
+    assert "--seed-list 2,3" in capsys.readouterr().out
@@ -0,0 +1,39 @@
+"""
+Raw-text module header scanning shared by rtl_index (bytes) and
+prompt_compactor (str).
+"""
+
+import pytest
+
+from main.utils import prompt_compactor, rtl_index
+from main.utils.verilog_parser import MODULE_START_RE, MODULE_START_RE_BYTES, find_header_end
+
+RTL = """// module fake(a);  <- comment, not a header
+module regs #(parameter W = 8 /* ; */) (
+    input  wire [W-1:0] d,   // ';' inside (...) does not end the header
+    output reg  [W-1:0] q
+);
+    initial $display("module x(y);");
+endmodule
+"""
+
+
+@pytest.mark.parametrize("text", [RTL, RTL.encode()], ids=["str", "bytes"])
+def test_header_end(text):
+    start_re = MODULE_START_RE if isinstance(text, str) else MODULE_START_RE_BYTES
+    starts = [m.start() for m in start_re.finditer(text)]
+    assert starts == [RTL.index("module regs")]
+    end = RTL.index("\n);") + 3
+    assert find_header_end(text, starts[0]) == end
+    assert find_header_end(text, starts[0], limit=end - 1) == -1
+
+
+def test_scanners_agree(tmp_path):
+    path = tmp_path / "regs.v"
+    path.write_text(RTL)
+    indexed = rtl_index.scan_modules(str(path))
+    assert [p['name'] for p in indexed['regs']['ports']] == ["d", "q"]
+
+    compacted, stats = prompt_compactor.compact_spec("Spec:\n" + RTL + "\nThe end.\n")
+    assert stats['modules'] == 1
+    assert "module regs" in compacted and "$display" not in compacted